@@ -0,0 +1,143 @@
+# Prueba de carga de fisica.servidor: latencia p50/p99 y solicitudes por segundo con cada vez
+# más clientes concurrentes (cada cliente es una conexión keep-alive que envía un problema a la vez).
+#   python benchmarks/carga_servidor.py [--url http://127.0.0.1:8000] [--solicitudes 2000] [--fuerzas 5]
+# Sin --url levanta un servidor local en un puerto libre y lo detiene al terminar.
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from generadores import fuerzas_mixtas  # noqa: E402
+
+from fisica.lotes import CAMPOS_FUERZA  # noqa: E402
+from fisica.servidor import percentil  # noqa: E402
+
+CONCURRENCIAS = (1, 4, 16, 64, 256)
+
+
+def generar_problemas(n, fuerzas_por_problema, semilla=0):
+    rnd = random.Random(semilla)
+    problemas = []
+    for i in range(n):
+        fuerzas = [{c: getattr(f, c) for c in CAMPOS_FUERZA}
+                   for f in fuerzas_mixtas(fuerzas_por_problema, semilla + i)]
+        problemas.append({"fuerzas": fuerzas, "masa": rnd.uniform(1, 100), "aceleracion_deseada": rnd.uniform(0, 3)})
+    return problemas
+
+
+async def _pedir(lector, escritor, host, metodo, ruta, datos=None):
+    cuerpo = b"" if datos is None else json.dumps(datos).encode()
+    escritor.write(f"{metodo} {ruta} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                   f"Content-Length: {len(cuerpo)}\r\n\r\n".encode() + cuerpo)
+    await escritor.drain()
+    estado = int((await lector.readline()).split()[1])
+    largo = 0
+    while True:
+        linea = await lector.readline()
+        if linea in (b"\r\n", b""):
+            break
+        nombre, _, valor = linea.decode("latin-1").partition(":")
+        if nombre.strip().lower() == "content-length":
+            largo = int(valor)
+    return estado, json.loads(await lector.readexactly(largo))
+
+
+async def _cliente(host, puerto, problemas, latencias, estados):
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    try:
+        for problema in problemas:
+            inicio = time.perf_counter()
+            estado, _ = await _pedir(lector, escritor, host, "POST", "/resolver", problema)
+            latencias.append(time.perf_counter() - inicio)
+            estados[estado] = estados.get(estado, 0) + 1
+    finally:
+        escritor.close()
+
+
+async def medir_concurrencia(host, puerto, problemas, concurrencia):
+    latencias, estados = [], {}
+    reparto = [problemas[i::concurrencia] for i in range(concurrencia)]
+    inicio = time.perf_counter()
+    await asyncio.gather(*(_cliente(host, puerto, parte, latencias, estados) for parte in reparto if parte))
+    return latencias, estados, time.perf_counter() - inicio
+
+
+async def metricas(host, puerto):
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    try:
+        return (await _pedir(lector, escritor, host, "GET", "/metricas"))[1]
+    finally:
+        escritor.close()
+
+
+async def _esperar_servidor(host, puerto, segundos=30):
+    limite = time.monotonic() + segundos
+    while True:
+        try:
+            await metricas(host, puerto)
+            return
+        except OSError:
+            if time.monotonic() > limite:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def ejecutar(host, puerto, problemas):
+    await _esperar_servidor(host, puerto)
+    print(f"{'clientes':>9}{'solicitudes/s':>15}{'p50 (ms)':>11}{'p99 (ms)':>11}{'rechazadas':>12}{'lote medio':>12}")
+    for concurrencia in CONCURRENCIAS:
+        antes = await metricas(host, puerto)
+        latencias, estados, segundos = await medir_concurrencia(host, puerto, problemas, concurrencia)
+        despues = await metricas(host, puerto)
+        lotes = despues["lotes"] - antes["lotes"]
+        lote_medio = (despues["problemas"] - antes["problemas"]) / lotes if lotes else 0.0
+        rechazadas = sum(n for estado, n in estados.items() if estado != 200)
+        print(f"{concurrencia:>9}{len(latencias) / segundos:>15.0f}{percentil(latencias, 50) * 1000:>11.2f}"
+              f"{percentil(latencias, 99) * 1000:>11.2f}{rechazadas:>12}{lote_medio:>12.1f}")
+
+
+def _puerto_libre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", help="servidor ya en marcha (default: levanta uno local)")
+    parser.add_argument("--solicitudes", type=int, default=2000, help="solicitudes por nivel de concurrencia")
+    parser.add_argument("--fuerzas", type=int, default=5, help="fuerzas por problema")
+    parser.add_argument("--trabajadores", type=int, help="procesos del servidor local")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    problemas = generar_problemas(args.solicitudes, args.fuerzas, args.semilla)
+    proceso = None
+    if args.url:
+        partes = urlsplit(args.url)
+        host, puerto = partes.hostname, partes.port or 80
+    else:
+        host, puerto = "127.0.0.1", _puerto_libre()
+        comando = [sys.executable, "-m", "fisica.servidor", "--puerto", str(puerto)]
+        if args.trabajadores is not None:
+            comando += ["--trabajadores", str(args.trabajadores)]
+        proceso = subprocess.Popen(comando, cwd=RAIZ)
+    try:
+        asyncio.run(ejecutar(host, puerto, problemas))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
+
+
+if __name__ == "__main__":
+    main()
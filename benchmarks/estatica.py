@@ -0,0 +1,93 @@
+# Estática: resolución por lotes contra un solve denso por estructura.
+#   python benchmarks/estatica.py
+# Armaduras Warren de P paneles (4P - 1 barras) y vigas simplemente apoyadas con una carga.
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from fisica import FuerzaVectorial  # noqa: E402
+from fisica.estatica import SCIPY_OK, Armadura, CuerpoRigido, resolver_armaduras, resolver_cuerpos  # noqa: E402
+
+# (número de estructuras, paneles por armadura)
+CASOS_ARMADURAS = ((1, 250), (1, 2_500), (100, 10), (1_000, 10), (100, 100))
+CUERPOS = (100, 1_000, 10_000)
+MAX_BARRAS_DENSO = 2_000  # por encima, un solve denso tarda segundos y no aporta a la comparación
+
+
+def armadura_warren(paneles, largo=2.0, alto=1.5, carga=10.0):
+    a = Armadura()
+    for i in range(paneles + 1):
+        a.agregar_nudo(f"I{i}", i * largo, 0.0)
+    for i in range(paneles):
+        a.agregar_nudo(f"S{i}", (i + 0.5) * largo, alto)
+    for i in range(paneles):
+        a.agregar_barra(f"I{i}", f"I{i + 1}")
+        a.agregar_barra(f"I{i}", f"S{i}")
+        a.agregar_barra(f"S{i}", f"I{i + 1}")
+        if i:
+            a.agregar_barra(f"S{i - 1}", f"S{i}")
+        a.agregar_carga(f"S{i}", FuerzaVectorial("P", Fx=0.0, Fy=-carga))
+    a.agregar_apoyo("I0", "articulado")
+    a.agregar_apoyo(f"I{paneles}", "rodillo")
+    return a
+
+
+def viga(rnd, largo=10.0):
+    c = CuerpoRigido()
+    c.agregar_fuerza(FuerzaVectorial("P", magnitud=rnd.uniform(10, 100), angulo=rnd.uniform(-150, -30)),
+                     rnd.uniform(0, largo), 0.0)
+    c.agregar_apoyo("A", "articulado", 0.0)
+    c.agregar_apoyo("B", "rodillo", largo)
+    return c
+
+
+def _denso_por_estructura(armaduras):
+    # Referencia ingenua: una matriz densa y un np.linalg.solve por armadura
+    for a in armaduras:
+        filas, columnas, valores, b, _, _ = a.ensamblar()
+        A = np.zeros((len(b), len(b)))
+        np.add.at(A, (filas, columnas), valores)
+        np.linalg.solve(A, b)
+
+
+def _cuerpos_por_separado(cuerpos):
+    for c in cuerpos:
+        _, A, b = c.ensamblar()
+        np.linalg.solve(np.array(A), np.array(b))
+
+
+def _medir(funcion, *args):
+    mejor = float("inf")
+    for _ in range(3):
+        inicio = time.perf_counter()
+        funcion(*args)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor * 1000
+
+
+def main():
+    print(f"SciPy: {'sí' if SCIPY_OK else 'no (solo bloques densos)'}")
+    print(f"{'armaduras':>10}{'barras c/u':>12}{'denso c/u (ms)':>16}{'lote denso (ms)':>17}{'lote disperso (ms)':>20}")
+    for cantidad, paneles in CASOS_ARMADURAS:
+        armaduras = [armadura_warren(paneles) for _ in range(cantidad)]
+        if 4 * paneles - 1 <= MAX_BARRAS_DENSO:
+            ingenuo = f"{_medir(_denso_por_estructura, armaduras):>16.2f}"
+            denso = f"{_medir(resolver_armaduras, armaduras, False):>17.2f}"
+        else:
+            ingenuo, denso = f"{'-':>16}", f"{'-':>17}"
+        disperso = f"{_medir(resolver_armaduras, armaduras, True):>20.2f}" if SCIPY_OK else f"{'-':>20}"
+        print(f"{cantidad:>10}{4 * paneles - 1:>12}{ingenuo}{denso}{disperso}")
+
+    rnd = np.random.default_rng(0)
+    print(f"\n{'cuerpos':>10}{'uno por uno (ms)':>18}{'lote (ms)':>12}")
+    for n in CUERPOS:
+        cuerpos = [viga(rnd) for _ in range(n)]
+        print(f"{n:>10}{_medir(_cuerpos_por_separado, cuerpos):>18.2f}{_medir(resolver_cuerpos, cuerpos):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Generadores con semilla de sistemas de fuerzas y cuerpos para los benchmarks.
+# La misma semilla produce siempre los mismos datos.
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fisica import CuerpoFisico, FuerzaVectorial  # noqa: E402
+
+
+def fuerzas_polares(n, semilla=0):
+    rnd = random.Random(semilla)
+    return [FuerzaVectorial(f"F{i + 1}", magnitud=rnd.uniform(1, 500), angulo=rnd.uniform(0, 360),
+                            altura=rnd.uniform(0, 5)) for i in range(n)]
+
+
+def fuerzas_componentes(n, semilla=0):
+    rnd = random.Random(semilla)
+    return [FuerzaVectorial(f"F{i + 1}", Fx=rnd.uniform(-300, 300), Fy=rnd.uniform(-300, 300),
+                            altura=rnd.uniform(0, 5)) for i in range(n)]
+
+
+def fuerzas_mixtas(n, semilla=0):
+    # Polares o por componentes, con masa, peso, aceleración y distancia opcionales
+    rnd = random.Random(semilla)
+
+    def opcional(probabilidad, minimo, maximo):
+        return rnd.uniform(minimo, maximo) if rnd.random() < probabilidad else None
+
+    fuerzas = []
+    for i in range(n):
+        if rnd.random() < 0.5:
+            datos = {"magnitud": rnd.uniform(1, 500), "angulo": rnd.uniform(0, 360)}
+        else:
+            datos = {"Fx": rnd.uniform(-300, 300), "Fy": rnd.uniform(-300, 300)}
+        masa = opcional(0.4, 0.5, 100)
+        peso = opcional(0.3, 5, 1000) if masa is None else None
+        fuerzas.append(FuerzaVectorial(f"F{i + 1}", altura=rnd.uniform(0, 5), masa=masa, peso=peso,
+                                       aceleracion=opcional(0.1, 0.1, 10), distancia=opcional(0.5, 0.1, 20),
+                                       **datos))
+    return fuerzas
+
+
+def cuerpo_grua(n, semilla=0):
+    rnd = random.Random(semilla)
+    masa = rnd.uniform(10, 2000)
+    cuerpo = CuerpoFisico(masa=masa, tension=masa * 9.81 * rnd.uniform(0.5, 1.5))
+    for f in fuerzas_mixtas(n, semilla):
+        cuerpo.agregar_fuerza(f)
+    return cuerpo
+
+
+def cuerpo_fuerza_faltante(n, semilla=0):
+    rnd = random.Random(semilla)
+    cuerpo = CuerpoFisico(masa=rnd.uniform(1, 500), aceleracion_deseada=rnd.uniform(0.1, 5),
+                          angulo_fuerza_faltante=rnd.uniform(0, 90))
+    for f in fuerzas_mixtas(n, semilla):
+        cuerpo.agregar_fuerza(f)
+    return cuerpo
+
+
+GENERADORES_FUERZAS = {
+    "polares": fuerzas_polares,
+    "componentes": fuerzas_componentes,
+    "mixtas": fuerzas_mixtas,
+}
+GENERADORES_CUERPOS = {
+    "grua": cuerpo_grua,
+    "fuerza_faltante": cuerpo_fuerza_faltante,
+}
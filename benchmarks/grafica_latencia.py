@@ -0,0 +1,54 @@
+# Latencia de graficar_vectores_fig + figura_png (lo que se envía a la página) para 10/100/1000 fuerzas.
+#   python benchmarks/grafica_latencia.py
+# "sin caché" dibuja una figura nueva; "en caché" repite la llamada con los mismos datos;
+# "todas las etiquetas" desactiva el límite MAX_ETIQUETAS.
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+
+from fisica import FuerzaVectorial, calcular_resultante  # noqa: E402
+from fisica.grafica import figura_png, graficar_vectores_fig, limpiar_cache_figuras  # noqa: E402
+
+TAMANOS = (10, 100, 1000)
+
+
+def generar_fuerzas(n, semilla=0):
+    rnd = random.Random(semilla)
+    fuerzas = [FuerzaVectorial(f"F{i + 1}", magnitud=rnd.uniform(1, 100), angulo=rnd.uniform(0, 360),
+                               masa=rnd.choice((None, rnd.uniform(1, 10)))) for i in range(n)]
+    for f in fuerzas:
+        f.completar_datos()
+    return fuerzas
+
+
+def renderizar(fuerzas, resultado, max_etiquetas):
+    magnitud, angulo, (Fx, Fy), _, masa, peso, trabajo, aceleracion = resultado
+    inicio = time.perf_counter()
+    fig = graficar_vectores_fig(fuerzas, Fx, Fy, magnitud, angulo, aceleracion, masa, peso, trabajo,
+                                max_etiquetas=max_etiquetas)
+    figura_png(fig)
+    return (time.perf_counter() - inicio) * 1000
+
+
+def main():
+    print(f"{'fuerzas':>8}{'sin caché (ms)':>16}{'en caché (ms)':>16}{'todas las etiquetas (ms)':>26}")
+    for n in TAMANOS:
+        fuerzas = generar_fuerzas(n)
+        resultado = calcular_resultante(fuerzas)
+        limpiar_cache_figuras()
+        frio = renderizar(fuerzas, resultado, 30)
+        caliente = renderizar(fuerzas, resultado, 30)
+        limpiar_cache_figuras()
+        todas = renderizar(fuerzas, resultado, None)
+        print(f"{n:>8}{frio:>16.1f}{caliente:>16.1f}{todas:>26.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# Tiempo de importación en frío (python -X importtime) del núcleo fisica contra lo que
+# cargaba antes programa.py (streamlit + matplotlib.pyplot).
+#   python benchmarks/importacion.py [--limite-ms 20] [--repeticiones 5]
+# Sale con código 1 si fisica supera el límite o si arrastra dependencias de interfaz.
+import argparse
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASOS = {
+    "fisica": "import fisica",
+    "streamlit + matplotlib.pyplot": "import streamlit, matplotlib.pyplot",
+}
+PROHIBIDOS = ("streamlit", "matplotlib", "numpy")
+
+
+def _tiempo_total(codigo):
+    # Suma del tiempo acumulado (µs) de los módulos de primer nivel importados al ejecutar `codigo`
+    salida = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo],
+                            cwd=RAIZ, capture_output=True, text=True, check=True).stderr
+    total = 0
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:") or "|" not in linea:
+            continue
+        _, acumulado, modulo = linea.split("|")
+        if acumulado.strip().isdigit() and modulo.startswith(" ") and not modulo.startswith("  "):
+            total += int(acumulado)
+    return total
+
+
+def tiempo_importacion(codigo, repeticiones):
+    # Mejor tiempo en ms, descontando lo que importa el arranque del intérprete (site, etc.)
+    arranque = min(_tiempo_total("pass") for _ in range(repeticiones))
+    return max(0, min(_tiempo_total(codigo) for _ in range(repeticiones)) - arranque) / 1000
+
+
+def modulos_cargados(codigo, modulos):
+    verificar = f"{codigo}; import sys; print(' '.join(m for m in {modulos!r} if m in sys.modules))"
+    salida = subprocess.run([sys.executable, "-c", verificar], cwd=RAIZ,
+                            capture_output=True, text=True, check=True).stdout
+    return salida.split()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limite-ms", type=float, default=20.0, help="máximo aceptable para importar fisica")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    tiempos = {}
+    for nombre, codigo in CASOS.items():
+        tiempos[nombre] = tiempo_importacion(codigo, args.repeticiones)
+        print(f"{nombre:<32}{tiempos[nombre]:>10.1f} ms")
+
+    ok = True
+    cargados = modulos_cargados(CASOS["fisica"], PROHIBIDOS)
+    if cargados:
+        print(f"ERROR: importar fisica carga {', '.join(cargados)}")
+        ok = False
+    if tiempos["fisica"] > args.limite_ms:
+        print(f"ERROR: importar fisica tarda {tiempos['fisica']:.1f} ms (límite {args.limite_ms:.1f} ms)")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
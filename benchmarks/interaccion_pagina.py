@@ -0,0 +1,133 @@
+# Tiempo de servidor por interacción de programa.py con streamlit.testing (AppTest), sin navegador.
+#   python benchmarks/interaccion_pagina.py [--fuerzas 200] [--repeticiones 5]
+#
+# AppTest siempre vuelve a ejecutar el script completo, así que "rerun completo" es lo que costaría
+# la interacción sin fragmentos. La página anota en st.session_state["ms_fragmentos"] cuánto tardó
+# cada fragmento; "fragmento" es el tiempo del fragmento que Streamlit volvería a ejecutar por sí
+# solo en un servidor real (vacío si la interacción provoca un rerun completo, "sin rerun" si es un
+# campo dentro de un st.form, que no se envía al servidor hasta pulsar el botón del formulario).
+import argparse
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from generadores import fuerzas_polares  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from fisica import AcumuladorResultante  # noqa: E402
+
+
+def _widget(elementos, etiqueta):
+    for elemento in elementos:
+        if elemento.label == etiqueta:
+            return elemento
+    raise LookupError(f"No se encontró el widget '{etiqueta}'.")
+
+
+# Cada acción devuelve el widget que dispara el rerun
+def _agregar(at):
+    _widget(at.text_input, "Magnitud (N)").set_value("100")
+    _widget(at.text_input, "Ángulo (°)").set_value("30")
+    return _widget(at.button, "Agregar fuerza").click()
+
+
+def _seleccionar(at):
+    # st.dataframe no tiene acción de clic en AppTest; se escribe la selección en su estado
+    clave = f"tabla_{at.session_state['version_lista'] if 'version_lista' in at.session_state else 0}"
+    at.session_state[clave] = {"selection": {"rows": [0], "columns": [], "cells": []}}
+    return None
+
+
+def _eliminar(at):
+    return next(b for b in at.button if b.label.startswith("Eliminar seleccionadas")).click()
+
+
+def _escribir(at):
+    return _widget(at.text_input, "Magnitud (N)").set_value("250")
+
+
+def _ocultar_grafica(at):
+    return _widget(at.checkbox, "Mostrar gráfica del sistema de fuerzas").uncheck()
+
+
+def _mostrar_grafica(at):
+    return _widget(at.checkbox, "Mostrar gráfica del sistema de fuerzas").check()
+
+
+def _sin_rerun(widget):
+    # Campo de un formulario (no su botón de envío): el navegador no avisa al servidor al editarlo
+    return widget is not None and bool(widget.proto.form_id) and not getattr(widget.proto, "is_form_submitter", False)
+
+
+# (nombre, acción, fragmento que la atiende en la página con fragmentos)
+INTERACCIONES = (
+    ("escribir en el formulario", _escribir, None),
+    ("agregar fuerza", _agregar, "fuerzas"),
+    ("seleccionar una fila", _seleccionar, "fuerzas"),
+    ("eliminar seleccionadas", _eliminar, "fuerzas"),
+    ("ocultar gráfica", _ocultar_grafica, "fuerzas"),
+    ("mostrar gráfica", _mostrar_grafica, "fuerzas"),
+)
+
+
+def _nueva_app(n_fuerzas):
+    at = AppTest.from_file(os.path.join(RAIZ, "programa.py"), default_timeout=120)
+    fuerzas = fuerzas_polares(n_fuerzas)
+    for f in fuerzas:
+        f.completar_datos()
+    at.session_state["fuerzas"] = fuerzas
+    at.session_state["acumulador"] = AcumuladorResultante(fuerzas)
+    return at
+
+
+def _ejecutar(at):
+    inicio = time.perf_counter()
+    at.run()
+    segundos = time.perf_counter() - inicio
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return segundos
+
+
+def medir(n_fuerzas, repeticiones):
+    # {interacción: (mejor rerun completo, mejor tiempo del fragmento, 0.0 sin rerun, o None)}
+    # Cada repetición recorre todas las interacciones en orden (agrega una fuerza y elimina otra)
+    at = _nueva_app(n_fuerzas)
+    resultados = {"carga inicial": (_ejecutar(at), None)}
+    for _ in range(repeticiones):
+        for nombre, accion, fragmento in INTERACCIONES:
+            completo, parcial = resultados.get(nombre, (float("inf"), None))
+            widget = accion(at)
+            completo = min(completo, _ejecutar(at))
+            tiempos = at.session_state["ms_fragmentos"] if "ms_fragmentos" in at.session_state else {}
+            if _sin_rerun(widget):
+                parcial = 0.0
+            elif fragmento in tiempos:
+                parcial = min(parcial if parcial is not None else float("inf"), tiempos[fragmento] / 1000)
+            resultados[nombre] = (completo, parcial)
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fuerzas", type=int, default=200, help="fuerzas cargadas antes de empezar")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.fuerzas} fuerzas, mejor de {args.repeticiones}")
+    print(f"{'interacción':<28}{'rerun completo (ms)':>21}{'fragmento (ms)':>16}")
+    for nombre, (completo, parcial) in medir(args.fuerzas, args.repeticiones).items():
+        if parcial is None:
+            texto_parcial = f"{'-':>16}"
+        elif parcial == 0.0:
+            texto_parcial = f"{'sin rerun':>16}"
+        else:
+            texto_parcial = f"{parcial * 1000:>16.1f}"
+        print(f"{nombre:<28}{completo * 1000:>21.1f}{texto_parcial}")
+
+
+if __name__ == "__main__":
+    main()
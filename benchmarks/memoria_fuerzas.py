@@ -0,0 +1,62 @@
+# Memoria, tamaño de pickle y tiempo de pickle.dumps/loads por fuerza: FuerzaVectorial (__slots__)
+# contra el diseño anterior (__dict__ por instancia + lista _mensajes).
+#   python benchmarks/memoria_fuerzas.py [n]
+import os
+import pickle
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fisica import FuerzaVectorial  # noqa: E402
+
+
+class FuerzaConDict:
+    # Copia del diseño anterior: solo importa la forma de guardar los atributos
+    def __init__(self, nombre=None, magnitud=None, angulo=None, Fx=None, Fy=None,
+                 altura=0.0, masa=None, aceleracion=None, peso=None, distancia=None):
+        self.nombre = nombre or "F"
+        self.magnitud = magnitud
+        self.angulo = angulo
+        self.Fx = Fx
+        self.Fy = Fy
+        self.altura = altura
+        self.masa = masa
+        self.aceleracion = aceleracion
+        self.peso = peso
+        self.distancia = distancia
+        self.trabajo = None
+        self._mensajes = []
+
+
+def medir(clase, n):
+    nombres = [f"F{i}" for i in range(n)]
+    valores = [float(i) for i in range(n)]
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    fuerzas = [clase(nombre=nombres[i], magnitud=valores[i], angulo=valores[i], masa=valores[i])
+               for i in range(n)]
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    inicio = time.perf_counter()
+    serializado = pickle.dumps(fuerzas)
+    volcado = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    pickle.loads(serializado)
+    carga = time.perf_counter() - inicio
+    return (despues - antes) / n, len(serializado) / n, volcado * 1000, carga * 1000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{n} fuerzas")
+    print(f"{'diseño':<22}{'bytes/fuerza':>14}{'pickle bytes/fuerza':>22}{'dumps (ms)':>12}{'loads (ms)':>12}")
+    for etiqueta, clase in (("__dict__ (anterior)", FuerzaConDict), ("__slots__ (actual)", FuerzaVectorial)):
+        memoria, serializado, volcado, carga = medir(clase, n)
+        print(f"{etiqueta:<22}{memoria:>14.1f}{serializado:>22.1f}{volcado:>12.0f}{carga:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
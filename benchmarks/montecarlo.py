@@ -0,0 +1,54 @@
+# Tiempo y memoria máxima de fisica.incertidumbre.montecarlo para 10^5..10^7 muestras.
+#   python benchmarks/montecarlo.py [fuerzas] [--max-muestras 10000000]
+# La memoria máxima (tracemalloc, incluye los arreglos de NumPy) debe quedar casi constante al crecer
+# el número de muestras, porque se procesan por bloques.
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generadores import cuerpo_fuerza_faltante  # noqa: E402
+
+from fisica.incertidumbre import montecarlo  # noqa: E402
+
+MUESTRAS = (100_000, 1_000_000, 10_000_000)
+
+
+def cuerpo_incierto(n_fuerzas, semilla=0):
+    # Cuerpo de fuerza faltante con 2 % de σ en cada magnitud dada y ±2° en cada ángulo dado
+    cuerpo = cuerpo_fuerza_faltante(n_fuerzas, semilla)
+    cuerpo.incertidumbres = {"masa": 0.02 * cuerpo.masa}
+    for f in cuerpo.fuerzas_aplicadas:
+        if f.Fx is None:  # dada por magnitud y ángulo
+            f.incertidumbres = {"magnitud": 0.02 * f.magnitud, "angulo": (f.angulo - 2, f.angulo + 2)}
+        else:
+            f.incertidumbres = {"Fx": 0.02 * abs(f.Fx), "Fy": 0.02 * abs(f.Fy)}
+    return cuerpo
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("fuerzas", type=int, nargs="?", default=10)
+    parser.add_argument("--max-muestras", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    cuerpo = cuerpo_incierto(args.fuerzas)
+    print(f"{args.fuerzas} fuerzas con incertidumbre")
+    print(f"{'muestras':>11}{'segundos':>10}{'muestras/s':>13}{'memoria máx. (MB)':>19}")
+    for n in MUESTRAS:
+        if n > args.max_muestras:
+            break
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        montecarlo(cuerpo.fuerzas_aplicadas, n, cuerpo=cuerpo, semilla=0)
+        segundos = time.perf_counter() - inicio
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{n:>11}{segundos:>10.2f}{n / segundos:>13.0f}{pico / 2**20:>19.1f}")
+
+
+if __name__ == "__main__":
+    main()
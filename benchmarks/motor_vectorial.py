@@ -0,0 +1,65 @@
+# calcular_resultante y calcular_dinamica con el motor columnar contra el camino escalar
+# (UMBRAL_VECTORIZADO = inf), con fuerzas nuevas y con fuerzas ya completadas.
+#   python benchmarks/motor_vectorial.py [--semilla 0]
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generadores import cuerpo_fuerza_faltante, fuerzas_mixtas  # noqa: E402
+
+from fisica import calculo  # noqa: E402
+
+TAMANOS = (300, 3_000, 30_000, 100_000)
+
+
+def _cronometrar(preparar, operacion, repeticiones):
+    # Mejor tiempo de `repeticiones`; preparar() no se mide
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        datos = preparar()
+        inicio = time.perf_counter()
+        operacion(datos)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def _completadas(datos):
+    for f in getattr(datos, "fuerzas_aplicadas", datos):
+        f.completar_datos()
+    return datos
+
+
+def casos(semilla):
+    # (nombre, preparar(n), operación)
+    resultante, dinamica = calculo.calcular_resultante, lambda cuerpo: cuerpo.calcular_dinamica()
+    yield "calcular_resultante/nuevas", lambda n: fuerzas_mixtas(n, semilla), resultante
+    yield "calcular_resultante/completadas", lambda n: _completadas(fuerzas_mixtas(n, semilla)), resultante
+    yield "calcular_dinamica/nuevas", lambda n: cuerpo_fuerza_faltante(n, semilla), dinamica
+    yield "calcular_dinamica/completadas", lambda n: _completadas(cuerpo_fuerza_faltante(n, semilla)), dinamica
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    umbral = calculo.UMBRAL_VECTORIZADO
+    print(f"{'caso':<34}{'n':>8}{'escalar (ms)':>14}{'columnar (ms)':>15}{'aceleración':>13}")
+    for nombre, preparar, operacion in casos(args.semilla):
+        for n in TAMANOS:
+            repeticiones = 5 if n <= 10_000 else 2
+            tiempos = []
+            for calculo.UMBRAL_VECTORIZADO in (math.inf, umbral):
+                tiempos.append(_cronometrar(lambda: preparar(n), operacion, repeticiones))
+            escalar, columnar = tiempos
+            print(f"{nombre:<34}{n:>8}{escalar * 1000:>14.2f}{columnar * 1000:>15.2f}{escalar / columnar:>12.2f}x",
+                  flush=True)
+    calculo.UMBRAL_VECTORIZADO = umbral
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Escalamiento de calcular_dinamica_paralelo contra el cálculo en serie.
+#   python benchmarks/paralelo_dinamica.py [fuerzas_por_cuerpo]
+# Para cada número de cuerpos muestra la aceleración con 1/2/4/8 procesos y el punto de
+# cruce: el menor tamaño en el que algún pool ya es más rápido que la serie.
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fisica.paralelo import calcular_dinamica_paralelo, desempaquetar_cuerpo  # noqa: E402
+
+TAMANOS = (100, 1_000, 10_000, 100_000)
+TRABAJADORES = (1, 2, 4, 8)
+
+
+def generar_paquetes(n, fuerzas_por_cuerpo, semilla=0):
+    rnd = random.Random(semilla)
+    paquetes = []
+    for _ in range(n):
+        fuerzas = tuple((rnd.uniform(1, 100), rnd.uniform(0, 360), None, None, rnd.uniform(0, 5),
+                         None, None, None, rnd.uniform(0, 10)) for _ in range(fuerzas_por_cuerpo))
+        paquetes.append((rnd.uniform(1, 100), None, rnd.uniform(0, 3), None, rnd.choice((None, 30.0)), fuerzas))
+    return paquetes
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def main():
+    fuerzas_por_cuerpo = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{os.cpu_count()} CPUs, {fuerzas_por_cuerpo} fuerzas por cuerpo")
+    print(f"{'cuerpos':>9}{'serie (s)':>11}" + "".join(f"{f'x{t}':>8}" for t in TRABAJADORES))
+    cruce = None
+    for n in TAMANOS:
+        paquetes = generar_paquetes(n, fuerzas_por_cuerpo)
+        serie = cronometrar(lambda: [desempaquetar_cuerpo(p).calcular_dinamica() for p in paquetes])
+        fila = f"{n:>9}{serie:>11.3f}"
+        for t in TRABAJADORES:
+            fragmento = max(1, n // (4 * t))
+            paralelo = cronometrar(lambda: list(calcular_dinamica_paralelo(paquetes, t, fragmento)))
+            fila += f"{serie / paralelo:>8.2f}"
+            if t > 1 and paralelo < serie and cruce is None:
+                cruce = n
+        print(fila)
+    print(f"Punto de cruce: {cruce if cruce is not None else f'> {TAMANOS[-1]}'} cuerpos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# Rendimiento de Simulacion en cuerpos·paso por segundo para cada integrador.
+#   python benchmarks/simulacion.py [pasos]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from fisica.simulacion import INTEGRADORES, Simulacion  # noqa: E402
+
+CUERPOS = (1, 1_000, 100_000)
+
+
+def main():
+    pasos = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rnd = np.random.default_rng(0)
+    print(f"{pasos} pasos; fuerza F(t) = F0·cos(t) - 0.1·v")
+    print(f"{'cuerpos':>9}" + "".join(f"{i:>16}" for i in INTEGRADORES))
+    for n in CUERPOS:
+        masas = rnd.uniform(1, 100, n)
+        f0 = rnd.uniform(-50, 50, (n, 2))
+
+        def fuerza(t, posiciones, velocidades):
+            return f0 * np.cos(t) - 0.1 * velocidades
+
+        fila = f"{n:>9}"
+        for integrador in INTEGRADORES:
+            sim = Simulacion(masas, fuerza=fuerza, integrador=integrador)
+            inicio = time.perf_counter()
+            for _ in sim.trayectoria(0.01, pasos, cada=pasos):
+                pass
+            segundos = time.perf_counter() - inicio
+            fila += f"{n * pasos / segundos:>16.3g}"
+        print(fila)
+    print("(cuerpos·paso/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# Suite de benchmarks reproducible. Escribe los tiempos en JSON y, si se da una línea base,
+# marca como regresión todo caso que sea más lento que la base por encima del umbral.
+#   python benchmarks/suite.py --salida actual.json [--base base.json] [--umbral 0.2]
+#                              [--max-tamano 100000] [--semilla 0]
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generadores import GENERADORES_CUERPOS, GENERADORES_FUERZAS, fuerzas_mixtas  # noqa: E402
+
+from fisica import calcular_resultante  # noqa: E402
+from fisica.archivos import escribir_fuerzas, leer_fuerzas  # noqa: E402
+from fisica.grafica import MATPLOTLIB_OK, graficar_vectores_fig, limpiar_cache_figuras  # noqa: E402
+
+TAMANOS = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+MAX_TAMANO_GRAFICA = 10_000  # dibujar más vectores no es un caso realista
+
+
+def _cronometrar(preparar, operacion, repeticiones):
+    # Mejor tiempo de `repeticiones`; preparar() no se mide y arma una entrada nueva cada vez
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        datos = preparar()
+        inicio = time.perf_counter()
+        operacion(datos)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def _completar_todas(fuerzas):
+    for f in fuerzas:
+        f.completar_datos()
+
+
+def _graficar(fuerzas):
+    magnitud, angulo, (Fx, Fy), _, masa, peso, trabajo, aceleracion = calcular_resultante(fuerzas)
+    limpiar_cache_figuras()
+    graficar_vectores_fig(fuerzas, Fx, Fy, magnitud, angulo, aceleracion, masa, peso, trabajo)
+
+
+def casos(semilla):
+    # (nombre, preparar(n), operación, tamaño máximo)
+    for nombre, generador in GENERADORES_FUERZAS.items():
+        yield (f"completar_datos/{nombre}", lambda n, g=generador: g(n, semilla), _completar_todas, None)
+        yield (f"calcular_resultante/{nombre}", lambda n, g=generador: g(n, semilla), calcular_resultante, None)
+    for nombre, generador in GENERADORES_CUERPOS.items():
+        yield (f"calcular_dinamica/{nombre}", lambda n, g=generador: g(n, semilla),
+               lambda cuerpo: cuerpo.calcular_dinamica(), None)
+    for formato in ("csv", "npy"):
+        yield (f"leer_fuerzas/{formato}", lambda n, f=formato: _archivo(fuerzas_mixtas(n, semilla), f),
+               leer_fuerzas, None)
+    if MATPLOTLIB_OK:
+        yield ("graficar_vectores_fig/mixtas", lambda n: _completadas(fuerzas_mixtas(n, semilla)),
+               _graficar, MAX_TAMANO_GRAFICA)
+
+
+def _completadas(fuerzas):
+    _completar_todas(fuerzas)
+    return fuerzas
+
+
+def _archivo(fuerzas, formato):
+    # Lista exportada a un archivo temporal; leer_fuerzas recibe la ruta (el .npy se abre con memory-map)
+    ruta = os.path.join(tempfile.gettempdir(), f"benchmark_fuerzas.{formato}")
+    with open(ruta, "wb") as archivo:
+        archivo.write(escribir_fuerzas(fuerzas, formato))
+    return ruta
+
+
+def ejecutar(max_tamano, semilla):
+    resultados = {}
+    for nombre, preparar, operacion, tope in casos(semilla):
+        for n in TAMANOS:
+            if n > max_tamano or (tope is not None and n > tope):
+                break
+            repeticiones = 5 if n <= 10_000 else 2
+            segundos = _cronometrar(lambda: preparar(n), operacion, repeticiones)
+            resultados[f"{nombre}/{n}"] = segundos
+            print(f"{nombre + '/' + str(n):<48}{segundos * 1000:>12.3f} ms", flush=True)
+    return resultados
+
+
+def comparar(resultados, base, umbral):
+    regresiones = []
+    print(f"\n{'caso':<48}{'base (ms)':>12}{'actual (ms)':>13}{'cambio':>9}")
+    for caso, segundos in resultados.items():
+        anterior = base.get(caso)
+        if anterior is None:
+            continue
+        cambio = segundos / anterior - 1
+        marca = "  REGRESIÓN" if cambio > umbral else ""
+        print(f"{caso:<48}{anterior * 1000:>12.3f}{segundos * 1000:>13.3f}{cambio:>+9.1%}{marca}")
+        if marca:
+            regresiones.append(caso)
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--salida", default="benchmarks.json", help="archivo JSON con los resultados")
+    parser.add_argument("--base", help="JSON de una ejecución anterior para comparar")
+    parser.add_argument("--umbral", type=float, default=0.2, help="regresión permitida (0.2 = 20%%)")
+    parser.add_argument("--max-tamano", type=int, default=100_000, help="tamaño máximo (hasta 1000000)")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    resultados = ejecutar(args.max_tamano, args.semilla)
+    documento = {
+        "meta": {
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "semilla": args.semilla,
+            "max_tamano": args.max_tamano,
+        },
+        "resultados": resultados,
+    }
+    with open(args.salida, "w", encoding="utf-8") as archivo:
+        json.dump(documento, archivo, indent=2)
+    print(f"\nResultados guardados en {args.salida}")
+
+    if args.base:
+        with open(args.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)["resultados"]
+        regresiones = comparar(resultados, base, args.umbral)
+        if regresiones:
+            print(f"\n{len(regresiones)} caso(s) más lentos que la base por encima de {args.umbral:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+# Núcleo de cálculo de la calculadora, sin dependencias de interfaz
+from .acumulador import AcumuladorResultante, SumaCompensada
+from .calculo import CuerpoFisico, calcular_resultante
+from .fuerzas import ESTADISTICAS_COMPLETAR, MENSAJES_FALTANTES, FuerzaVectorial, g, usar_estadisticas_completar
+from .grafica import graficar_vectores_fig
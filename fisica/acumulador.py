@@ -0,0 +1,112 @@
+import math
+
+from .calculo import calcular_resultante
+from .rendimiento import medir
+
+# ---------------- ACUMULADOR INCREMENTAL ----------------
+class SumaCompensada:
+    # Suma de Neumaier: el error no crece con el número de altas y bajas
+    __slots__ = ("suma", "compensacion")
+
+    def __init__(self):
+        self.suma = 0.0
+        self.compensacion = 0.0
+
+    def agregar(self, x):
+        t = self.suma + x
+        if abs(self.suma) >= abs(x):
+            self.compensacion += (self.suma - t) + x
+        else:
+            self.compensacion += (x - t) + self.suma
+        self.suma = t
+
+    @property
+    def valor(self):
+        return self.suma + self.compensacion
+
+
+class AcumuladorResultante:
+    # Mantiene las sumas del sistema para que agregar o eliminar una fuerza sea O(1).
+    # Las fuerzas deben estar completas (completar_datos) y no cambiar mientras estén acumuladas.
+    def __init__(self, fuerzas=()):
+        self.limpiar()
+        for f in fuerzas:
+            self.agregar(f)
+
+    def limpiar(self):
+        self.n = 0
+        self.con_fx = 0
+        self.con_fy = 0
+        self.sumas = {c: SumaCompensada() for c in ("Fx", "Fy", "momento", "masa", "peso", "trabajo")}
+
+    def _aplicar(self, f, signo):
+        aportes = {
+            "Fx": f.Fx or 0.0,
+            "Fy": f.Fy or 0.0,
+            "momento": f.momento(),
+            "masa": f.masa or 0.0,
+            "peso": f.peso or 0.0,
+            "trabajo": f.trabajo or 0.0,
+        }
+        for campo, valor in aportes.items():
+            self.sumas[campo].agregar(signo * valor)
+        self.n += signo
+        self.con_fx += signo * (f.Fx is not None)
+        self.con_fy += signo * (f.Fy is not None)
+
+    def agregar(self, f):
+        self._aplicar(f, 1)
+
+    def agregar_sistema(self, sistema):
+        # Alta masiva desde un SistemaFuerzas completado: una suma por columna en lugar de una por fuerza
+        import numpy as np
+        for campo, valor in zip(("Fx", "Fy", "momento", "masa", "peso", "trabajo"), sistema.totales()):
+            self.sumas[campo].agregar(valor)
+        self.n += sistema.n
+        self.con_fx += int(np.count_nonzero(~np.isnan(sistema.Fx)))
+        self.con_fy += int(np.count_nonzero(~np.isnan(sistema.Fy)))
+
+    def quitar_sistema(self, sistema):
+        # Baja masiva, inversa de agregar_sistema
+        import numpy as np
+        for campo, valor in zip(("Fx", "Fy", "momento", "masa", "peso", "trabajo"), sistema.totales()):
+            self.sumas[campo].agregar(-valor)
+        self.n -= sistema.n
+        self.con_fx -= int(np.count_nonzero(~np.isnan(sistema.Fx)))
+        self.con_fy -= int(np.count_nonzero(~np.isnan(sistema.Fy)))
+        if self.n == 0:
+            self.limpiar()
+
+    def quitar(self, f):
+        self._aplicar(f, -1)
+        if self.n == 0:
+            self.limpiar()  # descarta el residuo de redondeo
+
+    @medir("AcumuladorResultante.resultante")
+    def resultante(self):
+        # Devuelve la misma tupla que calcular_resultante
+        if not self.con_fx and not self.con_fy:
+            return None, None, (None, None), None, 0.0, 0.0, 0.0, None
+
+        suma_fx = self.sumas["Fx"].valor
+        suma_fy = self.sumas["Fy"].valor
+        magnitud = math.sqrt(suma_fx**2 + suma_fy**2)
+        angulo = math.degrees(math.atan2(suma_fy, suma_fx)) if magnitud != 0 else 0.0
+        masa_total = self.sumas["masa"].valor
+
+        aceleracion_res = None
+        if masa_total > 0:
+            aceleracion_res = magnitud / masa_total
+
+        return (magnitud, angulo, (suma_fx, suma_fy), self.sumas["momento"].valor, masa_total,
+                self.sumas["peso"].valor, self.sumas["trabajo"].valor, aceleracion_res)
+
+    def verificar(self, fuerzas, tolerancia=1e-9):
+        # Depuración: compara contra un cálculo completo con calcular_resultante
+        def aplanar(r):
+            return [r[0], r[1], *r[2], *r[3:]]
+
+        for nombre, a, b in zip(("magnitud", "angulo", "Fx", "Fy", "momento", "masa", "peso", "trabajo", "aceleracion"),
+                                aplanar(self.resultante()), aplanar(calcular_resultante(fuerzas))):
+            if (a is None) != (b is None) or (a is not None and not math.isclose(a, b, rel_tol=tolerancia, abs_tol=tolerancia)):
+                raise AssertionError(f"Acumulador desincronizado en '{nombre}': {a} != {b}")
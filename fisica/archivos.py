@@ -0,0 +1,125 @@
+# Importación y exportación de listas de fuerzas en CSV, JSON y un formato binario por columnas
+# (.npy con un arreglo estructurado, que se puede abrir con memory-map). La lectura produce un
+# SistemaFuerzas sin crear un objeto por fila; las celdas inválidas se reportan por fila y columna.
+import io
+import json
+import os
+
+import numpy as np
+
+from .rendimiento import medir
+from .vectorial import COLUMNAS, SistemaFuerzas
+
+# Datos de entrada que se leen de un archivo; trabajo se exporta pero se recalcula al importar
+COLUMNAS_ENTRADA = tuple(c for c in COLUMNAS if c != "trabajo")
+FORMATOS = ("csv", "json", "npy")
+MAX_ERRORES = 100  # más celdas inválidas que esto solo se cuentan
+
+
+def _formato(origen, formato):
+    if formato is None:
+        nombre = origen if isinstance(origen, (str, os.PathLike)) else getattr(origen, "name", "")
+        formato = os.path.splitext(str(nombre))[1].lstrip(".").lower()
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: '{formato}' (usa {', '.join(FORMATOS)}).")
+    return formato
+
+
+def _pandas():
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise RuntimeError("Para leer CSV o JSON instala pandas.") from e
+    return pd
+
+
+# ---------------- LECTURA ----------------
+def _desde_tabla(tabla):
+    # tabla: DataFrame tal como se leyó del archivo. Convierte cada columna de una vez y junta los
+    # mensajes de las celdas que no son números (las vacías cuentan como dato faltante).
+    pd = _pandas()
+    n = len(tabla)
+    columnas, errores, total_errores = {}, [], 0
+    for c in COLUMNAS_ENTRADA:
+        if c not in tabla:
+            continue
+        crudo = tabla[c]
+        valores = pd.to_numeric(crudo, errors="coerce").to_numpy(dtype=float)
+        if crudo.dtype == object:
+            # Solo las columnas con texto pueden tener celdas inválidas; vacías o nulas son faltantes
+            vacio = (crudo.isna() | (crudo.astype(str).str.strip() == "")).to_numpy()
+            invalidas = np.flatnonzero(np.isnan(valores) & ~vacio)
+            total_errores += invalidas.size
+            for i in invalidas[:max(0, MAX_ERRORES - len(errores))]:
+                errores.append(f"Fila {i + 1}, columna '{c}': '{crudo.iloc[i]}' no es un número.")
+        columnas[c] = valores
+
+    if total_errores > len(errores):
+        errores.append(f"... y {total_errores - len(errores)} celdas inválidas más.")
+    nombres = None
+    if "nombre" in tabla:
+        nombres = tabla["nombre"].fillna("").astype(str).str.strip().to_numpy()
+        nombres = np.where(nombres == "", np.char.add("F", np.arange(1, n + 1).astype(str)), nombres)
+    return SistemaFuerzas(n, nombres=nombres, **columnas), errores
+
+
+def _leer_npy(origen):
+    if isinstance(origen, (str, os.PathLike)):
+        datos = np.load(origen, mmap_mode="r", allow_pickle=False)
+    else:
+        datos = np.load(io.BytesIO(origen.read()), allow_pickle=False)
+    if datos.dtype.names is None:
+        raise ValueError("El archivo .npy debe contener un arreglo estructurado con una columna por dato.")
+    columnas = {c: datos[c] for c in COLUMNAS_ENTRADA if c in datos.dtype.names}
+    nombres = datos["nombre"] if "nombre" in datos.dtype.names else None
+    return SistemaFuerzas(datos.shape[0], nombres=nombres, **columnas), []
+
+
+@medir("leer_fuerzas")
+def leer_fuerzas(origen, formato=None):
+    # origen: ruta o archivo abierto en binario (por ejemplo, lo que devuelve st.file_uploader).
+    # Devuelve (SistemaFuerzas completado, lista de mensajes de celdas inválidas).
+    formato = _formato(origen, formato)
+    if formato == "npy":
+        sistema, errores = _leer_npy(origen)
+    elif formato == "csv":
+        pd = _pandas()
+        sistema, errores = _desde_tabla(pd.read_csv(origen, dtype={"nombre": str}))
+    else:
+        pd = _pandas()
+        if isinstance(origen, (str, os.PathLike)):
+            with open(origen, encoding="utf-8") as archivo:
+                filas = json.load(archivo)
+        else:
+            filas = json.load(origen)
+        if not isinstance(filas, list):
+            raise ValueError("El JSON debe ser una lista de fuerzas.")
+        sistema, errores = _desde_tabla(pd.DataFrame.from_records(filas))
+    return sistema.completar(), errores
+
+
+# ---------------- ESCRITURA ----------------
+def escribir_fuerzas(fuerzas, formato):
+    # fuerzas: lista de FuerzaVectorial o SistemaFuerzas. Devuelve los bytes del archivo.
+    formato = _formato(None, formato)
+    sistema = fuerzas if isinstance(fuerzas, SistemaFuerzas) else SistemaFuerzas.desde_fuerzas(fuerzas)
+
+    if formato == "npy":
+        # El campo del nombre mide lo que el nombre más largo, así no se recorta ninguno
+        largo = max(1, int(np.char.str_len(sistema.nombres).max(initial=0)))
+        datos = np.empty(sistema.n, dtype=[("nombre", f"U{largo}")] + [(c, "f8") for c in COLUMNAS])
+        datos["nombre"] = sistema.nombres
+        for c in COLUMNAS:
+            datos[c] = getattr(sistema, c)
+        salida = io.BytesIO()
+        np.save(salida, datos, allow_pickle=False)
+        return salida.getvalue()
+
+    if formato == "csv":
+        pd = _pandas()
+        tabla = pd.DataFrame({"nombre": sistema.nombres, **{c: getattr(sistema, c) for c in COLUMNAS}})
+        return tabla.to_csv(index=False).encode("utf-8")
+    # JSON con la misma precisión que los float (to_json de pandas redondea a 10 cifras)
+    valores = [np.where(np.isnan(getattr(sistema, c)), None, getattr(sistema, c)).tolist() for c in COLUMNAS]
+    filas = [dict(zip(("nombre",) + COLUMNAS, fila)) for fila in zip(sistema.nombres.tolist(), *valores)]
+    return json.dumps(filas, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,102 @@
+# Barrido de la fuerza faltante (caso 3 de CuerpoFisico.calcular_dinamica) sobre una malla de
+# ángulos × aceleraciones deseadas × masas, evaluada con NumPy en una sola pasada.
+import numpy as np
+
+from .calculo import calcular_resultante
+from .rendimiento import medir
+
+TOLERANCIA_ANGULO = 1e-6  # la misma que usa calcular_dinamica para comparar Mx y My
+
+
+def rango(inicio, fin=None, paso=None):
+    # Valores de inicio a fin (incluido) con el paso dado; sin fin o sin paso es un solo valor
+    if fin is None or paso is None or fin == inicio:
+        return np.array([float(inicio)])
+    if paso <= 0 or fin < inicio:
+        raise ValueError("El rango necesita fin >= inicio y paso > 0.")
+    return inicio + paso * np.arange(int(np.floor((fin - inicio) / paso + 1e-9)) + 1)
+
+
+def magnitud_con_angulo(Fx_req, Fy_req, angulos):
+    # Magnitud de la fuerza faltante con dirección fija, elemento a elemento y con las mismas reglas que
+    # calcular_dinamica. Devuelve (magnitud, inconsistencia); los argumentos se combinan por broadcasting.
+    rad = np.radians(angulos)
+    cos_a, sin_a = np.cos(rad), np.sin(rad)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Mx = np.where(cos_a != 0, Fx_req / cos_a, np.nan)
+        My = np.where(sin_a != 0, Fy_req / sin_a, np.nan)
+    hay_mx, hay_my = ~np.isnan(Mx), ~np.isnan(My)
+
+    ambos = hay_mx & hay_my
+    inconsistencia = ambos & ~(np.abs(Mx - My) <= TOLERANCIA_ANGULO)
+    magnitud = np.where(hay_my & ~hay_mx, My, 0.0)
+    magnitud = np.where(hay_mx, Mx, magnitud)
+    magnitud = np.where(inconsistencia, Fx_req * cos_a + Fy_req * sin_a, magnitud)
+    return magnitud, inconsistencia
+
+
+@medir("barrer_fuerza_faltante")
+def barrer_fuerza_faltante(fuerzas, angulos, aceleraciones, masas, tolerancia_angulo=None):
+    # Devuelve un dict con:
+    #   "magnitud", "inconsistencia", "desviacion" y "factible": arreglos (masas, aceleraciones, ángulos)
+    #   "tolerancia_angulo": la usada, en grados
+    #   "optimo": punto factible de menor fuerza faltante (None si ningún ángulo es factible)
+    # Un punto es factible si una fuerza no negativa en ese ángulo da el vector requerido, exactamente o
+    # con una dirección a lo más tolerancia_angulo grados de la requerida (por defecto medio paso de la
+    # malla de ángulos, así que el ángulo de la malla más cercano a cualquier dirección cubierta cuenta).
+    # No basta con que no haya inconsistencia: en 0° calcular_dinamica usa solo Fx_req (sin 0° = 0)
+    # aunque Fy_req no sea cero, y la proyección de los puntos inconsistentes tiende a 0 cerca del
+    # ángulo perpendicular, así que el mínimo sin este filtro no tiene sentido.
+    angulos = np.atleast_1d(np.asarray(angulos, dtype=float))
+    aceleraciones = np.atleast_1d(np.asarray(aceleraciones, dtype=float))
+    masas = np.atleast_1d(np.asarray(masas, dtype=float))
+    if np.any(~(masas > 0)):
+        raise ValueError("Las masas del barrido deben ser mayores que cero.")
+    if tolerancia_angulo is None:
+        distintos = np.unique(angulos)
+        tolerancia_angulo = 0.5 * float(np.diff(distintos).min()) if distintos.size > 1 else 0.0
+    if not 0 <= tolerancia_angulo < 90:
+        raise ValueError("La tolerancia del ángulo debe estar entre 0° y 90°.")
+
+    _, _, (suma_fx, suma_fy), *_ = calcular_resultante(list(fuerzas))
+    suma_fx = suma_fx or 0.0
+    suma_fy = suma_fy or 0.0
+
+    Fx_req = masas[:, None, None] * aceleraciones[None, :, None] - suma_fx
+    Fy_req = np.full_like(Fx_req, -suma_fy)
+    requerida = np.hypot(Fx_req, Fy_req)
+    rad = np.radians(angulos[None, None, :])
+    magnitud, inconsistencia = magnitud_con_angulo(Fx_req, Fy_req, angulos[None, None, :])
+    residuo = np.hypot(magnitud * np.cos(rad) - Fx_req, magnitud * np.sin(rad) - Fy_req)
+    exacto = ~inconsistencia & (magnitud >= 0) & (residuo <= TOLERANCIA_ANGULO * np.maximum(1.0, requerida))
+    # Grados entre cada ángulo de la malla y la dirección requerida (0 donde no se requiere fuerza)
+    direccion = np.degrees(np.arctan2(Fy_req, Fx_req))
+    desviacion = np.where(requerida > 0, np.abs((angulos[None, None, :] - direccion + 180.0) % 360.0 - 180.0), 0.0)
+    desviacion = np.where(exacto, 0.0, desviacion)
+    factible = exacto | ((requerida > 0) & (desviacion <= tolerancia_angulo + TOLERANCIA_ANGULO))
+
+    # Óptimo: la menor fuerza requerida y, entre los ángulos factibles para ella, el más cercano
+    optimo = None
+    if factible.any():
+        orden = np.lexsort((np.where(factible, desviacion, np.inf).ravel(),
+                            np.where(factible, requerida, np.inf).ravel()))
+        im, ia, it = np.unravel_index(orden[0], magnitud.shape)
+        optimo = {
+            "masa": float(masas[im]),
+            "aceleracion": float(aceleraciones[ia]),
+            "angulo": float(angulos[it]),
+            "magnitud": float(magnitud[im, ia, it]),
+            "desviacion": float(desviacion[im, ia, it]),
+        }
+
+    return {
+        "angulos": angulos,
+        "aceleraciones": aceleraciones,
+        "masas": masas,
+        "magnitud": magnitud,
+        "inconsistencia": inconsistencia,
+        "desviacion": desviacion,
+        "factible": factible,
+        "tolerancia_angulo": tolerancia_angulo,
+        "optimo": optimo,
+    }
@@ -0,0 +1,178 @@
+# Caché de resultados por contenido: misma lista de fuerzas (en cualquier orden) y mismos datos
+# del cuerpo -> mismo resultado. Dos niveles: LRU en memoria y, opcionalmente, SQLite en disco.
+# Si todas las fuerzas ya están completas, sumarlas cuesta menos que calcular la clave y no se
+# consulta la caché.
+import hashlib
+import json
+import sqlite3
+import struct
+import threading
+import time
+from collections import OrderedDict
+from operator import attrgetter
+
+from .calculo import calcular_resultante
+from .fuerzas import BIT_CAMPO
+
+# Formato de las claves y los valores guardados. Cambiarlo al cambiar la codificación o los
+# resultados de los cálculos: al abrir un archivo se borran las filas de otros formatos.
+FORMATO = "v2"
+
+CAMPOS_FUERZA = ("magnitud", "angulo", "Fx", "Fy", "altura", "masa", "aceleracion", "peso", "distancia")
+CAMPOS_CUERPO = ("masa", "peso", "aceleracion_deseada", "tension", "angulo_fuerza_faltante")
+
+_LEER_FUERZA = attrgetter(*CAMPOS_FUERZA)
+_LEER_CUERPO = attrgetter(*CAMPOS_CUERPO)
+_BITS = tuple(BIT_CAMPO.get(c, 0) for c in CAMPOS_FUERZA)
+_FILA_FUERZA = struct.Struct(f"<{len(CAMPOS_FUERZA)}d")
+_FILA_CUERPO = struct.Struct(f"<{len(CAMPOS_CUERPO)}d")
+_NAN = float("nan")
+
+
+def clave_sistema(fuerzas, cuerpo=None):
+    # Hash canónico: cada fuerza se codifica por sus entradas como float64 empaquetados (los campos
+    # que calculó completar_datos y los que faltan van como NaN; el nombre no influye en el
+    # resultado) y las codificaciones se ordenan, porque la suma no depende del orden
+    filas = []
+    for f in fuerzas:
+        derivados = f._derivados
+        filas.append(_FILA_FUERZA.pack(*[_NAN if v is None or derivados & bit else v
+                                         for v, bit in zip(_LEER_FUERZA(f), _BITS)]))
+    filas.sort()
+    contenido = hashlib.sha256(len(filas).to_bytes(8, "little"))
+    contenido.update(b"".join(filas))
+    if cuerpo is not None:
+        contenido.update(_FILA_CUERPO.pack(*[_NAN if v is None else v for v in _LEER_CUERPO(cuerpo)]))
+    return contenido.hexdigest()
+
+
+def _completas(fuerzas):
+    return not any(f._pendientes for f in fuerzas)
+
+
+class CacheResultados:
+    def __init__(self, ruta=None, max_memoria=256, max_disco=100_000, ttl=None, confirmar_cada=1):
+        # ruta: archivo SQLite (None = solo memoria); ttl: segundos de validez (None = sin vencimiento);
+        # confirmar_cada: cambios en disco por commit (en lotes conviene más de 1; cerrar() confirma el resto)
+        self.max_memoria = max_memoria
+        self.max_disco = max_disco
+        self.ttl = ttl
+        self.confirmar_cada = confirmar_cada
+        self._sin_confirmar = 0
+        self._memoria = OrderedDict()  # clave -> (creado, valor)
+        self._candado = threading.Lock()
+        self._escrituras = 0
+        self.estadisticas = {"aciertos_memoria": 0, "aciertos_disco": 0, "fallos": 0, "directos": 0}
+
+        self._db = None
+        if ruta is not None:
+            self._db = sqlite3.connect(ruta, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS resultados ("
+                             "clave TEXT PRIMARY KEY, valor TEXT NOT NULL, creado REAL NOT NULL, usado REAL NOT NULL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS resultados_usado ON resultados (usado)")
+            self._db.execute("DELETE FROM resultados WHERE substr(clave, 1, ?) != ?",
+                             (len(FORMATO) + 1, FORMATO + ":"))
+            self._db.commit()
+
+    def _vencido(self, creado, ahora):
+        return self.ttl is not None and ahora - creado > self.ttl
+
+    def obtener(self, clave):
+        ahora = time.time()
+        with self._candado:
+            entrada = self._memoria.get(clave)
+            if entrada is not None:
+                if not self._vencido(entrada[0], ahora):
+                    self._memoria.move_to_end(clave)
+                    self.estadisticas["aciertos_memoria"] += 1
+                    return entrada[1]
+                del self._memoria[clave]
+
+            if self._db is not None:
+                fila = self._db.execute("SELECT valor, creado FROM resultados WHERE clave = ?", (clave,)).fetchone()
+                if fila is not None:
+                    if not self._vencido(fila[1], ahora):
+                        self._db.execute("UPDATE resultados SET usado = ? WHERE clave = ?", (ahora, clave))
+                        self._cambio()
+                        valor = json.loads(fila[0])
+                        self._guardar_en_memoria(clave, fila[1], valor)
+                        self.estadisticas["aciertos_disco"] += 1
+                        return valor
+                    self._db.execute("DELETE FROM resultados WHERE clave = ?", (clave,))
+                    self._cambio()
+
+            self.estadisticas["fallos"] += 1
+            return None
+
+    def _guardar_en_memoria(self, clave, creado, valor):
+        self._memoria[clave] = (creado, valor)
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.max_memoria:
+            self._memoria.popitem(last=False)
+
+    def guardar(self, clave, valor):
+        # valor debe ser serializable como JSON
+        ahora = time.time()
+        with self._candado:
+            self._guardar_en_memoria(clave, ahora, valor)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?)",
+                                 (clave, json.dumps(valor), ahora, ahora))
+                self._escrituras += 1
+                if self._escrituras % 256 == 0:
+                    self._podar(ahora)
+                self._cambio()
+
+    def _cambio(self):
+        self._sin_confirmar += 1
+        if self._sin_confirmar >= self.confirmar_cada:
+            self._db.commit()
+            self._sin_confirmar = 0
+
+    def _podar(self, ahora):
+        if self.ttl is not None:
+            self._db.execute("DELETE FROM resultados WHERE creado < ?", (ahora - self.ttl,))
+        self._db.execute("DELETE FROM resultados WHERE clave IN (SELECT clave FROM resultados "
+                         "ORDER BY usado DESC LIMIT -1 OFFSET ?)", (self.max_disco,))
+
+    # ---- Cálculos con caché ----
+    def resultante(self, fuerzas):
+        # Misma tupla que calcular_resultante
+        fuerzas = list(fuerzas)
+        if _completas(fuerzas):
+            self.estadisticas["directos"] += 1
+            return calcular_resultante(fuerzas)
+        clave = f"{FORMATO}:resultante:" + clave_sistema(fuerzas)
+        valor = self.obtener(clave)
+        if valor is None:
+            valor = calcular_resultante(fuerzas)
+            self.guardar(clave, valor)
+        magnitud, angulo, (Fx, Fy), *resto = valor
+        return (magnitud, angulo, (Fx, Fy), *resto)
+
+    def dinamica(self, cuerpo):
+        if _completas(cuerpo.fuerzas_aplicadas):
+            self.estadisticas["directos"] += 1
+            return cuerpo.calcular_dinamica()
+        clave = f"{FORMATO}:dinamica:" + clave_sistema(cuerpo.fuerzas_aplicadas, cuerpo)
+        valor = self.obtener(clave)
+        if valor is None:
+            valor = cuerpo.calcular_dinamica()
+            self.guardar(clave, valor)
+        return dict(valor)
+
+    def texto_estadisticas(self):
+        e = self.estadisticas
+        total = e["aciertos_memoria"] + e["aciertos_disco"] + e["fallos"]
+        tasa = (e["aciertos_memoria"] + e["aciertos_disco"]) / total if total else 0.0
+        return (f"caché: {e['aciertos_memoria']} aciertos en memoria, {e['aciertos_disco']} en disco, "
+                f"{e['fallos']} fallos ({tasa:.0%} de aciertos), {e['directos']} sin consultar")
+
+    def cerrar(self):
+        with self._candado:
+            if self._db is not None:
+                self._db.commit()
+                self._db.close()
+                self._db = None
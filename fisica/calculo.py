@@ -0,0 +1,168 @@
+import importlib.util
+import math
+
+from .fuerzas import TODAS_LAS_ETAPAS, FuerzaVectorial, g
+from .rendimiento import medir
+
+# Motor vectorizado (NumPy) para completar muchas fuerzas nuevas; se importa al usarlo
+# para que importar fisica no cargue NumPy
+NUMPY_OK = importlib.util.find_spec("numpy") is not None
+
+UMBRAL_VECTORIZADO = 256  # fuerzas por completar a partir de las cuales se completan en columnas
+
+# ---------------- CLASES ----------------
+class CuerpoFisico:
+    def __init__(self, masa=None, peso=None, aceleracion_deseada=None, tension=None, angulo_fuerza_faltante=None,
+                 incertidumbres=None):
+        self.masa = masa
+        self.peso = peso if peso is not None else (masa * g if masa else None)
+        self.aceleracion_deseada = aceleracion_deseada
+        self.tension = tension
+        self.angulo_fuerza_faltante = angulo_fuerza_faltante  # grados (opcional)
+        self.incertidumbres = incertidumbres  # como en FuerzaVectorial (ver fisica.incertidumbre)
+        self.fuerzas_aplicadas = []
+
+    def agregar_fuerza(self, fuerza: FuerzaVectorial):
+        self.fuerzas_aplicadas.append(fuerza)
+
+    @medir("calcular_dinamica")
+    def calcular_dinamica(self):
+        # Completar datos de fuerzas
+        _completar(self.fuerzas_aplicadas)
+
+        # Suma vectorial
+        suma_fx = sum(f.Fx for f in self.fuerzas_aplicadas if f.Fx is not None)
+        suma_fy = sum(f.Fy for f in self.fuerzas_aplicadas if f.Fy is not None)
+        momentos = sum(f.momento() for f in self.fuerzas_aplicadas)
+        trabajo_total = sum((f.trabajo or 0.0) for f in self.fuerzas_aplicadas)
+
+        return self.dinamica_desde_sumas(suma_fx, suma_fy, momentos, trabajo_total)
+
+    def dinamica_desde_sumas(self, suma_fx, suma_fy, momentos, trabajo_total):
+        # Casos de calcular_dinamica a partir de las sumas de las fuerzas aplicadas; permite
+        # resolver las sumas de muchos cuerpos juntas (ver fisica.servidor)
+        F_aplicada_mag = math.sqrt(suma_fx**2 + suma_fy**2)
+        F_aplicada_ang = math.degrees(math.atan2(suma_fy, suma_fx)) if F_aplicada_mag != 0 else 0.0
+
+        tipo = "indeterminado"
+        aceleracion = None
+        Fx_resultante = suma_fx
+        Fy_resultante = suma_fy
+        fuerza_resultante = F_aplicada_mag
+        angulo_resultante = F_aplicada_ang
+
+        fuerza_faltante_mag = None
+        fuerza_faltante_ang = None
+        inconsistencia_angulo = False
+
+        # Caso 1: Grúa con tensión vertical
+        if (self.tension is not None) and (self.masa is not None):
+            Fy_total = self.tension - (self.masa * g) + suma_fy
+            Fx_total = suma_fx
+            fuerza_resultante = math.sqrt(Fx_total**2 + Fy_total**2)
+            angulo_resultante = math.degrees(math.atan2(Fy_total, Fx_total)) if fuerza_resultante != 0 else 0.0
+            Fx_resultante, Fy_resultante = Fx_total, Fy_total
+            if self.masa and self.masa > 0:
+                aceleracion = fuerza_resultante / self.masa
+            tipo = "grua"
+
+        # Caso 2: Fuerzas aplicadas sobre cuerpo con masa/peso -> aceleración
+        elif (self.masa is not None) and (self.masa > 0) and (F_aplicada_mag is not None):
+            aceleracion = F_aplicada_mag / self.masa
+            tipo = "fuerzas_aplicadas"
+
+        # Caso 3: Calcular fuerza faltante para lograr aceleración deseada
+        if (self.aceleracion_deseada is not None) and (self.masa is not None) and (self.masa > 0):
+            Fx_deseado = self.masa * self.aceleracion_deseada
+            Fy_deseado = 0.0
+            Fx_req = Fx_deseado - suma_fx
+            Fy_req = Fy_deseado - suma_fy
+
+            if self.angulo_fuerza_faltante is not None:
+                rad = math.radians(self.angulo_fuerza_faltante)
+                cos_a = math.cos(rad)
+                sin_a = math.sin(rad)
+                Mx = Fx_req / cos_a if cos_a != 0 else None
+                My = Fy_req / sin_a if sin_a != 0 else None
+                if (Mx is not None) and (My is not None):
+                    if abs(Mx - My) <= 1e-6:
+                        fuerza_faltante_mag = Mx
+                    else:
+                        inconsistencia_angulo = True
+                        fuerza_faltante_mag = Fx_req * cos_a + Fy_req * sin_a
+                elif Mx is not None:
+                    fuerza_faltante_mag = Mx
+                elif My is not None:
+                    fuerza_faltante_mag = My
+                else:
+                    fuerza_faltante_mag = 0.0
+                fuerza_faltante_ang = self.angulo_fuerza_faltante
+            else:
+                fuerza_faltante_mag = math.sqrt(Fx_req**2 + Fy_req**2)
+                fuerza_faltante_ang = math.degrees(math.atan2(Fy_req, Fx_req)) if fuerza_faltante_mag != 0 else 0.0
+
+            tipo = "fuerza_faltante"
+
+        return {
+            "tipo": tipo,
+            "magnitud": fuerza_resultante,
+            "angulo": angulo_resultante,
+            "Fx": Fx_resultante,
+            "Fy": Fy_resultante,
+            "momento": momentos,
+            "trabajo": trabajo_total,
+            "aceleracion": aceleracion,
+            "fuerza_faltante_mag": fuerza_faltante_mag,
+            "fuerza_faltante_ang": fuerza_faltante_ang,
+            "inconsistencia_angulo": inconsistencia_angulo
+        }
+
+
+# ---------------- FUNCIONES DE CÁLCULO ----------------
+def _completar(fuerzas):
+    # completar_datos de cada fuerza. Las nuevas (todo pendiente) se apartan y, si son muchas, se completan
+    # juntas en columnas. Las sumas siguen siendo en Python: leer los campos de los objetos para pasarlos
+    # a NumPy cuesta más que sumarlos, así que con fuerzas ya completas no hay nada que ganar.
+    if not NUMPY_OK or len(fuerzas) < UMBRAL_VECTORIZADO:
+        for f in fuerzas:
+            f.completar_datos()
+        return
+    nuevas = []
+    for f in fuerzas:
+        if f._pendientes == TODAS_LAS_ETAPAS:
+            nuevas.append(f)
+        else:
+            f.completar_datos()
+    if len(nuevas) >= UMBRAL_VECTORIZADO:
+        from .vectorial import completar_fuerzas
+        completar_fuerzas(nuevas)
+    else:
+        for f in nuevas:
+            f.completar_datos()
+
+
+@medir("calcular_resultante")
+def calcular_resultante(fuerzas):
+    # Completa datos de todas las fuerzas
+    _completar(fuerzas)
+
+    hay_fx = any(f.Fx is not None for f in fuerzas)
+    hay_fy = any(f.Fy is not None for f in fuerzas)
+    if not hay_fx and not hay_fy:
+        return None, None, (None, None), None, 0.0, 0.0, 0.0, None
+
+    suma_fx = sum(f.Fx for f in fuerzas if f.Fx is not None)
+    suma_fy = sum(f.Fy for f in fuerzas if f.Fy is not None)
+    magnitud = math.sqrt(suma_fx**2 + suma_fy**2)
+    angulo = math.degrees(math.atan2(suma_fy, suma_fx)) if magnitud != 0 else 0.0
+    momentos = sum(f.momento() for f in fuerzas)
+
+    masa_total = sum((f.masa or 0.0) for f in fuerzas)
+    peso_total = sum((f.peso or 0.0) for f in fuerzas)
+    trabajo_total = sum((f.trabajo or 0.0) for f in fuerzas)
+
+    aceleracion_res = None
+    if (masa_total is not None) and (masa_total > 0):
+        aceleracion_res = magnitud / masa_total
+
+    return magnitud, angulo, (suma_fx, suma_fy), momentos, masa_total, peso_total, trabajo_total, aceleracion_res
@@ -0,0 +1,295 @@
+# Estática plana: fuerzas con punto de aplicación (x, y), apoyos y reacciones a partir de
+# ΣFx = ΣFy = ΣM = 0 (momentos antihorarios positivos, respecto al origen).
+#   CuerpoRigido: un cuerpo con sus apoyos; resolver_cuerpos resuelve muchos a la vez (3×3 por cuerpo)
+#   Armadura: nudos articulados unidos por barras; resolver_armaduras arma todas en un solo sistema
+#   disperso diagonal por bloques con SciPy (en requirements.txt; sin él, bloques densos agrupados por
+#   tamaño, que no escalan a estructuras de miles de barras)
+import importlib.util
+import math
+import warnings
+
+import numpy as np
+
+from .rendimiento import medir
+
+SCIPY_OK = importlib.util.find_spec("scipy") is not None
+
+# Reacciones desconocidas de cada tipo de apoyo
+APOYOS = {"articulado": 2, "rodillo": 1, "empotrado": 3}
+TOLERANCIA_SINGULAR = 1e-12  # |det| relativo a la cota de Hadamard por debajo del cual un 3×3 es singular
+TOLERANCIA_RESIDUO = 1e-8
+
+
+# ---------------- APOYOS ----------------
+class Apoyo:
+    __slots__ = ("nombre", "tipo", "x", "y", "angulo")
+
+    def __init__(self, nombre, tipo, x=0.0, y=0.0, angulo=90.0):
+        # angulo: dirección de la reacción de un rodillo (90° = vertical); los demás tipos lo ignoran
+        if tipo not in APOYOS:
+            raise ValueError(f"Tipo de apoyo desconocido: '{tipo}' (usa {', '.join(APOYOS)}).")
+        self.nombre = nombre
+        self.tipo = tipo
+        self.x = x
+        self.y = y
+        self.angulo = angulo
+
+    def incognitas(self):
+        # [(nombre, aporte a ΣFx, aporte a ΣFy, aporte a ΣM)] por cada reacción de valor unitario
+        if self.tipo == "rodillo":
+            rad = math.radians(self.angulo)
+            # Sin el residuo de cos(90°) ≈ 6e-17, que aparecería como una reacción espuria
+            ux, uy = (0.0 if abs(u) < 1e-12 else u for u in (math.cos(rad), math.sin(rad)))
+            direcciones = [("R", ux, uy)]
+        else:
+            direcciones = [("Rx", 1.0, 0.0), ("Ry", 0.0, 1.0)]
+        columnas = [(f"{self.nombre}.{n}", ux, uy, self.x * uy - self.y * ux) for n, ux, uy in direcciones]
+        if self.tipo == "empotrado":
+            columnas.append((f"{self.nombre}.M", 0.0, 0.0, 1.0))
+        return columnas
+
+
+def _componentes(fuerza):
+    fuerza.completar_datos()
+    if fuerza.Fx is None or fuerza.Fy is None:
+        raise ValueError(f"La fuerza '{fuerza.nombre}' no tiene componentes Fx y Fy definidas.")
+    return fuerza.Fx, fuerza.Fy
+
+
+# ---------------- CUERPO RÍGIDO ----------------
+class CuerpoRigido:
+    def __init__(self):
+        self.cargas = []  # (Fx, Fy, x, y)
+        self.par = 0.0    # suma de pares aplicados (N·m, antihorario positivo)
+        self.apoyos = []
+
+    def agregar_fuerza(self, fuerza, x=0.0, y=0.0):
+        Fx, Fy = _componentes(fuerza)
+        self.cargas.append((Fx, Fy, x, y))
+
+    def agregar_par(self, momento):
+        self.par += momento
+
+    def agregar_apoyo(self, nombre, tipo, x=0.0, y=0.0, angulo=90.0):
+        apoyo = Apoyo(nombre, tipo, x, y, angulo)
+        self.apoyos.append(apoyo)
+        return apoyo
+
+    def momento_cargas(self, x0=0.0, y0=0.0):
+        # Momento de las cargas y pares respecto a (x0, y0)
+        return sum((x - x0) * Fy - (y - y0) * Fx for Fx, Fy, x, y in self.cargas) + self.par
+
+    def ensamblar(self):
+        # (nombres de las reacciones, matriz 3×k, términos independientes): A·R = -Σcargas
+        columnas = [c for apoyo in self.apoyos for c in apoyo.incognitas()]
+        nombres = [c[0] for c in columnas]
+        A = [[c[i] for c in columnas] for i in (1, 2, 3)]
+        b = [-sum(c[0] for c in self.cargas), -sum(c[1] for c in self.cargas), -self.momento_cargas()]
+        return nombres, A, b
+
+    def resolver(self):
+        # {nombre de la reacción: valor}; p. ej. {"A.Rx": 0.0, "A.Ry": 50.0, "B.R": 50.0}
+        return resolver_cuerpos([self])[0]
+
+
+def _singulares(A):
+    # Índices de los bloques 3×3 (casi) singulares: apoyos que no impiden el movimiento
+    escala = np.prod(np.linalg.norm(A, axis=2), axis=1)
+    return np.flatnonzero(~(np.abs(np.linalg.det(A)) > TOLERANCIA_SINGULAR * escala))
+
+
+@medir("resolver_cuerpos")
+def resolver_cuerpos(cuerpos):
+    # Resuelve todos los cuerpos en una sola llamada a np.linalg.solve sobre un arreglo (n, 3, 3)
+    cuerpos = list(cuerpos)
+    A = np.empty((len(cuerpos), 3, 3))
+    b = np.empty((len(cuerpos), 3))
+    nombres = []
+    for i, cuerpo in enumerate(cuerpos):
+        nombres_i, A_i, b_i = cuerpo.ensamblar()
+        if len(nombres_i) != 3:
+            raise ValueError(f"Cuerpo {i + 1}: tiene {len(nombres_i)} reacciones desconocidas y la estática "
+                             "plana da 3 ecuaciones; solo se resuelven cuerpos isostáticos.")
+        A[i] = A_i
+        b[i] = b_i
+        nombres.append(nombres_i)
+
+    singulares = _singulares(A)
+    if singulares.size:
+        raise ValueError(f"Cuerpo {singulares[0] + 1}: los apoyos no impiden el movimiento (sistema singular).")
+    reacciones = np.linalg.solve(A, b[:, :, None])[:, :, 0]
+    return [dict(zip(n, fila)) for n, fila in zip(nombres, reacciones.tolist())]
+
+
+# ---------------- ARMADURAS ----------------
+class Armadura:
+    def __init__(self):
+        self.nudos = {}  # nombre -> índice
+        self.x = []
+        self.y = []
+        self.barras = []  # (índice a, índice b)
+        self.apoyos = []  # (índice del nudo, Apoyo)
+        self.cargas = []  # (índice del nudo, Fx, Fy)
+
+    def agregar_nudo(self, nombre, x, y):
+        if nombre in self.nudos:
+            raise ValueError(f"El nudo '{nombre}' ya existe.")
+        self.nudos[nombre] = len(self.x)
+        self.x.append(x)
+        self.y.append(y)
+
+    def _nudo(self, nombre):
+        try:
+            return self.nudos[nombre]
+        except KeyError:
+            raise ValueError(f"El nudo '{nombre}' no existe.") from None
+
+    def agregar_barra(self, a, b):
+        self.barras.append((self._nudo(a), self._nudo(b)))
+
+    def agregar_apoyo(self, nudo, tipo, angulo=90.0):
+        if tipo == "empotrado":
+            raise ValueError("Los nudos de una armadura son articulados; usa 'articulado' o 'rodillo'.")
+        i = self._nudo(nudo)
+        self.apoyos.append((i, Apoyo(nudo, tipo, self.x[i], self.y[i], angulo)))
+
+    def agregar_carga(self, nudo, fuerza):
+        Fx, Fy = _componentes(fuerza)
+        self.cargas.append((self._nudo(nudo), Fx, Fy))
+
+    def ensamblar(self):
+        # Sistema de esta armadura sola; ver _ensamblar
+        return _ensamblar([self])
+
+    def resolver(self):
+        # {"barras": arreglo con la fuerza de cada barra (en el orden de agregar_barra; tracción > 0),
+        #  "reacciones": {nombre: valor}}
+        return resolver_armaduras([self])[0]
+
+
+def _ensamblar(armaduras):
+    # Equilibrio de cada nudo (ΣFx, ΣFy) de todas las armaduras, en formato COO y en una sola pasada
+    # vectorizada. Devuelve (filas, columnas, valores, b, inicios, nombres): la armadura i ocupa las
+    # filas y columnas inicios[i]:inicios[i + 1]; sus incógnitas son la fuerza de cada barra
+    # (tracción positiva) y luego sus reacciones, llamadas nombres[i].
+    nudos = np.cumsum([0] + [len(a.x) for a in armaduras])
+    inicios = 2 * nudos
+    x = np.array([v for a in armaduras for v in a.x], dtype=float)
+    y = np.array([v for a in armaduras for v in a.y], dtype=float)
+    por_armadura = np.array([len(a.barras) for a in armaduras], dtype=np.intp)
+    ia, ib = np.concatenate([np.asarray(a.barras, dtype=np.intp).reshape(-1, 2) + nudos[i]
+                             for i, a in enumerate(armaduras)]).T
+    dx, dy = x[ib] - x[ia], y[ib] - y[ia]
+    largo = np.hypot(dx, dy)
+    if np.any(largo == 0):
+        i = int(np.searchsorted(nudos, ia[np.argmax(largo == 0)], side="right")) - 1
+        raise ValueError(f"Armadura {i + 1}: tiene barras de largo cero.")
+    ux, uy = dx / largo, dy / largo
+    # Columna de cada barra: inicio de su armadura + posición dentro de ella
+    primera = np.repeat(np.cumsum(por_armadura) - por_armadura, por_armadura)
+    k = np.repeat(inicios[:-1], por_armadura) + np.arange(len(ia)) - primera
+    # Una barra en tracción tira del nudo a hacia b y del nudo b hacia a
+    filas = [2 * ia, 2 * ia + 1, 2 * ib, 2 * ib + 1]
+    columnas = [k, k, k, k]
+    valores = [ux, uy, -ux, -uy]
+
+    nombres = []
+    f_r, c_r, v_r = [], [], []
+    for i, armadura in enumerate(armaduras):
+        nombres_i = []
+        for nudo, apoyo in armadura.apoyos:
+            fila = 2 * (nudos[i] + nudo)
+            for nombre, rx, ry, _ in apoyo.incognitas():
+                columna = inicios[i] + len(armadura.barras) + len(nombres_i)
+                f_r += (fila, fila + 1)
+                c_r += (columna, columna)
+                v_r += (rx, ry)
+                nombres_i.append(nombre)
+        incognitas = len(armadura.barras) + len(nombres_i)
+        if incognitas != 2 * len(armadura.x):
+            raise ValueError(f"Armadura {i + 1}: {2 * len(armadura.x)} ecuaciones y {incognitas} incógnitas "
+                             "(barras + reacciones); solo se resuelven armaduras isostáticas.")
+        nombres.append(nombres_i)
+    filas.append(np.array(f_r, dtype=np.intp))
+    columnas.append(np.array(c_r, dtype=np.intp))
+    valores.append(np.array(v_r, dtype=float))
+
+    b = np.zeros(inicios[-1])
+    cargas = [(nudos[i] + nudo, Fx, Fy) for i, a in enumerate(armaduras) for nudo, Fx, Fy in a.cargas]
+    if cargas:
+        indices, Fx, Fy = (np.array(c) for c in zip(*cargas))
+        np.add.at(b, 2 * indices.astype(np.intp), -Fx)
+        np.add.at(b, 2 * indices.astype(np.intp) + 1, -Fy)
+    return np.concatenate(filas), np.concatenate(columnas), np.concatenate(valores), b, inicios, nombres
+
+
+def _resolver_disperso(filas, columnas, valores, b, inicios):
+    from scipy.sparse import csc_matrix
+    from scipy.sparse.linalg import spsolve
+
+    A = csc_matrix((valores, (filas, columnas)), shape=(len(b), len(b)))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # matriz singular: SuperLU avisa y devuelve NaN; se revisa después
+        x = np.atleast_1d(spsolve(A, b))
+        if not np.all(np.isfinite(x)):
+            # Con un solo bloque singular SuperLU deja todo en NaN: se resuelve cada bloque por separado
+            # para que solo los singulares queden en NaN y el error nombre a la armadura correcta
+            for desde, hasta in zip(inicios[:-1], inicios[1:]):
+                bloque = slice(desde, hasta)
+                x[bloque] = spsolve(A[bloque, bloque], b[bloque])
+    return x, A @ x - b
+
+
+def _resolver_bloque(A, b):
+    try:
+        return np.linalg.solve(A, b)
+    except np.linalg.LinAlgError:
+        return np.full(len(b), np.nan)
+
+
+def _resolver_denso(filas, columnas, valores, b, inicios):
+    # Sin SciPy: los bloques del mismo tamaño se apilan y se resuelven juntos con np.linalg.solve
+    x = np.empty(len(b))
+    residuo = np.empty(len(b))
+    bloque = np.searchsorted(inicios, filas, side="right") - 1
+    tamanos = np.diff(inicios)
+    for n in np.unique(tamanos):
+        grupo = np.flatnonzero(tamanos == n)
+        posicion = np.full(len(tamanos), -1)
+        posicion[grupo] = np.arange(len(grupo))
+        en_grupo = posicion[bloque] >= 0
+        A = np.zeros((len(grupo), n, n))
+        desde = inicios[bloque[en_grupo]]
+        np.add.at(A, (posicion[bloque[en_grupo]], filas[en_grupo] - desde, columnas[en_grupo] - desde),
+                  valores[en_grupo])
+        indices = inicios[grupo][:, None] + np.arange(n)
+        try:
+            solucion = np.linalg.solve(A, b[indices][:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            # Algún bloque del grupo es singular: uno por uno, para que solo ese quede en NaN
+            solucion = np.array([_resolver_bloque(A_i, b_i) for A_i, b_i in zip(A, b[indices])])
+        x[indices] = solucion
+        residuo[indices] = np.einsum("kij,kj->ki", A, solucion) - b[indices]
+    return x, residuo
+
+
+@medir("resolver_armaduras")
+def resolver_armaduras(armaduras, disperso=None):
+    # Todas las armaduras forman un único sistema diagonal por bloques. disperso=None elige SciPy
+    # si está instalado; False fuerza los bloques densos.
+    armaduras = list(armaduras)
+    if not armaduras:
+        return []
+    disperso = SCIPY_OK if disperso is None else disperso
+    filas, columnas, valores, b, inicios, nombres = _ensamblar(armaduras)
+    x, residuo = (_resolver_disperso if disperso else _resolver_denso)(filas, columnas, valores, b, inicios)
+
+    resultados = []
+    for i, armadura in enumerate(armaduras):
+        bloque = slice(inicios[i], inicios[i + 1])
+        escala = 1.0 + np.abs(b[bloque]).max(initial=0.0) + np.abs(x[bloque]).max(initial=0.0)
+        if not np.all(np.abs(residuo[bloque]) <= TOLERANCIA_RESIDUO * escala):
+            raise ValueError(f"Armadura {i + 1}: la geometría o los apoyos forman un mecanismo (sistema singular).")
+        m = len(armadura.barras)
+        resultados.append({"barras": x[bloque][:m], "reacciones": dict(zip(nombres[i], x[bloque][m:].tolist()))})
+    return resultados
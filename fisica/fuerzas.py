@@ -0,0 +1,240 @@
+import math
+from contextvars import ContextVar
+from operator import attrgetter
+
+g = 9.81  # gravedad m/s^2
+
+# Mensajes de datos faltantes. Cada fuerza guarda solo un entero con un bit por mensaje
+# y el texto se arma al pedirlo en mensajes_faltantes().
+FALTA_COMPONENTES = 1
+FALTA_PESO_MASA = 2
+MASA_CERO = 4
+FALTA_F_O_A = 8
+FALTA_MASA = 16
+FALTA_MAGNITUD_TRABAJO = 32
+
+MENSAJES_FALTANTES = {
+    FALTA_COMPONENTES: "Para calcular componentes o dirección: ingresa Fx y Fy, o magnitud y ángulo.",
+    FALTA_PESO_MASA: "Para calcular peso o masa: proporciona m o P.",
+    MASA_CERO: "Masa no puede ser cero para calcular aceleración.",
+    FALTA_F_O_A: "Para calcular aceleración o fuerza: falta F (magnitud) o a.",
+    FALTA_MASA: "Para relacionar F y a: falta la masa.",
+    FALTA_MAGNITUD_TRABAJO: "Para calcular trabajo (W), falta magnitud de la fuerza.",
+}
+
+# Etapas de completar_datos. Asignar un atributo de entrada solo invalida las etapas
+# que lo leen; las demás conservan su resultado (y sus mensajes) de la última vez.
+# Los valores que una etapa invalidada había calculado se borran, y eso invalida a su vez
+# las etapas que los leían.
+ETAPA_COMPONENTES = 1
+ETAPA_PESO_MASA = 2
+ETAPA_DINAMICA = 4
+ETAPA_TRABAJO = 8
+TODAS_LAS_ETAPAS = ETAPA_COMPONENTES | ETAPA_PESO_MASA | ETAPA_DINAMICA | ETAPA_TRABAJO
+
+DEPENDENCIAS = {
+    "magnitud": ETAPA_COMPONENTES | ETAPA_DINAMICA | ETAPA_TRABAJO,
+    "angulo": ETAPA_COMPONENTES | ETAPA_DINAMICA,
+    "Fx": ETAPA_COMPONENTES | ETAPA_DINAMICA,
+    "Fy": ETAPA_COMPONENTES | ETAPA_DINAMICA,
+    "masa": ETAPA_PESO_MASA | ETAPA_DINAMICA,
+    "peso": ETAPA_PESO_MASA,
+    "aceleracion": ETAPA_DINAMICA,
+    "distancia": ETAPA_TRABAJO,
+}
+
+# Campos que calcula cada etapa, y un bit por campo para anotar en _derivados cuáles no son entradas
+CALCULADOS = {
+    ETAPA_COMPONENTES: ("magnitud", "angulo", "Fx", "Fy"),
+    ETAPA_PESO_MASA: ("masa", "peso"),
+    ETAPA_DINAMICA: ("aceleracion", "magnitud", "Fx", "Fy"),
+    ETAPA_TRABAJO: ("trabajo",),
+}
+BIT_CAMPO = {campo: 1 << i for i, campo in enumerate(
+    ("magnitud", "angulo", "Fx", "Fy", "masa", "peso", "aceleracion", "trabajo"))}
+
+# Las dos formas de dar una fuerza: campo -> (el otro campo de su forma, campos de la otra forma).
+# Al asignar un campo con su pareja ya definida, la pareja pasa a ser entrada y la otra forma se
+# borra para que se recalcule desde esta; si no, completar_datos la usaría para pisar lo asignado.
+FORMAS = {
+    "Fx": ("Fy", ("magnitud", "angulo")),
+    "Fy": ("Fx", ("magnitud", "angulo")),
+    "magnitud": ("angulo", ("Fx", "Fy")),
+    "angulo": ("magnitud", ("Fx", "Fy")),
+}
+
+# Contadores de completar_datos. Cada sesión de la interfaz usa los suyos con
+# usar_estadisticas_completar(); fuera de ella (scripts, lotes) se usan estos.
+ESTADISTICAS_COMPLETAR = {"recalculadas": 0, "en_cache": 0}
+_estadisticas_completar = ContextVar("estadisticas_completar", default=ESTADISTICAS_COMPLETAR)
+
+
+def usar_estadisticas_completar(estadisticas):
+    # Contadores para el contexto actual (hilo o tarea); devuelve el mismo dict
+    _estadisticas_completar.set(estadisticas)
+    return estadisticas
+
+
+# ---------------- CLASES ----------------
+class FuerzaVectorial:
+    # Sin __dict__ por instancia: st.session_state.fuerzas puede guardar muchas fuerzas.
+    __slots__ = ("nombre", "magnitud", "angulo", "Fx", "Fy", "altura", "masa", "aceleracion", "peso",
+                 "distancia", "trabajo", "incertidumbres", "_faltantes", "_pendientes", "_derivados")
+
+    def __init__(self, nombre=None, magnitud=None, angulo=None, Fx=None, Fy=None,
+                 altura=0.0, masa=None, aceleracion=None, peso=None, distancia=None, incertidumbres=None):
+        # Todo está pendiente y nada calculado todavía, así que se escribe sin pasar por __setattr__
+        iniciar = object.__setattr__
+        iniciar(self, "nombre", nombre or "F")
+        iniciar(self, "magnitud", magnitud)        # N
+        iniciar(self, "angulo", angulo)            # grados
+        iniciar(self, "Fx", Fx)                    # N
+        iniciar(self, "Fy", Fy)                    # N
+        iniciar(self, "altura", altura)            # m
+        iniciar(self, "masa", masa)                # kg (opcional por fuerza)
+        iniciar(self, "aceleracion", aceleracion)  # m/s^2 (opcional por fuerza)
+        iniciar(self, "peso", peso)                # N
+        iniciar(self, "distancia", distancia)      # m (para trabajo)
+        iniciar(self, "trabajo", None)             # J
+        # Opcional, solo para fisica.incertidumbre: {"magnitud": 2.0} es σ = 2 N alrededor del valor;
+        # {"angulo": (28.0, 32.0)} es un valor uniforme entre 28° y 32°
+        iniciar(self, "incertidumbres", incertidumbres)
+        iniciar(self, "_faltantes", 0)
+        iniciar(self, "_pendientes", TODAS_LAS_ETAPAS)
+        iniciar(self, "_derivados", 0)
+
+    def __reduce__(self):
+        # Pickle compacto: solo los valores, en el orden de __slots__
+        return _reconstruir, _LEER_SLOTS(self)
+
+    def __setattr__(self, nombre, valor):
+        # Asignar desde fuera convierte el campo en entrada
+        bit = BIT_CAMPO.get(nombre, 0)
+        etapas = DEPENDENCIAS.get(nombre, 0)
+        if not (bit or etapas):
+            object.__setattr__(self, nombre, valor)
+            return
+        cambio = getattr(self, nombre, None) != valor
+        object.__setattr__(self, nombre, valor)
+        derivados = self._derivados & ~bit
+        if cambio and valor is not None and nombre in FORMAS:
+            pareja, otra_forma = FORMAS[nombre]
+            if getattr(self, pareja) is not None:
+                derivados &= ~BIT_CAMPO[pareja]
+                for campo in otra_forma:
+                    if getattr(self, campo) is not None:
+                        object.__setattr__(self, campo, None)
+                        etapas |= DEPENDENCIAS[campo]
+                    derivados &= ~BIT_CAMPO[campo]
+        if derivados != self._derivados:
+            object.__setattr__(self, "_derivados", derivados)
+        if cambio and etapas:
+            self._invalidar(etapas)
+
+    def _invalidar(self, etapas):
+        # Marca las etapas como pendientes y borra lo que habían calculado, en cascada
+        pendientes, derivados = self._pendientes, self._derivados
+        while etapas:
+            pendientes |= etapas
+            nuevas = 0
+            for etapa, campos in CALCULADOS.items():
+                if not etapas & etapa:
+                    continue
+                for campo in campos:
+                    if derivados & BIT_CAMPO[campo]:
+                        derivados &= ~BIT_CAMPO[campo]
+                        object.__setattr__(self, campo, None)
+                        nuevas |= DEPENDENCIAS.get(campo, 0)
+            etapas = nuevas & ~pendientes
+        object.__setattr__(self, "_pendientes", pendientes)
+        object.__setattr__(self, "_derivados", derivados)
+
+    def _calcular(self, campo, valor):
+        # Escritura de completar_datos: no invalida nada y deja el campo marcado como calculado
+        object.__setattr__(self, campo, valor)
+        object.__setattr__(self, "_derivados", self._derivados | BIT_CAMPO[campo])
+
+    def _etapa_lista(self, etapa):
+        object.__setattr__(self, "_pendientes", self._pendientes & ~etapa)
+
+    def completar_datos(self):
+        estadisticas = _estadisticas_completar.get()
+        if not self._pendientes:
+            estadisticas["en_cache"] += 1
+            return
+        estadisticas["recalculadas"] += 1
+
+        # Componentes <-> polar
+        if self._pendientes & ETAPA_COMPONENTES:
+            self._faltantes &= ~FALTA_COMPONENTES
+            if (self.Fx is not None) and (self.Fy is not None):
+                self._calcular("magnitud", math.sqrt(self.Fx**2 + self.Fy**2))
+                self._calcular("angulo", math.degrees(math.atan2(self.Fy, self.Fx)))
+            elif (self.magnitud is not None) and (self.angulo is not None):
+                rad = math.radians(self.angulo)
+                self._calcular("Fx", self.magnitud * math.cos(rad))
+                self._calcular("Fy", self.magnitud * math.sin(rad))
+            else:
+                self._faltantes |= FALTA_COMPONENTES
+            self._etapa_lista(ETAPA_COMPONENTES)
+
+        # Peso <-> masa (local a la fuerza si se usa)
+        if self._pendientes & ETAPA_PESO_MASA:
+            self._faltantes &= ~FALTA_PESO_MASA
+            if (self.masa is not None) and (self.peso is None):
+                self._calcular("peso", self.masa * g)
+            elif (self.peso is not None) and (self.masa is None):
+                self._calcular("masa", self.peso / g)
+            else:
+                if (self.masa is None) and (self.peso is None):
+                    self._faltantes |= FALTA_PESO_MASA
+            self._etapa_lista(ETAPA_PESO_MASA)
+
+        # Segunda ley (F = m a) local
+        if self._pendientes & ETAPA_DINAMICA:
+            self._faltantes &= ~(MASA_CERO | FALTA_F_O_A | FALTA_MASA)
+            if (self.masa is not None) and (self.magnitud is not None) and (self.aceleracion is None):
+                if self.masa == 0:
+                    self._faltantes |= MASA_CERO
+                else:
+                    self._calcular("aceleracion", self.magnitud / self.masa)
+            elif (self.masa is not None) and (self.aceleracion is not None) and (self.magnitud is None):
+                self._calcular("magnitud", self.masa * self.aceleracion)
+                if (self.angulo is not None) and ((self.Fx is None) or (self.Fy is None)):
+                    rad = math.radians(self.angulo)
+                    self._calcular("Fx", self.magnitud * math.cos(rad))
+                    self._calcular("Fy", self.magnitud * math.sin(rad))
+            else:
+                if (self.magnitud is None) and (self.aceleracion is None) and (self.masa is not None):
+                    self._faltantes |= FALTA_F_O_A
+                if (self.masa is None) and ((self.magnitud is not None) or (self.aceleracion is not None)):
+                    self._faltantes |= FALTA_MASA
+            self._etapa_lista(ETAPA_DINAMICA)
+
+        # Trabajo (suponiendo fuerza colineal con el desplazamiento)
+        if self._pendientes & ETAPA_TRABAJO:
+            self._faltantes &= ~FALTA_MAGNITUD_TRABAJO
+            if (self.distancia is not None) and (self.magnitud is not None):
+                self._calcular("trabajo", self.magnitud * self.distancia)
+            elif (self.distancia is not None) and (self.magnitud is None):
+                self._faltantes |= FALTA_MAGNITUD_TRABAJO
+            self._etapa_lista(ETAPA_TRABAJO)
+
+    def momento(self):
+        if self.Fy is None:
+            self.completar_datos()
+        return (self.Fy if self.Fy is not None else 0.0) * (self.altura if self.altura is not None else 0.0)
+
+    def mensajes_faltantes(self):
+        return [m for bit, m in MENSAJES_FALTANTES.items() if self._faltantes & bit]
+
+
+_LEER_SLOTS = attrgetter(*FuerzaVectorial.__slots__)
+
+
+def _reconstruir(*valores):
+    # Inversa de FuerzaVectorial.__reduce__; escribe sin pasar por el seguimiento de cambios
+    f = object.__new__(FuerzaVectorial)
+    for nombre, valor in zip(FuerzaVectorial.__slots__, valores):
+        object.__setattr__(f, nombre, valor)
+    return f
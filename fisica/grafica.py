@@ -0,0 +1,159 @@
+import importlib.util
+import io
+import weakref
+from collections import OrderedDict
+
+from .rendimiento import medir
+
+# matplotlib solo se importa la primera vez que se grafica
+MATPLOTLIB_OK = importlib.util.find_spec("matplotlib") is not None
+_plt = None
+
+MAX_ETIQUETAS = 30          # más fuerzas que esto: solo se rotulan las de mayor magnitud
+TAMANO_CACHE_FIGURAS = 8    # figuras recientes que se reutilizan entre reruns
+_cache_figuras = OrderedDict()
+_png_figuras = weakref.WeakKeyDictionary()  # se libera junto con la figura
+
+
+def _pyplot():
+    global _plt, MATPLOTLIB_OK
+    if _plt is None and MATPLOTLIB_OK:
+        try:
+            import matplotlib.pyplot as plt
+            _plt = plt
+        except Exception:
+            MATPLOTLIB_OK = False
+    return _plt
+
+
+# ---------------- FUNCIONES DE GRÁFICA ----------------
+def _etiqueta_fuerza(f):
+    etiqueta = f"{f.nombre}\n|F|={f.magnitud:.2f} N\nθ={f.angulo:.1f}°"
+    if f.masa is not None: etiqueta += f"\nm={f.masa:.2f} kg"
+    if f.peso is not None: etiqueta += f"\nP={f.peso:.2f} N"
+    if f.aceleracion is not None: etiqueta += f"\na={f.aceleracion:.2f} m/s²"
+    if f.trabajo is not None: etiqueta += f"\nW={f.trabajo:.2f} J"
+    return etiqueta
+
+
+def _dibujar(plt, vectores, Fx_R, Fy_R, magnitud_R, angulo_R, aceleracion_R, masa_R, peso_R, trabajo_R, max_etiquetas):
+    fig, ax = plt.subplots(figsize=(7, 7))
+    ax.set_title("Sistema de fuerzas y datos resultantes")
+    ax.set_xlabel("Fx (N)")
+    ax.set_ylabel("Fy (N)")
+    ax.axhline(0, color='gray', linewidth=0.8)
+    ax.axvline(0, color='gray', linewidth=0.8)
+    ax.set_aspect('equal', 'box')
+
+    # Vectores individuales: una sola llamada a quiver para todas las fuerzas
+    if vectores:
+        fx = [f.Fx for f in vectores]
+        fy = [f.Fy for f in vectores]
+        ceros = [0.0] * len(vectores)
+        ax.quiver(ceros, ceros, fx, fy, angles='xy', scale_units='xy', scale=1, color='blue', alpha=0.85)
+
+        rotuladas = vectores
+        if max_etiquetas is not None and len(vectores) > max_etiquetas:
+            rotuladas = sorted(vectores, key=lambda f: f.Fx**2 + f.Fy**2, reverse=True)[:max_etiquetas]
+            ax.text(0.01, 0.01, f"{len(vectores) - len(rotuladas)} fuerzas sin etiqueta (se muestran las {len(rotuladas)} mayores)",
+                    transform=ax.transAxes, color='blue', fontsize=8, ha='left', va='bottom')
+        for f in rotuladas:
+            ax.text(f.Fx, f.Fy, _etiqueta_fuerza(f), color='blue', fontsize=8, ha='left', va='bottom')
+
+    # Resultante
+    if (Fx_R is not None) and (Fy_R is not None):
+        ax.quiver(0, 0, Fx_R, Fy_R, angles='xy', scale_units='xy', scale=1, color='red', width=0.006)
+        etiqueta_R = f"Resultante\n|F|={magnitud_R:.2f} N\nθ={angulo_R:.1f}°"
+        if masa_R: etiqueta_R += f"\nm={masa_R:.2f} kg"
+        if peso_R: etiqueta_R += f"\nP={peso_R:.2f} N"
+        if aceleracion_R is not None: etiqueta_R += f"\na={aceleracion_R:.2f} m/s²"
+        if trabajo_R: etiqueta_R += f"\nW={trabajo_R:.2f} J"
+        ax.text(Fx_R, Fy_R, etiqueta_R, color='red', fontsize=9, ha='left', va='bottom')
+
+    # Límites
+    all_fx = [f.Fx for f in vectores] + ([Fx_R] if Fx_R is not None else [])
+    all_fy = [f.Fy for f in vectores] + ([Fy_R] if Fy_R is not None else [])
+    max_extent = max([1.0] + [abs(x) for x in all_fx + all_fy])
+    ax.set_xlim(-1.2 * max_extent, 1.2 * max_extent)
+    ax.set_ylim(-1.2 * max_extent, 1.2 * max_extent)
+
+    ax.grid(True, linestyle='--', alpha=0.3)
+    fig.tight_layout()
+    return fig
+
+
+@medir("graficar_vectores_fig")
+def graficar_vectores_fig(fuerzas, Fx_R, Fy_R, magnitud_R, angulo_R, aceleracion_R, masa_R, peso_R, trabajo_R,
+                          max_etiquetas=MAX_ETIQUETAS):
+    plt = _pyplot()
+    if plt is None:
+        return None
+
+    # Chequeo: si no hay nada que graficar, salir
+    vectores = [f for f in fuerzas if (f.Fx is not None) and (f.Fy is not None)]
+    if not vectores and (Fx_R is None or Fy_R is None):
+        return None
+
+    # Misma entrada -> misma figura (no se vuelve a dibujar)
+    datos_resultante = (Fx_R, Fy_R, magnitud_R, angulo_R, aceleracion_R, masa_R, peso_R, trabajo_R)
+    clave = (tuple((f.nombre, f.Fx, f.Fy, f.magnitud, f.angulo, f.masa, f.peso, f.aceleracion, f.trabajo)
+                   for f in vectores), datos_resultante, max_etiquetas)
+    fig = _cache_figuras.get(clave)
+    if fig is not None:
+        _cache_figuras.move_to_end(clave)
+        return fig
+
+    fig = _dibujar(plt, vectores, *datos_resultante, max_etiquetas)
+    # pyplot no guarda referencias a la figura; basta con sacarla de la caché para liberarla
+    plt.close(fig)
+    _cache_figuras[clave] = fig
+    while len(_cache_figuras) > TAMANO_CACHE_FIGURAS:
+        _cache_figuras.popitem(last=False)
+    return fig
+
+
+@medir("figura_png")
+def figura_png(fig):
+    # PNG con las mismas opciones que st.pyplot; se genera una sola vez por figura
+    png = _png_figuras.get(fig)
+    if png is None:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=200, bbox_inches="tight")
+        png = _png_figuras[fig] = buffer.getvalue()
+    return png
+
+
+def limpiar_cache_figuras():
+    _cache_figuras.clear()
+
+
+@medir("graficar_barrido_fig")
+def graficar_barrido_fig(barrido, indice_masa=0):
+    # Mapa de calor de la fuerza faltante (aceleración × ángulo) para una masa del barrido;
+    # las zonas rayadas son las de inconsistencia de ángulo
+    plt = _pyplot()
+    if plt is None:
+        return None
+
+    angulos, aceleraciones = barrido["angulos"], barrido["aceleraciones"]
+    magnitud = barrido["magnitud"][indice_masa]
+    inconsistencia = barrido["inconsistencia"][indice_masa]
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.set_title(f"Fuerza faltante (m = {barrido['masas'][indice_masa]:.2f} kg)")
+    ax.set_xlabel("Ángulo de la fuerza faltante (°)")
+    ax.set_ylabel("Aceleración deseada (m/s²)")
+    extent = (angulos[0], angulos[-1], aceleraciones[0], aceleraciones[-1])
+    imagen = ax.imshow(magnitud, origin="lower", aspect="auto", extent=extent, cmap="viridis", interpolation="nearest")
+    fig.colorbar(imagen, ax=ax, label="|F| faltante (N)")
+    if inconsistencia.any() and len(angulos) > 1 and len(aceleraciones) > 1:
+        ax.contourf(angulos, aceleraciones, inconsistencia.astype(float), levels=[0.5, 1.5],
+                    colors="none", hatches=["//"])
+
+    optimo = barrido["optimo"]
+    if optimo is not None and optimo["masa"] == barrido["masas"][indice_masa]:
+        ax.plot(optimo["angulo"], optimo["aceleracion"], marker="*", color="red", markersize=14)
+
+    fig.tight_layout()
+    plt.close(fig)
+    return fig
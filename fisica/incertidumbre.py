@@ -0,0 +1,254 @@
+# Propagación de incertidumbre por Monte Carlo (requiere NumPy).
+# Cada entrada con incertidumbre (FuerzaVectorial.incertidumbres, CuerpoFisico.incertidumbres) se
+# muestrea; las demás quedan fijas. Las muestras se procesan en bloques, así que la memoria depende
+# del tamaño del bloque y no de n_muestras. Cada entrada incierta tiene su propio generador, así que
+# la misma semilla da las mismas muestras con cualquier tamaño de bloque.
+import numpy as np
+
+from .barrido import magnitud_con_angulo
+from .fuerzas import BIT_CAMPO, CALCULADOS, DEPENDENCIAS, FORMAS, g
+from .rendimiento import medir
+from .vectorial import completar_columnas
+
+CAMPOS_FUERZA = ("magnitud", "angulo", "Fx", "Fy", "altura", "masa", "peso", "aceleracion", "distancia")
+
+
+def _afectados(campo):
+    # Campos que completar_datos puede calcular a partir de `campo`, directa o indirectamente
+    afectados, revisar = set(), [campo]
+    while revisar:
+        etapas = DEPENDENCIAS.get(revisar.pop(), 0)
+        for etapa, calculados in CALCULADOS.items():
+            if etapas & etapa:
+                nuevos = set(calculados) - afectados
+                afectados |= nuevos
+                revisar.extend(nuevos)
+    afectados.discard(campo)
+    return tuple(sorted(afectados))
+
+
+# Campos de una fuerza que admiten incertidumbre y los que completar_datos deriva de cada uno. Las
+# fuerzas suelen llegar ya completadas, así que los derivados se borran en cada muestra para que se
+# vuelvan a calcular con el valor muestreado.
+DERIVADOS = {campo: _afectados(campo) for campo in CAMPOS_FUERZA}
+CAMPOS_CUERPO = ("masa", "aceleracion_deseada", "tension", "angulo_fuerza_faltante")
+ANGULOS = ("angulo", "cuerpo_angulo", "cuerpo_fuerza_faltante_ang")
+
+ELEMENTOS_POR_BLOQUE = 500_000  # muestras × fuerzas por bloque (unos 40 MB en columnas float64)
+PUNTOS_CUANTIL = 1001             # cuantiles que se guardan de cada bloque
+MAX_BLOQUES_CUANTIL = 64          # al pasar de aquí los cuantiles guardados se fusionan en uno
+_REJILLA = np.linspace(0.0, 1.0, PUNTOS_CUANTIL)
+
+
+def _muestrear(rng, valor, incertidumbre, n, quien, campo):
+    # σ (número) alrededor del valor, o (mínimo, máximo) uniforme
+    if isinstance(incertidumbre, (tuple, list)):
+        minimo, maximo = incertidumbre
+        if not minimo <= maximo:
+            raise ValueError(f"{quien}: el rango de '{campo}' debe ir de menor a mayor.")
+        return rng.uniform(minimo, maximo, n)
+    if valor is None:
+        raise ValueError(f"{quien}: '{campo}' tiene σ pero no valor; usa un rango (mínimo, máximo).")
+    if incertidumbre < 0:
+        raise ValueError(f"{quien}: la σ de '{campo}' no puede ser negativa.")
+    return valor + incertidumbre * rng.standard_normal(n)
+
+
+def _a_recalcular(f, inciertos):
+    # Campos de f que se borran antes de completar las muestras: los derivados (no los dados por el
+    # usuario) que dependen de un campo incierto y, como en FuerzaVectorial.__setattr__, la otra forma
+    # de la fuerza cuando el campo incierto tiene su pareja definida. Los campos muestreados se quedan.
+    borrar, conservar = set(), set(inciertos)
+    for campo in inciertos:
+        borrar.update(c for c in DERIVADOS[campo] if f._derivados & BIT_CAMPO.get(c, 0))
+        if campo in FORMAS and getattr(f, FORMAS[campo][0]) is not None:
+            pareja, otra_forma = FORMAS[campo]
+            conservar.add(pareja)
+            borrar.update(otra_forma)
+    return borrar - conservar
+
+
+def _revisar_campos(incertidumbres, campos, quien):
+    for campo in incertidumbres or {}:
+        if campo not in campos:
+            raise ValueError(f"{quien}: no se admite incertidumbre en '{campo}' (usa {', '.join(campos)}).")
+
+
+def _bloque(fuerzas, cuerpo, generadores, m):
+    # Resultados de m muestras: {cantidad: arreglo (m,)}; NaN donde la cantidad no está definida.
+    # generadores: {(j, campo) o ("cuerpo", campo): Generator} de cada entrada incierta
+    nf = len(fuerzas)
+    columnas = {}
+    for campo in CAMPOS_FUERZA:
+        nominal = np.array([np.nan if getattr(f, campo) is None else getattr(f, campo) for f in fuerzas], dtype=float)
+        columnas[campo] = np.tile(nominal, (m, 1))
+    columnas["trabajo"] = np.full((m, nf), np.nan)
+    for j, f in enumerate(fuerzas):
+        inciertos = f.incertidumbres or {}
+        for campo, incertidumbre in inciertos.items():
+            columnas[campo][:, j] = _muestrear(generadores[j, campo], getattr(f, campo), incertidumbre, m,
+                                               f"Fuerza '{f.nombre}'", campo)
+        for campo in _a_recalcular(f, inciertos):
+            columnas[campo][:, j] = np.nan
+    if nf:
+        completar_columnas(columnas)
+
+    def suma(col):
+        return np.nansum(col, axis=1) if nf else np.zeros(m)
+
+    con_componentes = (~(np.isnan(columnas["Fx"]) & np.isnan(columnas["Fy"]))).any(axis=1) if nf else np.zeros(m, bool)
+    suma_fx, suma_fy = suma(columnas["Fx"]), suma(columnas["Fy"])
+    magnitud = np.hypot(suma_fx, suma_fy)
+    masa_total = suma(columnas["masa"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        resultado = {
+            "magnitud": magnitud,
+            "angulo": np.where(magnitud != 0, np.degrees(np.arctan2(suma_fy, suma_fx)), 0.0),
+            "Fx": suma_fx,
+            "Fy": suma_fy,
+            "momento": suma(np.nan_to_num(columnas["Fy"]) * np.nan_to_num(columnas["altura"])),
+            "trabajo": suma(columnas["trabajo"]),
+            "aceleracion": np.where(masa_total > 0, magnitud / masa_total, np.nan),
+        }
+    for clave in ("magnitud", "angulo", "Fx", "Fy", "momento", "aceleracion"):
+        resultado[clave] = np.where(con_componentes, resultado[clave], np.nan)
+
+    if cuerpo is not None:
+        datos = {}
+        for campo in CAMPOS_CUERPO:
+            valor = getattr(cuerpo, campo)
+            incertidumbre = (cuerpo.incertidumbres or {}).get(campo)
+            if incertidumbre is not None:
+                datos[campo] = _muestrear(generadores["cuerpo", campo], valor, incertidumbre, m, "Cuerpo", campo)
+            elif valor is not None:
+                datos[campo] = np.full(m, float(valor))
+        resultado.update(_dinamica(suma_fx, suma_fy, datos, m))
+    return resultado
+
+
+def _dinamica(suma_fx, suma_fy, datos, m):
+    # CuerpoFisico.dinamica_desde_sumas para todas las muestras a la vez (claves con prefijo "cuerpo_")
+    masa = datos.get("masa")
+    tension = datos.get("tension")
+    Fx, Fy = suma_fx, suma_fy
+    if tension is not None and masa is not None:
+        Fy = tension - masa * g + suma_fy
+    magnitud = np.hypot(Fx, Fy)
+    aceleracion = np.full(m, np.nan)
+    if masa is not None:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            aceleracion = np.where(masa > 0, magnitud / masa, np.nan)
+
+    faltante_mag = faltante_ang = np.full(m, np.nan)
+    acel_deseada = datos.get("aceleracion_deseada")
+    if acel_deseada is not None and masa is not None:
+        Fx_req = masa * acel_deseada - suma_fx
+        Fy_req = -suma_fy
+        angulo = datos.get("angulo_fuerza_faltante")
+        if angulo is not None:
+            faltante_mag, _ = magnitud_con_angulo(Fx_req, Fy_req, angulo)
+            faltante_ang = angulo
+        else:
+            faltante_mag = np.hypot(Fx_req, Fy_req)
+            faltante_ang = np.where(faltante_mag != 0, np.degrees(np.arctan2(Fy_req, Fx_req)), 0.0)
+        faltante_mag = np.where(masa > 0, faltante_mag, np.nan)
+        faltante_ang = np.where(masa > 0, faltante_ang, np.nan)
+
+    return {
+        "cuerpo_magnitud": magnitud,
+        "cuerpo_angulo": np.where(magnitud != 0, np.degrees(np.arctan2(Fy, Fx)), 0.0),
+        "cuerpo_aceleracion": aceleracion,
+        "cuerpo_fuerza_faltante_mag": faltante_mag,
+        "cuerpo_fuerza_faltante_ang": faltante_ang,
+    }
+
+
+def bloques_montecarlo(fuerzas, n_muestras, cuerpo=None, semilla=None, tamano_bloque=None):
+    # Generador de dicts {cantidad: arreglo} con a lo más tamano_bloque muestras cada uno
+    fuerzas = list(fuerzas)
+    for f in fuerzas:
+        _revisar_campos(f.incertidumbres, DERIVADOS, f"Fuerza '{f.nombre}'")
+    if cuerpo is not None:
+        _revisar_campos(cuerpo.incertidumbres, CAMPOS_CUERPO, "Cuerpo")
+    if n_muestras < 1:
+        raise ValueError("n_muestras debe ser al menos 1.")
+    if tamano_bloque is None:
+        tamano_bloque = max(1, ELEMENTOS_POR_BLOQUE // max(1, len(fuerzas)))
+    if tamano_bloque < 1:
+        raise ValueError("tamano_bloque debe ser al menos 1.")
+
+    entradas = [(j, campo) for j, f in enumerate(fuerzas) for campo in f.incertidumbres or {}]
+    if cuerpo is not None:
+        entradas += [("cuerpo", campo) for campo in cuerpo.incertidumbres or {}]
+    semillas = np.random.SeedSequence(semilla).spawn(len(entradas))
+    generadores = {entrada: np.random.default_rng(s) for entrada, s in zip(entradas, semillas)}
+    restantes = n_muestras
+    while restantes:
+        m = min(tamano_bloque, restantes)
+        yield _bloque(fuerzas, cuerpo, generadores, m)
+        restantes -= m
+
+
+# ---------------- RESUMEN ----------------
+class _Resumen:
+    # Media y desviación exactas (fusión de Chan entre bloques) y cuantiles aproximados: de cada bloque
+    # se guardan PUNTOS_CUANTIL cuantiles y la distribución total es la mezcla de las de los bloques
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.cuantiles = []  # [(puntos, peso)]
+
+    def agregar(self, valores):
+        valores = valores[np.isfinite(valores)]
+        k = valores.size
+        if not k:
+            return
+        media = float(valores.mean())
+        delta = media - self.media
+        total = self.n + k
+        self.m2 += float(((valores - media) ** 2).sum()) + delta**2 * self.n * k / total
+        self.media += delta * k / total
+        self.n = total
+        self.cuantiles.append((np.quantile(valores, _REJILLA), k))
+        if len(self.cuantiles) > MAX_BLOQUES_CUANTIL:
+            self.cuantiles = [(self.cuantil(_REJILLA), self.n)]
+
+    def cuantil(self, p):
+        x = np.unique(np.concatenate([puntos for puntos, _ in self.cuantiles]))
+        acumulada = sum(peso * np.interp(x, puntos, _REJILLA) for puntos, peso in self.cuantiles) / self.n
+        return np.interp(p, acumulada, x)
+
+    def intervalo(self, nivel):
+        if not self.n:
+            return {"media": None, "desviacion": None, "inferior": None, "superior": None, "muestras": 0}
+        cola = (1 - nivel) / 2
+        inferior, superior = self.cuantil([cola, 1 - cola])
+        return {
+            "media": self.media,
+            "desviacion": (self.m2 / (self.n - 1)) ** 0.5 if self.n > 1 else 0.0,
+            "inferior": float(inferior),
+            "superior": float(superior),
+            "muestras": self.n,
+        }
+
+
+@medir("montecarlo")
+def montecarlo(fuerzas, n_muestras, cuerpo=None, nivel=0.95, semilla=None, tamano_bloque=None):
+    # {cantidad: {"media", "desviacion", "inferior", "superior", "muestras"}} con el intervalo central
+    # de probabilidad `nivel`. "muestras" cuenta solo aquellas en que la cantidad está definida.
+    # Los ángulos se resumen alrededor de la dirección media del primer bloque, para que un intervalo
+    # que cruza ±180° no se parta en dos.
+    if not 0 < nivel < 1:
+        raise ValueError("nivel debe estar entre 0 y 1.")
+    resumenes = {}
+    centros = {}
+    for bloque in bloques_montecarlo(fuerzas, n_muestras, cuerpo, semilla, tamano_bloque):
+        for cantidad, valores in bloque.items():
+            if cantidad in ANGULOS:
+                if cantidad not in centros:
+                    rad = np.radians(valores[np.isfinite(valores)])
+                    centros[cantidad] = float(np.degrees(np.arctan2(np.sin(rad).sum(), np.cos(rad).sum())))
+                valores = centros[cantidad] + (valores - centros[cantidad] + 180.0) % 360.0 - 180.0
+            resumenes.setdefault(cantidad, _Resumen()).agregar(valores)
+    return {cantidad: resumen.intervalo(nivel) for cantidad, resumen in resumenes.items()}
@@ -0,0 +1,263 @@
+# Resolución por lotes sin interfaz:
+#   python -m fisica.lotes problemas.jsonl resultados.jsonl [--lote 1000]
+#
+# Cada fila de entrada es un problema: "fuerzas" (lista de fuerzas con los mismos campos que
+# FuerzaVectorial; en CSV va como texto JSON) y, opcionalmente, los datos del cuerpo en las
+# columnas masa, peso, aceleracion_deseada, tension y angulo_fuerza_faltante.
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+
+from .cache import CacheResultados
+from .calculo import CuerpoFisico, calcular_resultante
+from .fuerzas import FuerzaVectorial
+from .rendimiento import Perfil, activar, etapa, medir, texto_resumen
+
+CAMPOS_FUERZA = ("nombre", "magnitud", "angulo", "Fx", "Fy", "altura", "masa",
+                 "aceleracion", "peso", "distancia")
+CAMPOS_CUERPO = ("masa", "peso", "aceleracion_deseada", "tension", "angulo_fuerza_faltante")
+# Errores de una fila mal formada; se informan en su columna "error" y el lote sigue. OverflowError
+# (ArithmeticError) sale, por ejemplo, de un entero JSON demasiado grande para un float.
+ERRORES_FILA = (ValueError, TypeError, AttributeError, ArithmeticError)
+
+COLUMNAS_SALIDA = (
+    "id", "error",
+    "magnitud", "angulo", "Fx", "Fy", "momento", "masa_total", "peso_total", "trabajo_total", "aceleracion",
+    "cuerpo_tipo", "cuerpo_magnitud", "cuerpo_angulo", "cuerpo_Fx", "cuerpo_Fy", "cuerpo_momento",
+    "cuerpo_trabajo", "cuerpo_aceleracion", "cuerpo_fuerza_faltante_mag", "cuerpo_fuerza_faltante_ang",
+    "cuerpo_inconsistencia_angulo",
+)
+
+
+def _numero(valor):
+    # Celdas vacías (CSV) o nulas (JSON/Parquet) cuentan como dato faltante
+    if valor is None or (isinstance(valor, str) and valor.strip() == ""):
+        return None
+    return float(valor)
+
+
+# ---------------- LECTURA ----------------
+def _leer_csv(ruta):
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        yield from csv.DictReader(archivo)
+
+
+def _leer_jsonl(ruta):
+    with open(ruta, encoding="utf-8") as archivo:
+        for linea in archivo:
+            if linea.strip():
+                yield json.loads(linea)
+
+
+def _leer_parquet(ruta, tamano_lote):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError("Para leer Parquet instala pyarrow.") from e
+    for bloque in pq.ParquetFile(ruta).iter_batches(batch_size=tamano_lote):
+        yield from bloque.to_pylist()
+
+
+def leer_problemas(ruta, tamano_lote=1000):
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".csv":
+        return _leer_csv(ruta)
+    if extension in (".jsonl", ".ndjson"):
+        return _leer_jsonl(ruta)
+    if extension == ".parquet":
+        return _leer_parquet(ruta, tamano_lote)
+    raise ValueError(f"Formato de entrada no soportado: '{extension}' (usa .csv, .jsonl o .parquet).")
+
+
+# ---------------- RESOLUCIÓN ----------------
+def fuerzas_de_fila(fila):
+    fuerzas_fila = fila.get("fuerzas") or []
+    if isinstance(fuerzas_fila, str):
+        fuerzas_fila = json.loads(fuerzas_fila)
+
+    fuerzas = []
+    for datos in fuerzas_fila:
+        campos = {c: _numero(datos.get(c)) for c in CAMPOS_FUERZA if c != "nombre"}
+        if campos["altura"] is None:
+            campos["altura"] = 0.0
+        fuerzas.append(FuerzaVectorial(nombre=datos.get("nombre"), **campos))
+    return fuerzas
+
+
+def cuerpo_de_fila(fila):
+    # Datos del cuerpo de la fila, o None si no trae ninguno
+    datos_cuerpo = {c: _numero(fila.get(c)) for c in CAMPOS_CUERPO}
+    if any(v is not None for v in datos_cuerpo.values()):
+        return CuerpoFisico(**datos_cuerpo)
+    return None
+
+
+def _resultado_resultante(resultante):
+    magnitud, angulo, (Fx, Fy), momento, masa_total, peso_total, trabajo_total, aceleracion = resultante
+    return {
+        "magnitud": magnitud, "angulo": angulo, "Fx": Fx, "Fy": Fy, "momento": momento,
+        "masa_total": masa_total, "peso_total": peso_total, "trabajo_total": trabajo_total,
+        "aceleracion": aceleracion,
+    }
+
+
+def _agregar_dinamica(resultado, dinamica):
+    for clave, valor in dinamica.items():
+        resultado[f"cuerpo_{clave}"] = valor
+    return resultado
+
+
+@medir("resolver_problema")
+def resolver_problema(fila, cache=None):
+    fuerzas = fuerzas_de_fila(fila)
+    resultante = cache.resultante(fuerzas) if cache is not None else calcular_resultante(fuerzas)
+    resultado = _resultado_resultante(resultante)
+
+    cuerpo = cuerpo_de_fila(fila)
+    if cuerpo is not None:
+        for f in fuerzas:
+            cuerpo.agregar_fuerza(f)
+        dinamica = cache.dinamica(cuerpo) if cache is not None else cuerpo.calcular_dinamica()
+        _agregar_dinamica(resultado, dinamica)
+    return resultado
+
+
+@medir("resolver_problemas_juntos")
+def resolver_problemas_juntos(filas):
+    # Misma salida que resolver_problema para cada fila (con "error" si la fila no es válida),
+    # pero con todas las fuerzas de todas las filas completadas y sumadas en una sola pasada NumPy
+    from .vectorial import SistemaFuerzas, resultantes_de_sumas
+
+    fuerzas, grupos, cuerpos, resultados = [], [], [], []
+    for i, fila in enumerate(filas):
+        try:
+            propias = fuerzas_de_fila(fila)
+            cuerpo = cuerpo_de_fila(fila)
+        except ERRORES_FILA as e:
+            resultados.append({"error": f"{type(e).__name__}: {e}"})
+            continue
+        fuerzas.extend(propias)
+        grupos.extend([len(cuerpos)] * len(propias))
+        cuerpos.append((i, cuerpo))
+        resultados.append(None)
+
+    sistema = SistemaFuerzas.desde_fuerzas(fuerzas).completar()
+    sumas = sistema.sumas_por_grupo(grupos, len(cuerpos))
+    # La dinámica usa las sumas tal cual, como calcular_dinamica: la tupla de la resultante pone en cero
+    # el momento y el trabajo de los grupos sin componentes
+    _, sumas_fx, sumas_fy, momentos, _, _, trabajos = (columna.tolist() for columna in sumas)
+    for (i, cuerpo), resultante, fx, fy, momento, trabajo in zip(cuerpos, resultantes_de_sumas(sumas), sumas_fx,
+                                                                   sumas_fy, momentos, trabajos):
+        resultado = _resultado_resultante(resultante)
+        if cuerpo is not None:
+            try:
+                dinamica = cuerpo.dinamica_desde_sumas(fx, fy, momento, trabajo)
+            except ERRORES_FILA as e:  # p. ej. OverflowError con sumas enormes; solo falla esta fila
+                resultado = {"error": f"{type(e).__name__}: {e}"}
+            else:
+                _agregar_dinamica(resultado, dinamica)
+        resultados[i] = resultado
+    return resultados
+
+
+def resolver_lotes(filas, tamano_lote=1000, cache=None):
+    # Genera listas de resultados de a lo más tamano_lote problemas; memoria acotada por lote
+    filas = iter(filas)
+    indice = 0
+    while True:
+        lote = list(islice(filas, tamano_lote))
+        if not lote:
+            return
+        resultados = []
+        for fila in lote:
+            id_problema = fila.get("id") if isinstance(fila, dict) else None
+            if id_problema is None or id_problema == "":
+                id_problema = indice
+            indice += 1
+            try:
+                resultado = resolver_problema(fila, cache)
+            except ERRORES_FILA as e:
+                resultado = {"error": f"{type(e).__name__}: {e}"}
+            resultados.append({"id": id_problema, **resultado})
+        yield resultados
+
+
+# ---------------- ESCRITURA ----------------
+class _EscritorJSONL:
+    def __init__(self, archivo):
+        self.archivo = archivo
+
+    def escribir(self, resultados):
+        for r in resultados:
+            self.archivo.write(json.dumps(r, ensure_ascii=False) + "\n")
+
+
+class _EscritorCSV:
+    def __init__(self, archivo):
+        self.escritor = csv.DictWriter(archivo, fieldnames=COLUMNAS_SALIDA)
+        self.escritor.writeheader()
+
+    def escribir(self, resultados):
+        self.escritor.writerows(resultados)
+
+
+def resolver_archivo(entrada, salida, tamano_lote=1000, cache=None):
+    # Devuelve (problemas resueltos, segundos)
+    extension = os.path.splitext(salida)[1].lower()
+    if extension not in (".csv", ".jsonl", ".ndjson"):
+        raise ValueError(f"Formato de salida no soportado: '{extension}' (usa .csv o .jsonl).")
+
+    inicio = time.perf_counter()
+    total = 0
+    with open(salida, "w", newline="", encoding="utf-8") as archivo:
+        escritor = _EscritorCSV(archivo) if extension == ".csv" else _EscritorJSONL(archivo)
+        for resultados in resolver_lotes(leer_problemas(entrada, tamano_lote), tamano_lote, cache):
+            with etapa("escritura"):
+                escritor.escribir(resultados)
+            total += len(resultados)
+    return total, time.perf_counter() - inicio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m fisica.lotes",
+                                     description="Resuelve sistemas de fuerzas por lotes (CSV, JSONL o Parquet).")
+    parser.add_argument("entrada", help="archivo de problemas (.csv, .jsonl o .parquet)")
+    parser.add_argument("salida", help="archivo de resultados (.csv o .jsonl)")
+    parser.add_argument("--lote", type=int, default=1000, help="problemas por lote (default: 1000)")
+    parser.add_argument("--cache", metavar="RUTA",
+                        help="caché SQLite de resultados, compartida entre ejecuciones")
+    parser.add_argument("--perfil", metavar="RUTA",
+                        help="guarda un perfil cProfile en RUTA y muestra los tiempos por etapa")
+    args = parser.parse_args(argv)
+    if args.lote < 1:
+        parser.error("--lote debe ser al menos 1")
+
+    cache = CacheResultados(args.cache, confirmar_cada=args.lote) if args.cache else None
+    perfil = None
+    if args.perfil:
+        activar()
+        perfil = Perfil().iniciar()
+    try:
+        total, segundos = resolver_archivo(args.entrada, args.salida, args.lote, cache)
+    except (OSError, RuntimeError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if perfil is not None:
+            perfil.detener()
+            perfil.volcar(args.perfil)
+            print(texto_resumen(), file=sys.stderr)
+        if cache is not None:
+            print(cache.texto_estadisticas(), file=sys.stderr)
+            cache.cerrar()
+    velocidad = total / segundos if segundos > 0 else float("inf")
+    print(f"{total} problemas en {segundos:.2f} s ({velocidad:.0f} problemas/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+# Ejecución de CuerpoFisico.calcular_dinamica en varios procesos.
+# Cada cuerpo viaja como una tupla de números (ver empaquetar_cuerpo), no como objetos.
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .calculo import CuerpoFisico
+from .fuerzas import FuerzaVectorial
+
+CAMPOS_FUERZA = ("magnitud", "angulo", "Fx", "Fy", "altura", "masa", "aceleracion", "peso", "distancia")
+
+
+def empaquetar_cuerpo(cuerpo):
+    # (masa, peso, aceleracion_deseada, tension, angulo_fuerza_faltante, ((magnitud, angulo, ...), ...))
+    fuerzas = tuple(tuple(getattr(f, c) for c in CAMPOS_FUERZA) for f in cuerpo.fuerzas_aplicadas)
+    return (cuerpo.masa, cuerpo.peso, cuerpo.aceleracion_deseada, cuerpo.tension,
+            cuerpo.angulo_fuerza_faltante, fuerzas)
+
+
+def desempaquetar_cuerpo(paquete):
+    masa, peso, aceleracion_deseada, tension, angulo_fuerza_faltante, fuerzas = paquete
+    cuerpo = CuerpoFisico(masa=masa, peso=peso, aceleracion_deseada=aceleracion_deseada,
+                          tension=tension, angulo_fuerza_faltante=angulo_fuerza_faltante)
+    for valores in fuerzas:
+        cuerpo.agregar_fuerza(FuerzaVectorial(**dict(zip(CAMPOS_FUERZA, valores))))
+    return cuerpo
+
+
+def _resolver_fragmento(paquetes):
+    return [desempaquetar_cuerpo(p).calcular_dinamica() for p in paquetes]
+
+
+def calcular_dinamica_paralelo(cuerpos, trabajadores=None, tamano_fragmento=1000):
+    # Generador: devuelve los resultados de calcular_dinamica en el mismo orden que los cuerpos.
+    # Acepta CuerpoFisico o paquetes ya armados; mantiene como máximo 2 fragmentos por
+    # trabajador en vuelo, así la memoria no depende del número total de cuerpos.
+    trabajadores = trabajadores or os.cpu_count() or 1
+    if tamano_fragmento < 1:
+        raise ValueError("tamano_fragmento debe ser al menos 1.")
+    paquetes = (c if isinstance(c, tuple) else empaquetar_cuerpo(c) for c in cuerpos)
+    fragmentos = iter(lambda: list(islice(paquetes, tamano_fragmento)), [])
+
+    if trabajadores == 1:
+        for fragmento in fragmentos:
+            yield from _resolver_fragmento(fragmento)
+        return
+
+    with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+        en_vuelo = deque()
+        for fragmento in fragmentos:
+            en_vuelo.append(pool.submit(_resolver_fragmento, fragmento))
+            if len(en_vuelo) >= 2 * trabajadores:
+                yield from en_vuelo.popleft().result()
+        while en_vuelo:
+            yield from en_vuelo.popleft().result()
@@ -0,0 +1,177 @@
+# Instrumentación: tiempo y número de llamadas por etapa, más perfilado opcional con cProfile.
+# Desactivada por defecto; así solo cuesta revisar una bandera por llamada.
+# La bandera y las estadísticas son las de la Medicion del contexto actual (hilo o tarea). La interfaz
+# instala una por sesión con usar(); fuera de ella (scripts, lotes) se usa una global.
+#
+#   with etapa("grafica"): ...          # bloque
+#   @medir("calcular_resultante")       # función
+#   cronometro.marcar("sección")        # secciones consecutivas de un script
+#   with Perfil() as p: ...; p.volcar("rerun.prof")
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from functools import wraps
+
+_NULO = nullcontext()
+
+
+class Medicion:
+    __slots__ = ("activa", "estadisticas")
+
+    def __init__(self):
+        self.activa = False
+        self.estadisticas = {}  # nombre -> [llamadas, segundos]
+
+
+_medicion = ContextVar("medicion", default=Medicion())
+
+
+def usar(medicion):
+    # La medición del contexto actual pasa a ser `medicion`; la devuelve
+    _medicion.set(medicion)
+    return medicion
+
+
+def activar(valor=True):
+    _medicion.get().activa = bool(valor)
+
+
+def activo():
+    return _medicion.get().activa
+
+
+def reiniciar():
+    _medicion.get().estadisticas.clear()
+
+
+def registrar(nombre, segundos):
+    estadisticas = _medicion.get().estadisticas
+    datos = estadisticas.get(nombre)
+    if datos is None:
+        estadisticas[nombre] = [1, segundos]
+    else:
+        datos[0] += 1
+        datos[1] += segundos
+
+
+class _Etapa:
+    __slots__ = ("nombre", "inicio")
+
+    def __init__(self, nombre):
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        registrar(self.nombre, time.perf_counter() - self.inicio)
+        return False
+
+
+def etapa(nombre):
+    return _Etapa(nombre) if _medicion.get().activa else _NULO
+
+
+def medir(nombre=None):
+    def decorador(funcion):
+        etiqueta = nombre or funcion.__qualname__
+
+        @wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not _medicion.get().activa:
+                return funcion(*args, **kwargs)
+            inicio = time.perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                registrar(etiqueta, time.perf_counter() - inicio)
+        return envoltura
+    return decorador
+
+
+def resumen():
+    # [(nombre, llamadas, total_ms, ms_por_llamada)] de mayor a menor tiempo total.
+    # Los tiempos son inclusivos: una etapa anidada también cuenta en la que la contiene.
+    filas = [(nombre, n, s * 1000, s * 1000 / n) for nombre, (n, s) in _medicion.get().estadisticas.items()]
+    return sorted(filas, key=lambda fila: fila[2], reverse=True)
+
+
+class Cronometro:
+    # Mide secciones consecutivas de un script: marcar() cierra la sección anterior y abre la siguiente
+    def __init__(self):
+        self.nombre = None
+        self.inicio = None
+
+    def marcar(self, nombre=None):
+        if not _medicion.get().activa:
+            return
+        ahora = time.perf_counter()
+        if self.nombre is not None:
+            registrar(self.nombre, ahora - self.inicio)
+        self.nombre, self.inicio = nombre, ahora
+
+
+def texto_resumen():
+    lineas = [f"{'etapa':<32}{'llamadas':>10}{'total (ms)':>12}{'ms/llamada':>12}"]
+    for nombre, n, total, media in resumen():
+        lineas.append(f"{nombre:<32}{n:>10}{total:>12.2f}{media:>12.4f}")
+    return "\n".join(lineas)
+
+
+# ---------------- PERFILADO ----------------
+def _nombre_funcion(clave):
+    archivo, linea, funcion = clave
+    return funcion if archivo == "~" else f"{funcion} ({archivo.rsplit('/', 1)[-1]}:{linea})"
+
+
+class Perfil:
+    def __init__(self):
+        import cProfile
+        self._perfil = cProfile.Profile()
+
+    def iniciar(self):
+        self._perfil.enable()
+        return self
+
+    def detener(self):
+        self._perfil.disable()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.detener()
+        return False
+
+    def _estadisticas(self):
+        import pstats
+        return pstats.Stats(self._perfil)
+
+    def volcar(self, ruta):
+        # Formato de cProfile/pstats (snakeviz, gprof2dot, flameprof...)
+        self._perfil.dump_stats(ruta)
+
+    def contenido(self):
+        import marshal
+        return marshal.dumps(self._estadisticas().stats)
+
+    def texto(self, n=30, orden="cumulative"):
+        import io
+        salida = io.StringIO()
+        estadisticas = self._estadisticas()
+        estadisticas.stream = salida
+        estadisticas.sort_stats(orden).print_stats(n)
+        return salida.getvalue()
+
+    def colapsado(self):
+        # Pilas "llamador;llamada microsegundos" para flamegraph.pl / speedscope.
+        # cProfile solo conoce pares llamador-llamada, así que las pilas tienen dos niveles.
+        lineas = []
+        for clave, (_, _, propio, _, llamadores) in self._estadisticas().stats.items():
+            nombre = _nombre_funcion(clave)
+            if not llamadores:
+                lineas.append(f"{nombre} {int(propio * 1e6)}")
+            for llamador, (_, _, propio_desde, _) in llamadores.items():
+                lineas.append(f"{_nombre_funcion(llamador)};{nombre} {int(propio_desde * 1e6)}")
+        return "\n".join(lineas) + "\n"
@@ -0,0 +1,284 @@
+# Servicio HTTP/JSON (asyncio, sin dependencias extra) para resolver problemas desde otras herramientas:
+#   python -m fisica.servidor [--puerto 8000] [--trabajadores N] [--max-cola 10000] [--max-lote 1024]
+#
+#   POST /resolver   un problema (mismos campos que una fila de fisica.lotes) o {"problemas": [...]}
+#   GET  /metricas   contadores, tamaño medio de lote, latencia p50/p99 y problemas por segundo
+#   GET  /salud
+#
+# Cada problema entra a una cola acotada. Mientras los trabajadores están ocupados la cola crece y
+# el siguiente lote se lleva todo lo acumulado (hasta max_lote) para resolverlo en una sola pasada
+# vectorizada (resolver_problemas_juntos). Si la cola no tiene lugar la respuesta es 503 con Retry-After.
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .lotes import resolver_problemas_juntos
+
+MAX_CUERPO = 16 * 1024 * 1024  # bytes por solicitud
+VENTANA_METRICAS = 10.0  # segundos para el caudal "reciente"
+
+RAZONES = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+def percentil(valores, p):
+    # Percentil p (0-100) por el método del rango más cercano; None si no hay valores
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    return ordenados[max(0, math.ceil(p / 100 * len(ordenados)) - 1)]
+
+
+# ---------------- MÉTRICAS ----------------
+class Metricas:
+    def __init__(self, max_muestras=10_000):
+        self.inicio = time.monotonic()
+        self.solicitudes = 0
+        self.problemas = 0
+        self.rechazadas = 0
+        self.errores = 0
+        self.lotes = 0
+        self.latencias = deque(maxlen=max_muestras)  # (fin, segundos) por solicitud resuelta
+        self.resueltos = deque()  # (fin, problemas) de los lotes en la ventana reciente
+
+    def registrar_solicitud(self, segundos):
+        self.latencias.append((time.monotonic(), segundos))
+
+    def registrar_lote(self, n):
+        ahora = time.monotonic()
+        self.lotes += 1
+        self.problemas += n
+        self.resueltos.append((ahora, n))
+        while self.resueltos and ahora - self.resueltos[0][0] > VENTANA_METRICAS:
+            self.resueltos.popleft()
+
+    def instantanea(self, en_cola=0):
+        ahora = time.monotonic()
+        segundos = [s for _, s in self.latencias]
+        recientes = sum(n for fin, n in self.resueltos if ahora - fin <= VENTANA_METRICAS)
+        activo = min(VENTANA_METRICAS, ahora - self.inicio) or 1.0
+
+        def ms(valor):
+            return None if valor is None else round(valor * 1000, 3)
+
+        return {
+            "solicitudes": self.solicitudes,
+            "problemas": self.problemas,
+            "rechazadas": self.rechazadas,
+            "errores": self.errores,
+            "lotes": self.lotes,
+            "tamano_medio_lote": self.problemas / self.lotes if self.lotes else 0.0,
+            "en_cola": en_cola,
+            "latencia_p50_ms": ms(percentil(segundos, 50)),
+            "latencia_p99_ms": ms(percentil(segundos, 99)),
+            "problemas_por_segundo": recientes / activo,
+        }
+
+
+# ---------------- SERVIDOR ----------------
+class Servidor:
+    def __init__(self, host="127.0.0.1", puerto=8000, trabajadores=None, max_cola=10_000, max_lote=1024,
+                 espera_lote=0.0, lotes_en_vuelo=None):
+        # trabajadores: procesos para resolver los lotes (0 = un hilo, útil para depurar);
+        # espera_lote: segundos que se espera a juntar más problemas antes de enviar un lote
+        self.host = host
+        self.puerto = puerto
+        self.trabajadores = (os.cpu_count() or 1) if trabajadores is None else trabajadores
+        self.max_lote = max_lote
+        self.espera_lote = espera_lote
+        self.lotes_en_vuelo = lotes_en_vuelo or 2 * max(1, self.trabajadores)
+        self.max_cola = max_cola
+        self.metricas = Metricas()
+        self._cola = None
+        self._libres = None
+        self._pool = None
+        self._servidor = None
+        self._tareas = set()
+
+    async def iniciar(self):
+        self._cola = asyncio.Queue(maxsize=self.max_cola)
+        self._libres = asyncio.Semaphore(self.lotes_en_vuelo)
+        if self.trabajadores:
+            self._pool = ProcessPoolExecutor(max_workers=self.trabajadores)
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=1)
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.puerto)
+        self.puerto = self._servidor.sockets[0].getsockname()[1]  # el real si se pidió el 0
+        self._lanzar(self._agrupar())
+        return self
+
+    async def cerrar(self):
+        self._servidor.close()
+        await self._servidor.wait_closed()
+        for tarea in list(self._tareas):
+            tarea.cancel()
+        await asyncio.gather(*self._tareas, return_exceptions=True)
+        self._pool.shutdown(cancel_futures=True)
+
+    def _lanzar(self, corrutina):
+        tarea = asyncio.create_task(corrutina)
+        self._tareas.add(tarea)
+        tarea.add_done_callback(self._tareas.discard)
+        return tarea
+
+    # ---- Cola y lotes ----
+    async def resolver(self, problemas):
+        # Lista de resultados en el mismo orden, o None si la cola no tiene lugar para todos
+        if self._cola.maxsize - self._cola.qsize() < len(problemas):
+            self.metricas.rechazadas += 1
+            return None
+        loop = asyncio.get_running_loop()
+        futuros = []
+        for fila in problemas:
+            futuro = loop.create_future()
+            self._cola.put_nowait((fila, futuro))
+            futuros.append(futuro)
+        return await asyncio.gather(*futuros)
+
+    async def _agrupar(self):
+        while True:
+            # Primero un lugar libre: mientras se espera, la cola acumula el siguiente lote
+            await self._libres.acquire()
+            lote = [await self._cola.get()]
+            if self.espera_lote:
+                await asyncio.sleep(self.espera_lote)
+            while len(lote) < self.max_lote and not self._cola.empty():
+                lote.append(self._cola.get_nowait())
+            self._lanzar(self._ejecutar(lote))
+
+    async def _ejecutar(self, lote):
+        try:
+            filas = [fila for fila, _ in lote]
+            resultados = await asyncio.get_running_loop().run_in_executor(
+                self._pool, resolver_problemas_juntos, filas)
+        except Exception as e:  # fallo del lote en sí (no de una fila, esas vuelven con "error")
+            for _, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(e)
+        else:
+            self.metricas.registrar_lote(len(lote))
+            for (_, futuro), resultado in zip(lote, resultados):
+                if not futuro.done():
+                    futuro.set_result(resultado)
+        finally:
+            self._libres.release()
+
+    # ---- HTTP ----
+    async def _despachar(self, metodo, ruta, cuerpo):
+        # (estado, datos JSON, cabeceras extra)
+        ruta = ruta.split("?", 1)[0]
+        if ruta == "/salud":
+            return 200, {"estado": "ok"}, {}
+        if ruta == "/metricas":
+            return 200, self.metricas.instantanea(self._cola.qsize()), {}
+        if ruta != "/resolver":
+            return 404, {"error": f"Ruta desconocida: {ruta}"}, {}
+        if metodo != "POST":
+            return 405, {"error": "Usa POST en /resolver."}, {"Allow": "POST"}
+
+        try:
+            datos = json.loads(cuerpo or b"null")
+        except ValueError as e:
+            return 400, {"error": f"JSON inválido: {e}"}, {}
+        varios = isinstance(datos, dict) and "problemas" in datos
+        problemas = datos["problemas"] if varios else [datos]
+        if not isinstance(problemas, list) or not all(isinstance(p, dict) for p in problemas):
+            return 400, {"error": "Se espera un problema (objeto JSON) o {\"problemas\": [...]}."}, {}
+        if len(problemas) > self.max_cola:
+            return 413, {"error": f"A lo más {self.max_cola} problemas por solicitud."}, {}
+
+        resultados = await self.resolver(problemas)
+        if resultados is None:
+            return 503, {"error": "Servidor saturado, intenta de nuevo."}, {"Retry-After": "1"}
+        return 200, ({"resultados": resultados} if varios else resultados[0]), {}
+
+    async def _atender(self, lector, escritor):
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                metodo, ruta, _ = linea.decode("latin-1").split(" ", 2)
+                cabeceras = {}
+                while True:
+                    linea = await lector.readline()
+                    if linea in (b"\r\n", b"\n", b""):
+                        break
+                    nombre, _, valor = linea.decode("latin-1").partition(":")
+                    cabeceras[nombre.strip().lower()] = valor.strip()
+
+                largo = int(cabeceras.get("content-length", 0))
+                if largo > MAX_CUERPO:
+                    await self._responder(escritor, 413, {"error": "Solicitud demasiado grande."}, {}, False)
+                    break
+                cuerpo = await lector.readexactly(largo) if largo else b""
+
+                inicio = time.perf_counter()
+                self.metricas.solicitudes += 1
+                try:
+                    estado, datos, extra = await self._despachar(metodo, ruta, cuerpo)
+                except Exception as e:
+                    self.metricas.errores += 1
+                    estado, datos, extra = 500, {"error": f"{type(e).__name__}: {e}"}, {}
+                if estado == 200 and ruta.startswith("/resolver"):
+                    self.metricas.registrar_solicitud(time.perf_counter() - inicio)
+
+                seguir = cabeceras.get("connection", "").lower() != "close"
+                await self._responder(escritor, estado, datos, extra, seguir)
+                if not seguir:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            escritor.close()
+
+    @staticmethod
+    async def _responder(escritor, estado, datos, extra, seguir):
+        cuerpo = json.dumps(datos, ensure_ascii=False).encode()
+        cabeceras = {"Content-Type": "application/json; charset=utf-8", "Content-Length": str(len(cuerpo)),
+                     "Connection": "keep-alive" if seguir else "close", **extra}
+        encabezado = f"HTTP/1.1 {estado} {RAZONES[estado]}\r\n" + "".join(
+            f"{k}: {v}\r\n" for k, v in cabeceras.items()) + "\r\n"
+        escritor.write(encabezado.encode("latin-1") + cuerpo)
+        await escritor.drain()  # contrapresión: no se leen más solicitudes de un cliente lento
+
+
+async def servir(**opciones):
+    servidor = await Servidor(**opciones).iniciar()
+    print(f"Escuchando en http://{servidor.host}:{servidor.puerto} "
+          f"({servidor.trabajadores} trabajadores, cola de {servidor.max_cola})", file=sys.stderr, flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await servidor.cerrar()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m fisica.servidor",
+                                     description="Servicio HTTP/JSON que resuelve sistemas de fuerzas por lotes.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8000)
+    parser.add_argument("--trabajadores", type=int, help="procesos para los lotes (default: CPUs; 0 = un hilo)")
+    parser.add_argument("--max-cola", type=int, default=10_000, help="problemas en espera antes de responder 503")
+    parser.add_argument("--max-lote", type=int, default=1024, help="problemas por lote vectorizado")
+    parser.add_argument("--espera-lote", type=float, default=0.0,
+                        help="segundos que se espera a juntar un lote (default: 0, solo lo acumulado)")
+    args = parser.parse_args(argv)
+    if args.max_cola < 1 or args.max_lote < 1:
+        parser.error("--max-cola y --max-lote deben ser al menos 1")
+    try:
+        asyncio.run(servir(host=args.host, puerto=args.puerto, trabajadores=args.trabajadores,
+                           max_cola=args.max_cola, max_lote=args.max_lote, espera_lote=args.espera_lote))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
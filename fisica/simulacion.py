@@ -0,0 +1,110 @@
+# Integración en el tiempo de posición y velocidad para uno o muchos cuerpos (requiere NumPy).
+# El estado vive en arreglos (n, 2), así que todos los cuerpos avanzan en un solo paso vectorizado.
+import numpy as np
+
+INTEGRADORES = ("euler", "verlet", "rk4")
+
+
+def tabla_fuerzas(tiempos, valores):
+    # Fuerza muestreada en el tiempo con interpolación lineal (constante fuera del rango).
+    # valores: (k, 2) para la misma fuerza en todos los cuerpos, o (k, n, 2) por cuerpo.
+    tiempos = np.asarray(tiempos, dtype=float)
+    valores = np.asarray(valores, dtype=float)
+    if tiempos.ndim != 1 or valores.shape[0] != tiempos.size or valores.shape[-1] != 2:
+        raise ValueError("La tabla de fuerzas debe tener forma (k, 2) o (k, n, 2) con k tiempos.")
+    if np.any(np.diff(tiempos) <= 0):
+        raise ValueError("Los tiempos de la tabla deben ser crecientes.")
+
+    def fuerza(t, posiciones, velocidades):
+        i = int(np.clip(np.searchsorted(tiempos, t, side="right") - 1, 0, tiempos.size - 1))
+        if i == tiempos.size - 1 or t <= tiempos[0]:
+            return valores[i]
+        w = (t - tiempos[i]) / (tiempos[i + 1] - tiempos[i])
+        return (1 - w) * valores[i] + w * valores[i + 1]
+
+    return fuerza
+
+
+class Simulacion:
+    def __init__(self, masas, posiciones=None, velocidades=None, fuerza=None, integrador="verlet"):
+        # fuerza: None, un vector/arreglo constante (2,) o (n, 2), o una función
+        # fuerza(t, posiciones, velocidades) -> (n, 2) o (2,) con la fuerza neta en N
+        self.masas = np.atleast_1d(np.asarray(masas, dtype=float))
+        n = self.masas.size
+        if np.any(~(self.masas > 0)):
+            raise ValueError("Todas las masas deben ser mayores que cero.")
+        if integrador not in INTEGRADORES:
+            raise ValueError(f"Integrador desconocido: '{integrador}' (usa {', '.join(INTEGRADORES)}).")
+        self.posiciones = np.zeros((n, 2)) if posiciones is None else np.array(posiciones, dtype=float).reshape(n, 2)
+        self.velocidades = np.zeros((n, 2)) if velocidades is None else np.array(velocidades, dtype=float).reshape(n, 2)
+        self.t = 0.0
+        self.integrador = integrador
+
+        if fuerza is None:
+            fuerza = np.zeros(2)
+        if callable(fuerza):
+            self._fuerza = fuerza
+        else:
+            constante = np.broadcast_to(np.asarray(fuerza, dtype=float), (n, 2))
+            self._fuerza = lambda t, posiciones, velocidades: constante
+        self._acel_previa = None  # velocity Verlet reutiliza la aceleración del paso anterior
+
+    @classmethod
+    def desde_cuerpos(cls, cuerpos, fuerza_extra=None, **kwargs):
+        # Fuerza neta constante de cada cuerpo según calcular_dinamica (incluye tensión y peso
+        # en el caso grúa) más una fuerza opcional que puede variar en el tiempo
+        cuerpos = list(cuerpos)
+        masas = []
+        netas = np.empty((len(cuerpos), 2))
+        for i, cuerpo in enumerate(cuerpos):
+            resultado = cuerpo.calcular_dinamica()
+            masas.append(cuerpo.masa if cuerpo.masa is not None else np.nan)
+            netas[i] = resultado["Fx"], resultado["Fy"]
+
+        if fuerza_extra is None:
+            fuerza = netas
+        elif callable(fuerza_extra):
+            def fuerza(t, posiciones, velocidades):
+                return netas + fuerza_extra(t, posiciones, velocidades)
+        else:
+            fuerza = netas + np.asarray(fuerza_extra, dtype=float)
+        return cls(masas, fuerza=fuerza, **kwargs)
+
+    def _aceleracion(self, t, posiciones, velocidades):
+        return np.asarray(self._fuerza(t, posiciones, velocidades), dtype=float) / self.masas[:, None]
+
+    def paso(self, dt):
+        t, x, v = self.t, self.posiciones, self.velocidades
+        if self.integrador == "euler":
+            a = self._aceleracion(t, x, v)
+            x += v * dt
+            v += a * dt
+        elif self.integrador == "verlet":
+            # Para fuerzas que dependen de la velocidad se evalúa con la velocidad del paso anterior
+            a0 = self._acel_previa if self._acel_previa is not None else self._aceleracion(t, x, v)
+            x += v * dt + 0.5 * a0 * dt**2
+            a1 = self._aceleracion(t + dt, x, v)
+            v += 0.5 * (a0 + a1) * dt
+            self._acel_previa = a1
+        else:
+            k1x, k1v = v, self._aceleracion(t, x, v)
+            k2x = v + 0.5 * dt * k1v
+            k2v = self._aceleracion(t + 0.5 * dt, x + 0.5 * dt * k1x, k2x)
+            k3x = v + 0.5 * dt * k2v
+            k3v = self._aceleracion(t + 0.5 * dt, x + 0.5 * dt * k2x, k3x)
+            k4x = v + dt * k3v
+            k4v = self._aceleracion(t + dt, x + dt * k3x, k4x)
+            x += dt / 6 * (k1x + 2 * k2x + 2 * k3x + k4x)
+            v += dt / 6 * (k1v + 2 * k2v + 2 * k3v + k4v)
+        self.t = t + dt
+
+    def trayectoria(self, dt, n_pasos, cada=1):
+        # Generador de (t, posiciones, velocidades) cada `cada` pasos, empezando por el estado
+        # inicial. Entrega copias; la trayectoria completa nunca se guarda en memoria.
+        if dt <= 0 or cada < 1:
+            raise ValueError("dt debe ser positivo y cada al menos 1.")
+        yield self.t, self.posiciones.copy(), self.velocidades.copy()
+        for i in range(1, n_pasos + 1):
+            self.paso(dt)
+            if i % cada == 0:
+                yield self.t, self.posiciones.copy(), self.velocidades.copy()
@@ -0,0 +1,262 @@
+from itertools import chain
+from operator import attrgetter
+
+import numpy as np
+
+from .fuerzas import (
+    BIT_CAMPO,
+    FALTA_COMPONENTES,
+    FALTA_F_O_A,
+    FALTA_MAGNITUD_TRABAJO,
+    FALTA_MASA,
+    FALTA_PESO_MASA,
+    MASA_CERO,
+    TODAS_LAS_ETAPAS,
+    _estadisticas_completar,
+    _reconstruir,
+    g,
+)
+
+# Columnas numéricas de una fuerza; los valores faltantes se guardan como NaN
+COLUMNAS = ("magnitud", "angulo", "Fx", "Fy", "altura", "masa", "peso",
+            "aceleracion", "distancia", "trabajo")
+# Columnas que lee o escribe completar_columnas
+COLUMNAS_COMPLETAR = ("magnitud", "angulo", "Fx", "Fy", "masa", "peso", "aceleracion", "distancia", "trabajo")
+
+
+def _tabla(fuerzas, campos):
+    # Los campos de todas las fuerzas en una sola pasada por los objetos: {campo: arreglo}, None -> NaN
+    valores = np.fromiter(chain.from_iterable(map(attrgetter(*campos), fuerzas)), dtype=object,
+                          count=len(fuerzas) * len(campos))
+    valores[np.equal(valores, None)] = np.nan
+    tabla = np.ascontiguousarray(valores.astype(float).reshape(len(fuerzas), len(campos)).T)
+    return dict(zip(campos, tabla))
+
+
+# ---------------- MOTOR COLUMNAR ----------------
+class SistemaFuerzas:
+    def __init__(self, n=0, nombres=None, **columnas):
+        self.n = n
+        self.nombres = np.asarray([f"F{i + 1}" for i in range(n)] if nombres is None else nombres, dtype=str)
+        if self.nombres.shape != (n,):
+            raise ValueError(f"La columna 'nombre' debe tener {n} elementos.")
+        for nombre in COLUMNAS:
+            col = columnas.get(nombre)
+            if col is None:
+                col = np.full(n, np.nan)
+            else:
+                # Sin copia: completar() reemplaza las columnas en lugar de escribir sobre ellas, así
+                # que un .npy abierto con mmap sigue en el archivo
+                col = np.asarray(col, dtype=float)
+            if col.shape != (n,):
+                raise ValueError(f"La columna '{nombre}' debe tener {n} elementos.")
+            setattr(self, nombre, col)
+        # Bits de FuerzaVectorial._faltantes y _derivados por fuerza; completar() los llena
+        self.faltantes = None
+        self.derivados = None
+
+    @classmethod
+    def desde_fuerzas(cls, fuerzas):
+        fuerzas = list(fuerzas)
+        return cls(len(fuerzas), nombres=[f.nombre for f in fuerzas], **_tabla(fuerzas, COLUMNAS))
+
+    def a_fuerzas(self):
+        # Objetos FuerzaVectorial con los datos de las columnas (NaN -> None). Si el sistema está
+        # completado, las fuerzas también: con sus mensajes de datos faltantes y sin etapas pendientes.
+        filas = zip(self.nombres.tolist(), *(np.where(np.isnan(getattr(self, c)), None, getattr(self, c)).tolist()
+                                             for c in COLUMNAS))
+        completado = self.faltantes is not None
+        faltantes = self.faltantes.tolist() if completado else [0] * self.n
+        derivados = self.derivados.tolist() if completado else [0] * self.n
+        pendientes = 0 if completado else TODAS_LAS_ETAPAS
+        fuerzas = []
+        for (nombre, magnitud, angulo, Fx, Fy, altura, masa, peso, aceleracion, distancia, trabajo), falta, derivado \
+                in zip(filas, faltantes, derivados):
+            # Mismo orden que FuerzaVectorial.__slots__
+            fuerzas.append(_reconstruir(nombre, magnitud, angulo, Fx, Fy, altura if altura is not None else 0.0, masa,
+                                        aceleracion, peso, distancia, trabajo, None, falta, pendientes, derivado))
+        return fuerzas
+
+    def subconjunto(self, indices):
+        # Nuevo sistema con las fuerzas indicadas, en ese orden
+        indices = np.asarray(indices, dtype=np.intp)
+        sistema = SistemaFuerzas(indices.size, nombres=self.nombres[indices],
+                                 **{c: getattr(self, c)[indices] for c in COLUMNAS})
+        if self.faltantes is not None:
+            sistema.faltantes, sistema.derivados = self.faltantes[indices], self.derivados[indices]
+        return sistema
+
+    def consultar(self, ordenar=None, descendente=False, columna=None, minimo=None, maximo=None, texto=None):
+        # Índices de las fuerzas que pasan el filtro, en el orden pedido:
+        #   texto: parte del nombre, sin distinguir mayúsculas
+        #   columna, minimo, maximo: rango (incluido) de una columna; las fuerzas sin ese dato quedan fuera
+        #   ordenar: columna por la que ordenar (estable; las que no tienen el dato van al final)
+        for nombre in (ordenar, columna):
+            if nombre is not None and nombre not in COLUMNAS:
+                raise ValueError(f"Columna desconocida: '{nombre}'.")
+        mascara = np.ones(self.n, dtype=bool)
+        if texto:
+            mascara &= np.char.find(np.char.lower(self.nombres), texto.lower()) >= 0
+        if columna is not None:
+            valores = getattr(self, columna)
+            if minimo is not None:
+                mascara &= valores >= minimo
+            if maximo is not None:
+                mascara &= valores <= maximo
+        indices = np.flatnonzero(mascara)
+
+        if ordenar is not None:
+            valores = getattr(self, ordenar)[indices]
+            indices = indices[np.argsort(-valores if descendente else valores, kind="stable")]
+        elif descendente:
+            indices = indices[::-1]
+        return indices
+
+    def completar(self):
+        # Mismas reglas que FuerzaVectorial.completar_datos, aplicadas a todas las fuerzas a la vez.
+        # También anota por fuerza los mensajes de datos faltantes y qué campos se calcularon.
+        columnas = {c: getattr(self, c) for c in COLUMNAS}
+        self.faltantes, self.derivados = completar_columnas(columnas)
+        for c, col in columnas.items():
+            setattr(self, c, col)
+        return self
+
+    def totales(self):
+        # (ΣFx, ΣFy, Σmomento, Σmasa, Σpeso, Σtrabajo); los NaN cuentan como 0
+        momentos = np.nan_to_num(self.Fy, nan=0.0) * np.nan_to_num(self.altura, nan=0.0)
+        return (float(np.nansum(self.Fx)), float(np.nansum(self.Fy)), float(np.sum(momentos)),
+                float(np.nansum(self.masa)), float(np.nansum(self.peso)), float(np.nansum(self.trabajo)))
+
+    def sumas_por_grupo(self, grupos, n_grupos):
+        # Lo mismo que totales() por cada grupo, como arreglos: grupos[i] es el grupo (0..n_grupos-1)
+        # de la fuerza i. Todas las sumas se hacen en una pasada con bincount. El primer arreglo cuenta
+        # las fuerzas con Fx o Fy en cada grupo.
+        grupos = np.asarray(grupos, dtype=np.intp)
+
+        def suma(col):
+            return np.bincount(grupos, weights=np.nan_to_num(col, nan=0.0), minlength=n_grupos)
+
+        con_componentes = np.bincount(grupos, weights=~(np.isnan(self.Fx) & np.isnan(self.Fy)),
+                                      minlength=n_grupos)
+        momentos = suma(np.nan_to_num(self.Fy, nan=0.0) * np.nan_to_num(self.altura, nan=0.0))
+        return (con_componentes, suma(self.Fx), suma(self.Fy), momentos, suma(self.masa), suma(self.peso),
+                suma(self.trabajo))
+
+    def resultantes_por_grupo(self, grupos, n_grupos):
+        # Una tupla como la de calcular_resultante por cada grupo (ver sumas_por_grupo)
+        return resultantes_de_sumas(self.sumas_por_grupo(grupos, n_grupos))
+
+    def resultante(self):
+        # Devuelve la misma tupla que calcular_resultante
+        if np.isnan(self.Fx).all() and np.isnan(self.Fy).all():
+            return None, None, (None, None), None, 0.0, 0.0, 0.0, None
+
+        suma_fx, suma_fy, momentos, masa_total, peso_total, trabajo_total = self.totales()
+        magnitud = float(np.hypot(suma_fx, suma_fy))
+        angulo = float(np.degrees(np.arctan2(suma_fy, suma_fx))) if magnitud != 0 else 0.0
+
+        aceleracion_res = None
+        if masa_total > 0:
+            aceleracion_res = magnitud / masa_total
+
+        return magnitud, angulo, (suma_fx, suma_fy), momentos, masa_total, peso_total, trabajo_total, aceleracion_res
+
+
+def resultantes_de_sumas(sumas):
+    # Tuplas como las de calcular_resultante a partir de lo que devuelve SistemaFuerzas.sumas_por_grupo
+    con_componentes, suma_fx, suma_fy, momentos, masa_total, peso_total, trabajo_total = sumas
+    magnitudes = np.hypot(suma_fx, suma_fy)
+    angulos = np.where(magnitudes != 0, np.degrees(np.arctan2(suma_fy, suma_fx)), 0.0)
+
+    resultados = []
+    for fila in zip(con_componentes.tolist(), magnitudes.tolist(), angulos.tolist(), suma_fx.tolist(),
+                    suma_fy.tolist(), momentos.tolist(), masa_total.tolist(), peso_total.tolist(),
+                    trabajo_total.tolist()):
+        hay, magnitud, angulo, fx, fy, momento, masa, peso, trabajo = fila
+        if not hay:
+            resultados.append((None, None, (None, None), None, 0.0, 0.0, 0.0, None))
+            continue
+        aceleracion_res = magnitud / masa if masa > 0 else None
+        resultados.append((magnitud, angulo, (fx, fy), momento, masa, peso, trabajo, aceleracion_res))
+    return resultados
+
+
+def completar_fuerzas(fuerzas):
+    # completar_datos de muchas fuerzas con todas las etapas pendientes, en columnas: se leen sus datos en
+    # una pasada, se aplican las reglas a todas juntas y a cada fuerza se le escriben solo los campos
+    # calculados y sus bits. Con todo pendiente no queda ningún valor calculado de antes (ver
+    # FuerzaVectorial._invalidar), así que el resultado es el mismo que completándolas una por una.
+    columnas = _tabla(fuerzas, COLUMNAS_COMPLETAR)
+    faltantes, derivados = completar_columnas(columnas)
+    escribir = object.__setattr__
+    for campo, bit in BIT_CAMPO.items():
+        filas = np.flatnonzero(derivados & bit)
+        for i, valor in zip(filas.tolist(), columnas[campo][filas].tolist()):
+            escribir(fuerzas[i], campo, valor)
+    for f, falta, derivado in zip(fuerzas, faltantes.tolist(), derivados.tolist()):
+        escribir(f, "_faltantes", falta)
+        escribir(f, "_pendientes", 0)
+        escribir(f, "_derivados", derivado)
+    _estadisticas_completar.get()["recalculadas"] += len(fuerzas)
+
+
+def completar_columnas(c):
+    # Reglas de FuerzaVectorial.completar_datos sobre un dict {campo: arreglo} (NaN = dato faltante),
+    # elemento a elemento, así que sirve para cualquier forma: fisica.incertidumbre pasa columnas
+    # (muestras, fuerzas). Reemplaza en el dict las columnas calculadas y devuelve (faltantes, derivados),
+    # los bits de FuerzaVectorial._faltantes y _derivados de cada elemento.
+    def hay(col):
+        return ~np.isnan(col)
+
+    faltantes = np.zeros(np.shape(c["Fx"]), dtype=np.int64)
+    derivados = np.zeros(np.shape(c["Fx"]), dtype=np.int64)
+
+    def marcar(bits, mascara, bit):
+        bits |= np.where(mascara, bit, 0)
+
+    # Componentes <-> polar
+    comp = hay(c["Fx"]) & hay(c["Fy"])
+    c["magnitud"] = np.where(comp, np.hypot(c["Fx"], c["Fy"]), c["magnitud"])
+    c["angulo"] = np.where(comp, np.degrees(np.arctan2(c["Fy"], c["Fx"])), c["angulo"])
+    polar = ~comp & hay(c["magnitud"]) & hay(c["angulo"])
+    rad = np.radians(c["angulo"])
+    c["Fx"] = np.where(polar, c["magnitud"] * np.cos(rad), c["Fx"])
+    c["Fy"] = np.where(polar, c["magnitud"] * np.sin(rad), c["Fy"])
+    marcar(derivados, comp, BIT_CAMPO["magnitud"] | BIT_CAMPO["angulo"])
+    marcar(derivados, polar, BIT_CAMPO["Fx"] | BIT_CAMPO["Fy"])
+    marcar(faltantes, ~comp & ~polar, FALTA_COMPONENTES)
+
+    # Peso <-> masa
+    con_masa, con_peso = hay(c["masa"]), hay(c["peso"])
+    c["peso"] = np.where(con_masa & ~con_peso, c["masa"] * g, c["peso"])
+    c["masa"] = np.where(con_peso & ~con_masa, c["peso"] / g, c["masa"])
+    marcar(derivados, con_masa & ~con_peso, BIT_CAMPO["peso"])
+    marcar(derivados, con_peso & ~con_masa, BIT_CAMPO["masa"])
+    marcar(faltantes, ~con_masa & ~con_peso, FALTA_PESO_MASA)
+
+    # Segunda ley (F = m a)
+    con_masa, con_mag, con_acel = hay(c["masa"]), hay(c["magnitud"]), hay(c["aceleracion"])
+    por_acel = con_masa & con_mag & ~con_acel
+    calc_acel = por_acel & (c["masa"] != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        c["aceleracion"] = np.where(calc_acel, c["magnitud"] / c["masa"], c["aceleracion"])
+    calc_mag = con_masa & con_acel & ~con_mag
+    c["magnitud"] = np.where(calc_mag, c["masa"] * c["aceleracion"], c["magnitud"])
+    rehacer = calc_mag & hay(c["angulo"]) & ~(hay(c["Fx"]) & hay(c["Fy"]))
+    c["Fx"] = np.where(rehacer, c["magnitud"] * np.cos(rad), c["Fx"])
+    c["Fy"] = np.where(rehacer, c["magnitud"] * np.sin(rad), c["Fy"])
+    otro = ~por_acel & ~calc_mag
+    marcar(derivados, calc_acel, BIT_CAMPO["aceleracion"])
+    marcar(derivados, calc_mag, BIT_CAMPO["magnitud"])
+    marcar(derivados, rehacer, BIT_CAMPO["Fx"] | BIT_CAMPO["Fy"])
+    marcar(faltantes, por_acel & (c["masa"] == 0), MASA_CERO)
+    marcar(faltantes, otro & ~con_mag & ~con_acel & con_masa, FALTA_F_O_A)
+    marcar(faltantes, otro & ~con_masa & (con_mag | con_acel), FALTA_MASA)
+
+    # Trabajo (fuerza colineal con el desplazamiento)
+    con_distancia, con_mag = hay(c["distancia"]), hay(c["magnitud"])
+    calc_trabajo = con_distancia & con_mag
+    c["trabajo"] = np.where(calc_trabajo, c["magnitud"] * c["distancia"], c["trabajo"])
+    marcar(derivados, calc_trabajo, BIT_CAMPO["trabajo"])
+    marcar(faltantes, con_distancia & ~con_mag, FALTA_MAGNITUD_TRABAJO)
+    return faltantes, derivados
@@ -1,266 +1,47 @@
-import math
+import os
+import time
+from functools import wraps
+
 import streamlit as st
 
-# Intento seguro de importar matplotlib
-try:
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_OK = True
-except Exception:
-    MATPLOTLIB_OK = False
+from fisica import (
+    AcumuladorResultante,
+    CuerpoFisico,
+    FuerzaVectorial,
+    graficar_vectores_fig,
+    usar_estadisticas_completar,
+)
+from fisica.archivos import FORMATOS, escribir_fuerzas, leer_fuerzas
+from fisica.barrido import barrer_fuerza_faltante, rango
+from fisica.cache import CacheResultados
+from fisica import rendimiento
+from fisica.grafica import MATPLOTLIB_OK, figura_png, graficar_barrido_fig
+from fisica.incertidumbre import montecarlo
+from fisica.rendimiento import Cronometro, Perfil, etapa, medir
+from fisica.vectorial import SistemaFuerzas
+
+if not MATPLOTLIB_OK:
     st.warning("Aviso: matplotlib no está disponible. La gráfica se desactivará.")
 
-g = 9.81  # gravedad m/s^2
-
-# ---------------- CLASES ----------------
-class FuerzaVectorial:
-    def __init__(self, nombre=None, magnitud=None, angulo=None, Fx=None, Fy=None,
-                 altura=0.0, masa=None, aceleracion=None, peso=None, distancia=None):
-        self.nombre = nombre or "F"
-        self.magnitud = magnitud      # N
-        self.angulo = angulo          # grados
-        self.Fx = Fx                  # N
-        self.Fy = Fy                  # N
-        self.altura = altura          # m
-        self.masa = masa              # kg (opcional por fuerza)
-        self.aceleracion = aceleracion  # m/s^2 (opcional por fuerza)
-        self.peso = peso              # N
-        self.distancia = distancia    # m (para trabajo)
-        self.trabajo = None           # J
-        self._mensajes = []
-
-    def completar_datos(self):
-        self._mensajes = []
-
-        # Componentes <-> polar
-        if (self.Fx is not None) and (self.Fy is not None):
-            self.magnitud = math.sqrt(self.Fx**2 + self.Fy**2)
-            self.angulo = math.degrees(math.atan2(self.Fy, self.Fx))
-        elif (self.magnitud is not None) and (self.angulo is not None):
-            rad = math.radians(self.angulo)
-            self.Fx = self.magnitud * math.cos(rad)
-            self.Fy = self.magnitud * math.sin(rad)
-        else:
-            self._mensajes.append("Para calcular componentes o dirección: ingresa Fx y Fy, o magnitud y ángulo.")
-
-        # Peso <-> masa (local a la fuerza si se usa)
-        if (self.masa is not None) and (self.peso is None):
-            self.peso = self.masa * g
-        elif (self.peso is not None) and (self.masa is None):
-            self.masa = self.peso / g
-        else:
-            if (self.masa is None) and (self.peso is None):
-                self._mensajes.append("Para calcular peso o masa: proporciona m o P.")
-
-        # Segunda ley (F = m a) local
-        if (self.masa is not None) and (self.magnitud is not None) and (self.aceleracion is None):
-            if self.masa == 0:
-                self._mensajes.append("Masa no puede ser cero para calcular aceleración.")
-            else:
-                self.aceleracion = self.magnitud / self.masa
-        elif (self.masa is not None) and (self.aceleracion is not None) and (self.magnitud is None):
-            self.magnitud = self.masa * self.aceleracion
-            if (self.angulo is not None) and ((self.Fx is None) or (self.Fy is None)):
-                rad = math.radians(self.angulo)
-                self.Fx = self.magnitud * math.cos(rad)
-                self.Fy = self.magnitud * math.sin(rad)
-        else:
-            if (self.magnitud is None) and (self.aceleracion is None) and (self.masa is not None):
-                self._mensajes.append("Para calcular aceleración o fuerza: falta F (magnitud) o a.")
-            if (self.masa is None) and ((self.magnitud is not None) or (self.aceleracion is not None)):
-                self._mensajes.append("Para relacionar F y a: falta la masa.")
-
-        # Trabajo (suponiendo fuerza colineal con el desplazamiento)
-        if (self.distancia is not None) and (self.magnitud is not None):
-            self.trabajo = self.magnitud * self.distancia
-        elif (self.distancia is not None) and (self.magnitud is None):
-            self._mensajes.append("Para calcular trabajo (W), falta magnitud de la fuerza.")
-
-    def momento(self):
-        if self.Fy is None:
-            self.completar_datos()
-        return (self.Fy if self.Fy is not None else 0.0) * (self.altura if self.altura is not None else 0.0)
-
-    def mensajes_faltantes(self):
-        return self._mensajes[:]
-
-
-class CuerpoFisico:
-    def __init__(self, masa=None, peso=None, aceleracion_deseada=None, tension=None, angulo_fuerza_faltante=None):
-        self.masa = masa
-        self.peso = peso if peso is not None else (masa * g if masa else None)
-        self.aceleracion_deseada = aceleracion_deseada
-        self.tension = tension
-        self.angulo_fuerza_faltante = angulo_fuerza_faltante  # grados (opcional)
-        self.fuerzas_aplicadas = []
-
-    def agregar_fuerza(self, fuerza: FuerzaVectorial):
-        self.fuerzas_aplicadas.append(fuerza)
-
-    def calcular_dinamica(self):
-        # Completar datos de fuerzas
-        for f in self.fuerzas_aplicadas:
-            f.completar_datos()
-
-        # Suma vectorial
-        suma_fx = sum(f.Fx for f in self.fuerzas_aplicadas if f.Fx is not None)
-        suma_fy = sum(f.Fy for f in self.fuerzas_aplicadas if f.Fy is not None)
-        F_aplicada_mag = math.sqrt(suma_fx**2 + suma_fy**2)
-        F_aplicada_ang = math.degrees(math.atan2(suma_fy, suma_fx)) if F_aplicada_mag != 0 else 0.0
-
-        momentos = sum(f.momento() for f in self.fuerzas_aplicadas)
-        trabajo_total = sum((f.trabajo or 0.0) for f in self.fuerzas_aplicadas)
-
-        tipo = "indeterminado"
-        aceleracion = None
-        Fx_resultante = suma_fx
-        Fy_resultante = suma_fy
-        fuerza_resultante = F_aplicada_mag
-        angulo_resultante = F_aplicada_ang
-
-        fuerza_faltante_mag = None
-        fuerza_faltante_ang = None
-        inconsistencia_angulo = False
-
-        # Caso 1: Grúa con tensión vertical
-        if (self.tension is not None) and (self.masa is not None):
-            Fy_total = self.tension - (self.masa * g) + suma_fy
-            Fx_total = suma_fx
-            fuerza_resultante = math.sqrt(Fx_total**2 + Fy_total**2)
-            angulo_resultante = math.degrees(math.atan2(Fy_total, Fx_total)) if fuerza_resultante != 0 else 0.0
-            Fx_resultante, Fy_resultante = Fx_total, Fy_total
-            if self.masa and self.masa > 0:
-                aceleracion = fuerza_resultante / self.masa
-            tipo = "grua"
-
-        # Caso 2: Fuerzas aplicadas sobre cuerpo con masa/peso -> aceleración
-        elif (self.masa is not None) and (self.masa > 0) and (F_aplicada_mag is not None):
-            aceleracion = F_aplicada_mag / self.masa
-            tipo = "fuerzas_aplicadas"
-
-        # Caso 3: Calcular fuerza faltante para lograr aceleración deseada
-        if (self.aceleracion_deseada is not None) and (self.masa is not None) and (self.masa > 0):
-            Fx_deseado = self.masa * self.aceleracion_deseada
-            Fy_deseado = 0.0
-            Fx_req = Fx_deseado - suma_fx
-            Fy_req = Fy_deseado - suma_fy
-
-            if self.angulo_fuerza_faltante is not None:
-                rad = math.radians(self.angulo_fuerza_faltante)
-                cos_a = math.cos(rad)
-                sin_a = math.sin(rad)
-                Mx = Fx_req / cos_a if cos_a != 0 else None
-                My = Fy_req / sin_a if sin_a != 0 else None
-                if (Mx is not None) and (My is not None):
-                    if abs(Mx - My) <= 1e-6:
-                        fuerza_faltante_mag = Mx
-                    else:
-                        inconsistencia_angulo = True
-                        fuerza_faltante_mag = Fx_req * cos_a + Fy_req * sin_a
-                elif Mx is not None:
-                    fuerza_faltante_mag = Mx
-                elif My is not None:
-                    fuerza_faltante_mag = My
-                else:
-                    fuerza_faltante_mag = 0.0
-                fuerza_faltante_ang = self.angulo_fuerza_faltante
-            else:
-                fuerza_faltante_mag = math.sqrt(Fx_req**2 + Fy_req**2)
-                fuerza_faltante_ang = math.degrees(math.atan2(Fy_req, Fx_req)) if fuerza_faltante_mag != 0 else 0.0
-
-            tipo = "fuerza_faltante"
-
-        return {
-            "tipo": tipo,
-            "magnitud": fuerza_resultante,
-            "angulo": angulo_resultante,
-            "Fx": Fx_resultante,
-            "Fy": Fy_resultante,
-            "momento": momentos,
-            "trabajo": trabajo_total,
-            "aceleracion": aceleracion,
-            "fuerza_faltante_mag": fuerza_faltante_mag,
-            "fuerza_faltante_ang": fuerza_faltante_ang,
-            "inconsistencia_angulo": inconsistencia_angulo
-        }
-
-# ---------------- FUNCIONES DE CÁLCULO ----------------
-def calcular_resultante(fuerzas):
-    # Completa datos de todas las fuerzas
-    for f in fuerzas:
-        f.completar_datos()
-
-    hay_fx = any(f.Fx is not None for f in fuerzas)
-    hay_fy = any(f.Fy is not None for f in fuerzas)
-    if not hay_fx and not hay_fy:
-        return None, None, (None, None), None, 0.0, 0.0, 0.0, None
-
-    suma_fx = sum(f.Fx for f in fuerzas if f.Fx is not None)
-    suma_fy = sum(f.Fy for f in fuerzas if f.Fy is not None)
-    magnitud = math.sqrt(suma_fx**2 + suma_fy**2)
-    angulo = math.degrees(math.atan2(suma_fy, suma_fx)) if magnitud != 0 else 0.0
-    momentos = sum(f.momento() for f in fuerzas)
-
-    masa_total = sum((f.masa or 0.0) for f in fuerzas)
-    peso_total = sum((f.peso or 0.0) for f in fuerzas)
-    trabajo_total = sum((f.trabajo or 0.0) for f in fuerzas)
-
-    aceleracion_res = None
-    if (masa_total is not None) and (masa_total > 0):
-        aceleracion_res = magnitud / masa_total
-
-    return magnitud, angulo, (suma_fx, suma_fy), momentos, masa_total, peso_total, trabajo_total, aceleracion_res
-
-
-def graficar_vectores_fig(fuerzas, Fx_R, Fy_R, magnitud_R, angulo_R, aceleracion_R, masa_R, peso_R, trabajo_R):
-    if not MATPLOTLIB_OK:
-        return None
-
-    # Chequeo: si no hay nada que graficar, salir
-    hay_vectores = any((f.Fx is not None and f.Fy is not None) for f in fuerzas)
-    if not hay_vectores and (Fx_R is None or Fy_R is None):
-        return None
-
-    fig, ax = plt.subplots(figsize=(7, 7))
-    ax.set_title("Sistema de fuerzas y datos resultantes")
-    ax.set_xlabel("Fx (N)")
-    ax.set_ylabel("Fy (N)")
-    ax.axhline(0, color='gray', linewidth=0.8)
-    ax.axvline(0, color='gray', linewidth=0.8)
-    ax.set_aspect('equal', 'box')
-
-    # Vectores individuales
-    for f in fuerzas:
-        if (f.Fx is not None) and (f.Fy is not None):
-            ax.quiver(0, 0, f.Fx, f.Fy, angles='xy', scale_units='xy', scale=1, color='blue', alpha=0.85)
-            etiqueta = f"{f.nombre}\n|F|={f.magnitud:.2f} N\nθ={f.angulo:.1f}°"
-            if f.masa is not None: etiqueta += f"\nm={f.masa:.2f} kg"
-            if f.peso is not None: etiqueta += f"\nP={f.peso:.2f} N"
-            if f.aceleracion is not None: etiqueta += f"\na={f.aceleracion:.2f} m/s²"
-            if f.trabajo is not None: etiqueta += f"\nW={f.trabajo:.2f} J"
-            ax.text(f.Fx, f.Fy, etiqueta, color='blue', fontsize=8, ha='left', va='bottom')
-
-    # Resultante
-    if (Fx_R is not None) and (Fy_R is not None):
-        ax.quiver(0, 0, Fx_R, Fy_R, angles='xy', scale_units='xy', scale=1, color='red', width=0.006)
-        etiqueta_R = f"Resultante\n|F|={magnitud_R:.2f} N\nθ={angulo_R:.1f}°"
-        if masa_R: etiqueta_R += f"\nm={masa_R:.2f} kg"
-        if peso_R: etiqueta_R += f"\nP={peso_R:.2f} N"
-        if aceleracion_R is not None: etiqueta_R += f"\na={aceleracion_R:.2f} m/s²"
-        if trabajo_R: etiqueta_R += f"\nW={trabajo_R:.2f} J"
-        ax.text(Fx_R, Fy_R, etiqueta_R, color='red', fontsize=9, ha='left', va='bottom')
-
-    # Límites
-    all_fx = [f.Fx for f in fuerzas if f.Fx is not None] + ([Fx_R] if Fx_R is not None else [])
-    all_fy = [f.Fy for f in fuerzas if f.Fy is not None] + ([Fy_R] if Fy_R is not None else [])
-    max_extent = max([1.0] + [abs(x) for x in all_fx + all_fy])
-    ax.set_xlim(-1.2 * max_extent, 1.2 * max_extent)
-    ax.set_ylim(-1.2 * max_extent, 1.2 * max_extent)
-
-    ax.grid(True, linestyle='--', alpha=0.3)
-    fig.tight_layout()
-    return fig
-
-
+DEPURAR_ACUMULADOR = False  # True: compara el acumulador con un cálculo completo en cada rerun
+RUTA_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "resultados.sqlite")
+TAMANOS_PAGINA = (25, 50, 100, 250)
+ORDENES = {"orden de ingreso": None, "magnitud": "magnitud", "ángulo": "angulo", "trabajo": "trabajo"}
+FILTROS = {"magnitud": "magnitud", "ángulo": "angulo", "trabajo": "trabajo"}
+ETIQUETAS_MONTECARLO = {
+    "magnitud": "|F| resultante (N)", "angulo": "θ resultante (°)", "momento": "Momento (N·m)",
+    "trabajo": "Trabajo (J)", "aceleracion": "Aceleración resultante (m/s²)",
+    "cuerpo_magnitud": "|F| sobre el cuerpo (N)", "cuerpo_angulo": "θ sobre el cuerpo (°)",
+    "cuerpo_aceleracion": "Aceleración del cuerpo (m/s²)",
+    "cuerpo_fuerza_faltante_mag": "Fuerza faltante (N)", "cuerpo_fuerza_faltante_ang": "Ángulo de la fuerza faltante (°)",
+}
+COLUMNAS_TABLA = {  # encabezado -> atributo de SistemaFuerzas
+    "|F| (N)": "magnitud", "θ (°)": "angulo", "Fx (N)": "Fx", "Fy (N)": "Fy", "m (kg)": "masa",
+    "P (N)": "peso", "a (m/s²)": "aceleracion", "W (J)": "trabajo",
+}
+
+
+@medir("_to_float_or_none")
 def _to_float_or_none(s):
     s = (s or "").strip()
     try:
@@ -268,179 +49,529 @@ def _to_float_or_none(s):
     except ValueError:
         return None
 
+
+@st.cache_resource
+def _cache_resultados():
+    # Una sola caché para todas las sesiones; los ejemplos repetidos se resuelven una vez
+    os.makedirs(os.path.dirname(RUTA_CACHE), exist_ok=True)
+    return CacheResultados(RUTA_CACHE)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _barrido(suma_fx, suma_fy, angulos, aceleraciones, masas):
+    # El barrido solo depende de la suma de las fuerzas, así que la clave es (ΣFx, ΣFy) y los rangos
+    # (inicio, fin, paso), no la lista completa
+    return barrer_fuerza_faltante([FuerzaVectorial(Fx=suma_fx, Fy=suma_fy)],
+                                  rango(*angulos), rango(*aceleraciones), rango(*masas))
+
+
+def _fragmento(nombre):
+    # st.fragment que anota su duración en st.session_state.ms_fragmentos. Una interacción dentro
+    # del fragmento solo vuelve a ejecutar esa función, no la página completa.
+    def decorador(funcion):
+        @st.fragment
+        @wraps(funcion)
+        def envoltura(*args, **kwargs):
+            # Al volver a ejecutarse solo, el fragmento no pasa por el inicio de la página
+            rendimiento.usar(st.session_state.setdefault("medicion", rendimiento.Medicion()))
+            inicio = time.perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                st.session_state.setdefault("ms_fragmentos", {})[nombre] = (time.perf_counter() - inicio) * 1000
+        return envoltura
+    return decorador
+
+
+def _lista_cambio():
+    # Invalida lo que se arma a partir de la lista: el archivo exportado, la tabla y su selección
+    st.session_state.pop("exportacion", None)
+    st.session_state.version_lista = st.session_state.get("version_lista", 0) + 1
+
+
+def _mostrando_resultado(nombre, visible=True):
+    # Anota si el fragmento `nombre` tiene a la vista un resultado calculado con la versión actual de la lista
+    mostrados = st.session_state.setdefault("resultados_lista", {})
+    if visible:
+        mostrados[nombre] = st.session_state.get("version_lista", 0)
+    else:
+        mostrados.pop(nombre, None)
+
+
+def _actualizar_resultados_de_la_lista():
+    # Cuando la lista cambia dentro del fragmento de fuerzas, los demás fragmentos no se vuelven a ejecutar
+    # y seguirían mostrando resultados de la lista anterior: se descartan y se pide un rerun completo
+    version = st.session_state.get("version_lista", 0)
+    if any(v != version for v in st.session_state.get("resultados_lista", {}).values()):
+        st.session_state.resultados_lista = {}
+        st.rerun(scope="app")
+
+
+def _tabla_fuerzas():
+    # Vista columnar de la lista para filtrar, ordenar y paginar; se rehace solo cuando la lista cambia
+    version = st.session_state.get("version_lista", 0)
+    tabla = st.session_state.get("tabla_fuerzas")
+    if tabla is None or tabla[0] != version:
+        tabla = st.session_state.tabla_fuerzas = (version, SistemaFuerzas.desde_fuerzas(st.session_state.fuerzas))
+    return tabla[1]
+
+
+def _eliminar_fuerzas(indices):
+    # Callback de los botones "Eliminar": corre antes del rerun del fragmento, así que no hace falta otro
+    quitar = set(indices)
+    st.session_state.acumulador.quitar_sistema(_tabla_fuerzas().subconjunto(sorted(quitar)))
+    st.session_state.fuerzas = [f for i, f in enumerate(st.session_state.fuerzas) if i not in quitar]
+    _lista_cambio()
+
+
+def _limpiar_fuerzas():
+    st.session_state.fuerzas = []
+    st.session_state.acumulador.limpiar()
+    _lista_cambio()
+
+
+def _texto_incertidumbres(incertidumbres):
+    partes = []
+    for campo, valor in (incertidumbres or {}).items():
+        partes.append(f"{campo} en [{valor[0]:g}, {valor[1]:g}]" if isinstance(valor, (tuple, list))
+                      else f"{campo} σ={valor:g}")
+    return ", ".join(partes)
+
+
+def _lista_de_fuerzas():
+    # Tabla paginada: filtrar y ordenar se hace sobre columnas NumPy y solo se envía la página visible
+    tabla = _tabla_fuerzas()
+    with st.expander("Filtrar y ordenar", expanded=False):
+        f1, f2, f3 = st.columns(3)
+        texto = f1.text_input("Buscar por nombre", key="filtro_nombre")
+        orden = f2.selectbox("Ordenar por", list(ORDENES), key="orden_lista")
+        descendente = f3.toggle("Descendente", key="orden_descendente")
+        g1, g2, g3 = st.columns(3)
+        columna = g1.selectbox("Filtrar por", list(FILTROS), key="filtro_columna")
+        minimo = _to_float_or_none(g2.text_input("Mínimo", key="filtro_minimo"))
+        maximo = _to_float_or_none(g3.text_input("Máximo", key="filtro_maximo"))
+    filtrada = bool(texto) or minimo is not None or maximo is not None
+    indices = tabla.consultar(ORDENES[orden], descendente, FILTROS[columna], minimo, maximo, texto.strip())
+
+    p1, p2 = st.columns(2)
+    por_pagina = p1.selectbox("Fuerzas por página", TAMANOS_PAGINA, key="por_pagina")
+    paginas = max(1, -(-len(indices) // por_pagina))
+    # La lista pudo acortarse desde el último rerun; el widget no acepta un valor fuera de rango
+    st.session_state.pagina_lista = min(st.session_state.get("pagina_lista", 1), paginas)
+    pagina = p2.number_input("Página", min_value=1, max_value=paginas, step=1, key="pagina_lista")
+    visibles = indices[(pagina - 1) * por_pagina:pagina * por_pagina]
+
+    fuerzas = st.session_state.fuerzas
+    datos = {"nombre": tabla.nombres[visibles]}
+    for encabezado, columna_tabla in COLUMNAS_TABLA.items():
+        datos[encabezado] = getattr(tabla, columna_tabla)[visibles]
+    datos["incertidumbre"] = [_texto_incertidumbres(fuerzas[i].incertidumbres) for i in visibles.tolist()]
+    datos["faltan"] = [" ".join(fuerzas[i].mensajes_faltantes()) for i in visibles.tolist()]
+    evento = st.dataframe(
+        datos, hide_index=True, width="stretch", on_select="rerun", selection_mode="multi-row",
+        key=f"tabla_{st.session_state.get('version_lista', 0)}",
+        column_config={encabezado: st.column_config.NumberColumn(format="%.3f") for encabezado in COLUMNAS_TABLA},
+    )
+    st.caption(f"{len(indices)} de {tabla.n} fuerzas · página {pagina} de {paginas}")
+
+    seleccion = visibles[evento["selection"]["rows"]].tolist()
+    b1, b2 = st.columns(2)
+    b1.button(f"Eliminar seleccionadas ({len(seleccion)})", disabled=not seleccion,
+              on_click=_eliminar_fuerzas, args=(seleccion,))
+    if filtrada:
+        b2.button(f"Eliminar las {len(indices)} filtradas", disabled=not len(indices),
+                  on_click=_eliminar_fuerzas, args=(indices.tolist(),))
+
+
 # ---------------- INTERFAZ STREAMLIT ----------------
 st.set_page_config(page_title="Calculadora de fuerzas", layout="wide")
+
+# Medición de rendimiento; se configura en el panel "Rendimiento" al final de la página
+inicio_rerun = time.perf_counter()
+# Bandera y estadísticas propias de la sesión: el proceso atiende a todas y cada una corre en su hilo
+rendimiento.usar(st.session_state.setdefault("medicion", rendimiento.Medicion()))
+rendimiento.activar(st.session_state.get("medir_rendimiento", False))
+rendimiento.reiniciar()
+# Si el rerun anterior se interrumpió antes del final, su perfil sigue activo
+perfil_pendiente = st.session_state.pop("perfil_en_curso", None)
+if perfil_pendiente is not None:
+    perfil_pendiente.detener()
+perfil = None
+if st.session_state.get("perfilar_rerun", False):
+    perfil = st.session_state.perfil_en_curso = Perfil().iniciar()
+cronometro = Cronometro()
+cronometro.marcar("página: encabezado y estado")
+
 st.title("Calculadora vectorial de fuerzas, momentos, trabajo y dinámica")
 
 # Estado de la app
 if "fuerzas" not in st.session_state:
     st.session_state.fuerzas = []
-
-# ---- Formulario para agregar fuerzas ----
+if "acumulador" not in st.session_state:
+    st.session_state.acumulador = AcumuladorResultante(st.session_state.fuerzas)
+
+
+# ---- Importar / exportar listas de fuerzas ----
+@_fragmento("exportar")
+def _exportar():
+    # Siempre visible: la lista puede cambiar en el fragmento de fuerzas sin que este se vuelva a ejecutar
+    _mostrando_resultado("exportar", False)
+    formato = st.selectbox("Formato de exportación", FORMATOS, key="formato_exportacion")
+    # Se genera bajo demanda para no serializar la lista en cada rerun
+    if st.button("Preparar archivo"):
+        if not st.session_state.fuerzas:
+            st.info("No hay fuerzas para exportar.")
+            return
+        with etapa("exportar"):
+            st.session_state.exportacion = (formato, escribir_fuerzas(st.session_state.fuerzas, formato))
+    exportacion = st.session_state.get("exportacion")
+    if exportacion is not None and exportacion[0] == formato:
+        st.download_button(f"Descargar fuerzas.{formato}", exportacion[1], file_name=f"fuerzas.{formato}")
+        _mostrando_resultado("exportar")
+
+
+cronometro.marcar("página: barra lateral")
 with st.sidebar:
-    st.header("Agregar fuerza")
-    nombre = st.text_input("Nombre", value="F{}".format(len(st.session_state.fuerzas) + 1))
-    magnitud = _to_float_or_none(st.text_input("Magnitud (N)"))
-    angulo = _to_float_or_none(st.text_input("Ángulo (°)"))
-    Fx = _to_float_or_none(st.text_input("Componente Fx (N)"))
-    Fy = _to_float_or_none(st.text_input("Componente Fy (N)"))
-    altura = _to_float_or_none(st.text_input("Altura para momento (m)"))
-    masa_f = _to_float_or_none(st.text_input("Masa (kg) [opcional por fuerza]"))
-    peso_f = _to_float_or_none(st.text_input("Peso (N) [opcional por fuerza]"))
-    aceleracion_f = _to_float_or_none(st.text_input("Aceleración (m/s²) [opcional por fuerza]"))
-    distancia = _to_float_or_none(st.text_input("Distancia (m, para trabajo W)"))
-
-    col_btn1, col_btn2 = st.columns(2)
-    with col_btn1:
-        if st.button("Agregar fuerza"):
+    st.header("Importar / exportar")
+    archivo = st.file_uploader("Archivo de fuerzas (CSV, JSON o NPY)", type=list(FORMATOS))
+    if archivo is not None and st.button("Importar fuerzas"):
+        try:
+            with etapa("importar"):
+                sistema, errores = leer_fuerzas(archivo)
+                st.session_state.fuerzas.extend(sistema.a_fuerzas())
+                st.session_state.acumulador.agregar_sistema(sistema)
+                _lista_cambio()
+                # El resto de la página corre en este mismo rerun y ya ve la lista nueva
+                st.session_state.pop("resultados_lista", None)
+        except (ValueError, RuntimeError) as e:
+            st.error(f"No se pudo importar el archivo: {e}")
+        else:
+            st.success(f"{sistema.n} fuerzas importadas.")
+            if errores:
+                st.warning("Celdas inválidas (se tomaron como datos faltantes):\n\n" + "\n\n".join(errores))
+    _exportar()
+
+
+# ---- Formulario, lista de fuerzas y resultantes ----
+# Van en un solo fragmento: agregar o eliminar una fuerza solo vuelve a ejecutar esta parte
+@_fragmento("fuerzas")
+def _fuerzas_y_resultados():
+    # Contadores propios de esta ejecución; los de otras sesiones corren en otros hilos
+    estadisticas_completar = usar_estadisticas_completar({"recalculadas": 0, "en_cache": 0})
+    col_formulario, col_lista = st.columns([1, 2])
+
+    # Formulario para agregar fuerzas: escribir en los campos no provoca reruns, solo el envío
+    with col_formulario:
+        st.subheader("Agregar fuerza")
+        with st.form("agregar_fuerza", clear_on_submit=False):
+            nombre = st.text_input("Nombre", placeholder="F1, F2, …", key="nueva_nombre")
+            magnitud = st.text_input("Magnitud (N)", key="nueva_magnitud")
+            angulo = st.text_input("Ángulo (°)", key="nueva_angulo")
+            Fx = st.text_input("Componente Fx (N)", key="nueva_Fx")
+            Fy = st.text_input("Componente Fy (N)", key="nueva_Fy")
+            altura = st.text_input("Altura para momento (m)", key="nueva_altura")
+            masa_f = st.text_input("Masa (kg) [opcional por fuerza]", key="nueva_masa")
+            peso_f = st.text_input("Peso (N) [opcional por fuerza]", key="nueva_peso")
+            aceleracion_f = st.text_input("Aceleración (m/s²) [opcional por fuerza]", key="nueva_aceleracion")
+            distancia = st.text_input("Distancia (m, para trabajo W)", key="nueva_distancia")
+            sigma_magnitud = st.text_input("σ de la magnitud (N) [opcional, Monte Carlo]", key="nueva_sigma_magnitud")
+            sigma_angulo = st.text_input("σ del ángulo (°) [opcional, Monte Carlo]", key="nueva_sigma_angulo")
+            agregar = st.form_submit_button("Agregar fuerza")
+        st.button("Limpiar fuerzas", on_click=_limpiar_fuerzas)
+
+        if agregar:
+            altura = _to_float_or_none(altura)
+            sigmas = {"magnitud": _to_float_or_none(sigma_magnitud), "angulo": _to_float_or_none(sigma_angulo)}
+            incertidumbres = {campo: sigma for campo, sigma in sigmas.items() if sigma}
             f = FuerzaVectorial(
-                nombre=nombre.strip() or "F",
-                magnitud=magnitud,
-                angulo=angulo,
-                Fx=Fx,
-                Fy=Fy,
+                nombre=nombre.strip() or "F{}".format(len(st.session_state.fuerzas) + 1),
+                magnitud=_to_float_or_none(magnitud),
+                angulo=_to_float_or_none(angulo),
+                Fx=_to_float_or_none(Fx),
+                Fy=_to_float_or_none(Fy),
                 altura=altura if altura is not None else 0.0,
-                masa=masa_f,
-                peso=peso_f,
-                aceleracion=aceleracion_f,
-                distancia=distancia
+                masa=_to_float_or_none(masa_f),
+                peso=_to_float_or_none(peso_f),
+                aceleracion=_to_float_or_none(aceleracion_f),
+                distancia=_to_float_or_none(distancia),
+                incertidumbres=incertidumbres or None
             )
             f.completar_datos()
             st.session_state.fuerzas.append(f)
-            st.success(f"Fuerza '{f.nombre}' agregada.")
-    with col_btn2:
-        if st.button("Limpiar fuerzas"):
-            st.session_state.fuerzas = []
-            st.info("Lista de fuerzas reiniciada.")
-
-# ---- Lista y detalle de fuerzas ----
-st.subheader("Fuerzas ingresadas")
-if not st.session_state.fuerzas:
-    st.info("No hay fuerzas agregadas. Usa el panel lateral para añadir.")
-else:
-    for idx, f in enumerate(st.session_state.fuerzas, start=1):
-        with st.expander(f"Fuerza {idx}: {f.nombre}", expanded=False):
-            st.write(f"- **|F|:** {f.magnitud:.3f} N" if f.magnitud is not None else "- **|F|:** (no definido)")
-            st.write(f"- **θ:** {f.angulo:.3f}°" if f.angulo is not None else "- **θ:** (no definido)")
-            if (f.Fx is not None) and (f.Fy is not None):
-                st.write(f"- **Componentes:** Fx = {f.Fx:.3f} N, Fy = {f.Fy:.3f} N")
-            if f.masa is not None: st.write(f"- **m:** {f.masa:.3f} kg")
-            if f.peso is not None: st.write(f"- **P:** {f.peso:.3f} N")
-            if f.aceleracion is not None: st.write(f"- **a:** {f.aceleracion:.3f} m/s²")
-            if f.trabajo is not None: st.write(f"- **W:** {f.trabajo:.3f} J")
-            faltantes = f.mensajes_faltantes()
-            if faltantes:
-                st.warning("Necesitas:")
-                for m in faltantes:
-                    st.write(f"- {m}")
-            # Botón para eliminar fuerza
-            if st.button(f"Eliminar {f.nombre}", key=f"del_{idx}"):
-                st.session_state.fuerzas.pop(idx - 1)
-                st.experimental_rerun()
-
-# ---- Resultantes del sistema de fuerzas ----
-st.subheader("Resultados del sistema de fuerzas")
-if st.session_state.fuerzas:
-    magnitud, angulo, (Fx_R, Fy_R), momentos, masa_total, peso_total, trabajo_total, aceleracion_res = calcular_resultante(st.session_state.fuerzas)
-
-    if magnitud is None:
-        st.error("No se pudo calcular la resultante. Ingresa al menos (Fx y Fy) o (magnitud y ángulo) en alguna fuerza.")
+            st.session_state.acumulador.agregar(f)
+            _lista_cambio()
+            # Se muestra desde el estado: si otros fragmentos piden un rerun completo, el aviso no se pierde
+            st.session_state.aviso_fuerzas = f"Fuerza '{f.nombre}' agregada."
+        aviso = st.session_state.pop("aviso_fuerzas", None)
+        if aviso is not None:
+            st.success(aviso)
+
+    # Lista y detalle de fuerzas
+    with col_lista:
+        st.subheader("Fuerzas ingresadas")
+        if not st.session_state.fuerzas:
+            st.info("No hay fuerzas agregadas. Usa el formulario para añadir.")
+        else:
+            _lista_de_fuerzas()
+
+    # Resultantes del sistema de fuerzas
+    st.subheader("Resultados del sistema de fuerzas")
+    if st.session_state.fuerzas:
+        if DEPURAR_ACUMULADOR:
+            st.session_state.acumulador.verificar(st.session_state.fuerzas)
+        magnitud, angulo, (Fx_R, Fy_R), momentos, masa_total, peso_total, trabajo_total, aceleracion_res = st.session_state.acumulador.resultante()
+
+        if magnitud is None:
+            st.error("No se pudo calcular la resultante. Ingresa al menos (Fx y Fy) o (magnitud y ángulo) en alguna fuerza.")
+        else:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Fuerza resultante |F|", f"{magnitud:.3f} N")
+                st.metric("Dirección resultante θ", f"{angulo:.3f}°")
+                st.write(f"**Componentes:** Fx = {Fx_R:.3f} N, Fy = {Fy_R:.3f} N")
+            with col2:
+                st.metric("Momento total (simplificado)", f"{momentos:.3f} N·m")
+                if masa_total:
+                    st.metric("Masa total", f"{masa_total:.3f} kg")
+                if peso_total:
+                    st.metric("Peso total", f"{peso_total:.3f} N")
+            with col3:
+                if trabajo_total:
+                    st.metric("Trabajo total", f"{trabajo_total:.3f} J")
+                if aceleracion_res is not None:
+                    st.metric("Aceleración resultante", f"{aceleracion_res:.3f} m/s²")
+
+            # Gráfica del sistema
+            if MATPLOTLIB_OK:
+                if st.checkbox("Mostrar gráfica del sistema de fuerzas", value=True, key="mostrar_grafica"):
+                    fig = graficar_vectores_fig(
+                        st.session_state.fuerzas, Fx_R, Fy_R, magnitud, angulo,
+                        aceleracion_res, masa_total, peso_total, trabajo_total
+                    )
+                    if fig is not None:
+                        with etapa("st.image"):
+                            st.image(figura_png(fig), width="stretch")
+                    else:
+                        st.info("No hay suficientes componentes para graficar.")
     else:
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Fuerza resultante |F|", f"{magnitud:.3f} N")
-            st.metric("Dirección resultante θ", f"{angulo:.3f}°")
-            st.write(f"**Componentes:** Fx = {Fx_R:.3f} N, Fy = {Fy_R:.3f} N")
-        with col2:
-            st.metric("Momento total (simplificado)", f"{momentos:.3f} N·m")
-            if masa_total:
-                st.metric("Masa total", f"{masa_total:.3f} kg")
-            if peso_total:
-                st.metric("Peso total", f"{peso_total:.3f} N")
-        with col3:
-            if trabajo_total:
-                st.metric("Trabajo total", f"{trabajo_total:.3f} J")
-            if aceleracion_res is not None:
-                st.metric("Aceleración resultante", f"{aceleracion_res:.3f} m/s²")
-
-        # Gráfica del sistema
-        if MATPLOTLIB_OK:
-            if st.checkbox("Mostrar gráfica del sistema de fuerzas", value=True):
-                fig = graficar_vectores_fig(
-                    st.session_state.fuerzas, Fx_R, Fy_R, magnitud, angulo,
-                    aceleracion_res, masa_total, peso_total, trabajo_total
-                )
-                if fig is not None:
-                    st.pyplot(fig)
-                else:
-                    st.info("No hay suficientes componentes para graficar.")
-else:
-    st.info("Agrega fuerzas para calcular la resultante.")
+        st.info("Agrega fuerzas para calcular la resultante.")
+
+    # Caché de completar_datos en esta ejecución del fragmento
+    st.caption(
+        f"completar_datos: {estadisticas_completar['recalculadas']} recalculadas, "
+        f"{estadisticas_completar['en_cache']} desde caché"
+    )
+    _actualizar_resultados_de_la_lista()
+
+
+cronometro.marcar("página: fuerzas y resultados")
+_fuerzas_y_resultados()
+
 
 # ---- Dinámica del cuerpo (opcional) ----
-st.subheader("Análisis del cuerpo (opcional)")
-with st.form("cuerpo_fisico_form"):
-    c1, c2, c3 = st.columns(3)
-    with c1:
-        masa_cuerpo = _to_float_or_none(st.text_input("Masa del cuerpo (kg)"))
-        peso_cuerpo = _to_float_or_none(st.text_input("Peso del cuerpo (N)"))
-    with c2:
-        acel_deseada = _to_float_or_none(st.text_input("Aceleración deseada (m/s²)"))
-        tension = _to_float_or_none(st.text_input("Tensión del cable (N)"))
-    with c3:
-        ang_faltante = _to_float_or_none(st.text_input("Ángulo de la fuerza faltante (°)"))
-    submitted = st.form_submit_button("Calcular dinámica del cuerpo")
-
-if submitted:
-    if any([masa_cuerpo, peso_cuerpo, acel_deseada, tension, ang_faltante]):
-        cuerpo = CuerpoFisico(
-            masa=masa_cuerpo,
-            peso=peso_cuerpo,
-            aceleracion_deseada=acel_deseada,
-            tension=tension,
-            angulo_fuerza_faltante=ang_faltante
+@_fragmento("dinamica")
+def _dinamica_del_cuerpo():
+    _mostrando_resultado("dinamica", False)
+    st.subheader("Análisis del cuerpo (opcional)")
+    with st.form("cuerpo_fisico_form"):
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            masa_cuerpo = st.text_input("Masa del cuerpo (kg)", key="cuerpo_masa")
+            peso_cuerpo = st.text_input("Peso del cuerpo (N)", key="cuerpo_peso")
+        with c2:
+            acel_deseada = st.text_input("Aceleración deseada (m/s²)", key="cuerpo_aceleracion")
+            tension = st.text_input("Tensión del cable (N)", key="cuerpo_tension")
+        with c3:
+            ang_faltante = st.text_input("Ángulo de la fuerza faltante (°)", key="cuerpo_angulo")
+        submitted = st.form_submit_button("Calcular dinámica del cuerpo")
+
+    # Los datos enviados se guardan para que la casilla de la gráfica no borre el resultado
+    if submitted:
+        st.session_state.datos_cuerpo = tuple(
+            _to_float_or_none(v) for v in (masa_cuerpo, peso_cuerpo, acel_deseada, tension, ang_faltante))
+    datos_cuerpo = st.session_state.get("datos_cuerpo")
+    if datos_cuerpo is None:
+        return
+    if not any(datos_cuerpo):
+        st.info("No se ingresaron datos del cuerpo físico. Se omite ese análisis.")
+        return
+
+    masa_cuerpo, peso_cuerpo, acel_deseada, tension, ang_faltante = datos_cuerpo
+    cuerpo = CuerpoFisico(
+        masa=masa_cuerpo,
+        peso=peso_cuerpo,
+        aceleracion_deseada=acel_deseada,
+        tension=tension,
+        angulo_fuerza_faltante=ang_faltante
+    )
+    for f in st.session_state.fuerzas:
+        cuerpo.agregar_fuerza(f)
+
+    resultado = _cache_resultados().dinamica(cuerpo)
+    _mostrando_resultado("dinamica")
+
+    st.success(f"Tipo de problema detectado: {resultado['tipo']}")
+    colA, colB, colC = st.columns(3)
+    with colA:
+        st.metric("Fuerza resultante |F|", f"{resultado['magnitud']:.3f} N")
+        st.metric("Dirección θ", f"{resultado['angulo']:.3f}°")
+    with colB:
+        st.write(f"**Componentes:** Fx = {resultado['Fx']:.3f} N, Fy = {resultado['Fy']:.3f} N")
+        st.metric("Momento total", f"{resultado['momento']:.3f} N·m")
+    with colC:
+        st.metric("Trabajo total", f"{resultado['trabajo']:.3f} J")
+        if resultado["aceleracion"] is not None:
+            st.metric("Aceleración resultante", f"{resultado['aceleracion']:.3f} m/s²")
+
+    if resultado["fuerza_faltante_mag"] is not None:
+        if resultado["fuerza_faltante_ang"] is not None:
+            st.info(f"Fuerza faltante: {resultado['fuerza_faltante_mag']:.3f} N a {resultado['fuerza_faltante_ang']:.1f}°")
+        else:
+            st.info(f"Fuerza faltante: {resultado['fuerza_faltante_mag']:.3f} N")
+        if resultado["inconsistencia_angulo"]:
+            st.warning("Con ese ángulo, la fuerza faltante no coincide exactamente con el vector requerido; se usó la proyección más cercana.")
+
+    # Gráfica del cuerpo
+    if MATPLOTLIB_OK and st.checkbox("Mostrar gráfica del cuerpo", value=True, key="mostrar_grafica_cuerpo"):
+        fig_cuerpo = graficar_vectores_fig(
+            st.session_state.fuerzas,
+            resultado["Fx"], resultado["Fy"], resultado["magnitud"], resultado["angulo"],
+            resultado["aceleracion"], masa_cuerpo, peso_cuerpo, resultado["trabajo"]
         )
-        for f in st.session_state.fuerzas:
-            cuerpo.agregar_fuerza(f)
-
-        resultado = cuerpo.calcular_dinamica()
-
-        st.success(f"Tipo de problema detectado: {resultado['tipo']}")
-        colA, colB, colC = st.columns(3)
-        with colA:
-            st.metric("Fuerza resultante |F|", f"{resultado['magnitud']:.3f} N")
-            st.metric("Dirección θ", f"{resultado['angulo']:.3f}°")
-        with colB:
-            st.write(f"**Componentes:** Fx = {resultado['Fx']:.3f} N, Fy = {resultado['Fy']:.3f} N")
-            st.metric("Momento total", f"{resultado['momento']:.3f} N·m")
-        with colC:
-            st.metric("Trabajo total", f"{resultado['trabajo']:.3f} J")
-            if resultado["aceleracion"] is not None:
-                st.metric("Aceleración resultante", f"{resultado['aceleracion']:.3f} m/s²")
-
-        if resultado["fuerza_faltante_mag"] is not None:
-            if resultado["fuerza_faltante_ang"] is not None:
-                st.info(f"Fuerza faltante: {resultado['fuerza_faltante_mag']:.3f} N a {resultado['fuerza_faltante_ang']:.1f}°")
-            else:
-                st.info(f"Fuerza faltante: {resultado['fuerza_faltante_mag']:.3f} N")
-            if resultado["inconsistencia_angulo"]:
-                st.warning("Con ese ángulo, la fuerza faltante no coincide exactamente con el vector requerido; se usó la proyección más cercana.")
-
-        # Gráfica del cuerpo
-        if MATPLOTLIB_OK and st.checkbox("Mostrar gráfica del cuerpo", value=True):
-            fig_cuerpo = graficar_vectores_fig(
-                st.session_state.fuerzas,
-                resultado["Fx"], resultado["Fy"], resultado["magnitud"], resultado["angulo"],
-                resultado["aceleracion"], masa_cuerpo, peso_cuerpo, resultado["trabajo"]
-            )
-            if fig_cuerpo is not None:
-                st.pyplot(fig_cuerpo)
-            else:
-                st.info("No hay suficientes componentes para graficar.")
+        if fig_cuerpo is not None:
+            with etapa("st.image"):
+                st.image(figura_png(fig_cuerpo), width="stretch")
+        else:
+            st.info("No hay suficientes componentes para graficar.")
+
+
+cronometro.marcar("página: dinámica del cuerpo")
+_dinamica_del_cuerpo()
+
+
+# ---- Barrido de fuerza faltante ----
+@_fragmento("barrido")
+def _barrido_fuerza_faltante():
+    _mostrando_resultado("barrido", False)
+    st.caption("Evalúa la fuerza faltante con las fuerzas ingresadas para toda la malla de valores. "
+               "Deja vacíos el final y el paso para usar un solo valor.")
+    with st.form("barrido_form"):
+        b1, b2, b3 = st.columns(3)
+        with b1:
+            ang_ini = _to_float_or_none(st.text_input("Ángulo inicial (°)", value="0"))
+            ang_fin = _to_float_or_none(st.text_input("Ángulo final (°)", value="90"))
+            ang_paso = _to_float_or_none(st.text_input("Paso del ángulo (°)", value="0.1"))
+        with b2:
+            acel_ini = _to_float_or_none(st.text_input("Aceleración inicial (m/s²)", value="0.5"))
+            acel_fin = _to_float_or_none(st.text_input("Aceleración final (m/s²)", value="3"))
+            acel_paso = _to_float_or_none(st.text_input("Paso de la aceleración (m/s²)", value="0.5"))
+        with b3:
+            masa_ini = _to_float_or_none(st.text_input("Masa inicial (kg)", value="60"))
+            masa_fin = _to_float_or_none(st.text_input("Masa final (kg)"))
+            masa_paso = _to_float_or_none(st.text_input("Paso de la masa (kg)"))
+        barrer = st.form_submit_button("Calcular barrido")
+
+    if not barrer:
+        return
+    if None in (ang_ini, acel_ini, masa_ini):
+        st.error("Indica al menos el valor inicial del ángulo, la aceleración y la masa.")
+        return
+    _, _, (suma_fx, suma_fy), *_ = st.session_state.acumulador.resultante()
+    try:
+        barrido = _barrido(suma_fx or 0.0, suma_fy or 0.0, (ang_ini, ang_fin, ang_paso),
+                           (acel_ini, acel_fin, acel_paso), (masa_ini, masa_fin, masa_paso))
+    except ValueError as e:
+        st.error(str(e))
+        return
+
+    _mostrando_resultado("barrido")
+    optimo = barrido["optimo"]
+    st.write(f"**Puntos evaluados:** {barrido['magnitud'].size}, "
+             f"con inconsistencia de ángulo: {int(barrido['inconsistencia'].sum())}, "
+             f"factibles: {int(barrido['factible'].sum())}")
+    if optimo is None:
+        st.info("Ningún ángulo del barrido es factible: ninguno está a menos de "
+                f"{barrido['tolerancia_angulo']:.2f}° (medio paso de la malla) de la dirección requerida.")
     else:
-        st.info("No se ingresaron datos del cuerpo físico. Se omite ese análisis.")
-
-
+        o1, o2, o3, o4 = st.columns(4)
+        o1.metric("Fuerza mínima", f"{optimo['magnitud']:.3f} N")
+        o2.metric("Ángulo", f"{optimo['angulo']:.1f}°")
+        o3.metric("Aceleración", f"{optimo['aceleracion']:.3f} m/s²")
+        o4.metric("Masa", f"{optimo['masa']:.3f} kg")
+        if optimo["desviacion"] > 0:
+            st.caption(f"El ángulo óptimo está a {optimo['desviacion']:.2f}° de la dirección requerida; "
+                       "la fuerza mínima es su proyección sobre ese ángulo.")
+    if MATPLOTLIB_OK:
+        masas = barrido["masas"]
+        indice_masa = 0
+        if optimo is not None:
+            indice_masa = int((masas == optimo["masa"]).argmax())
+        fig_barrido = graficar_barrido_fig(barrido, indice_masa)
+        if fig_barrido is not None:
+            with etapa("st.image"):
+                st.image(figura_png(fig_barrido), width="stretch")
+
+
+cronometro.marcar("página: barrido")
+with st.expander("Barrido de fuerza faltante (ángulo × aceleración × masa)", expanded=False):
+    _barrido_fuerza_faltante()
+
+
+# ---- Incertidumbre (Monte Carlo) ----
+@_fragmento("montecarlo")
+def _incertidumbre_montecarlo():
+    _mostrando_resultado("montecarlo", False)
+    st.caption("Muestrea las fuerzas con σ y, si se calculó la dinámica del cuerpo, también sus datos. "
+               "La misma semilla da los mismos intervalos.")
+    with st.form("montecarlo_form"):
+        m1, m2, m3, m4 = st.columns(4)
+        n_muestras = m1.number_input("Muestras", min_value=1_000, max_value=10_000_000, value=100_000,
+                                     step=10_000, key="mc_muestras")
+        nivel = m2.selectbox("Nivel de confianza", (0.90, 0.95, 0.99), index=1, format_func="{:.0%}".format,
+                             key="mc_nivel")
+        semilla = m3.number_input("Semilla", min_value=0, value=0, step=1, key="mc_semilla")
+        sigma_masa = _to_float_or_none(m4.text_input("σ de la masa del cuerpo (kg)", key="mc_sigma_masa"))
+        simular = st.form_submit_button("Simular")
+
+    if not simular:
+        return
+    if not st.session_state.fuerzas:
+        st.info("Agrega fuerzas para simular.")
+        return
+    cuerpo = None
+    datos_cuerpo = st.session_state.get("datos_cuerpo")
+    if datos_cuerpo is not None and any(datos_cuerpo):
+        masa_cuerpo, peso_cuerpo, acel_deseada, tension, ang_faltante = datos_cuerpo
+        cuerpo = CuerpoFisico(masa=masa_cuerpo, peso=peso_cuerpo, aceleracion_deseada=acel_deseada, tension=tension,
+                              angulo_fuerza_faltante=ang_faltante,
+                              incertidumbres={"masa": sigma_masa} if sigma_masa else None)
+    try:
+        with st.spinner("Simulando…"):
+            resumen = montecarlo(st.session_state.fuerzas, int(n_muestras), cuerpo=cuerpo, nivel=nivel,
+                                 semilla=int(semilla))
+    except ValueError as e:
+        st.error(str(e))
+        return
+
+    filas = []
+    for cantidad, etiqueta in ETIQUETAS_MONTECARLO.items():
+        datos = resumen.get(cantidad)
+        if datos is not None and datos["muestras"]:
+            filas.append({"cantidad": etiqueta, "media": datos["media"], "σ": datos["desviacion"],
+                          f"inferior ({nivel:.0%})": datos["inferior"], f"superior ({nivel:.0%})": datos["superior"],
+                          "muestras válidas": datos["muestras"]})
+    st.dataframe(filas, hide_index=True)
+    _mostrando_resultado("montecarlo")
+    if not any(f.incertidumbres for f in st.session_state.fuerzas) and not sigma_masa:
+        st.info("Ninguna entrada tiene σ: los intervalos son los valores exactos.")
+
+
+cronometro.marcar("página: incertidumbre")
+with st.expander("Incertidumbre (Monte Carlo)", expanded=False):
+    _incertidumbre_montecarlo()
+
+# ---- Pie estático (solo se envía en reruns completos, no en los de los fragmentos) ----
+cronometro.marcar("página: pie")
 
 st.markdown("""
 <h3 style="text-align: center;">Objetivos principales</h3>
@@ -494,4 +625,31 @@ st.markdown(
     unsafe_allow_html=True
 )
 
+# ---- Rendimiento ----
+cronometro.marcar()
+if perfil is not None:
+    perfil.detener()
+    del st.session_state.perfil_en_curso
+duracion_rerun = time.perf_counter() - inicio_rerun
+
+with st.expander("Rendimiento", expanded=False):
+    st.checkbox("Medir tiempos por etapa", key="medir_rendimiento")
+    st.checkbox("Perfilar cada rerun con cProfile", key="perfilar_rerun")
+    if rendimiento.activo():
+        st.write(f"**Rerun completo:** {duracion_rerun * 1000:.1f} ms")
+        st.dataframe(
+            [{"etapa": nombre, "llamadas": n, "total (ms)": round(total, 3), "ms/llamada": round(media, 4)}
+             for nombre, n, total, media in rendimiento.resumen()],
+            hide_index=True,
+        )
+        st.caption("Los tiempos son inclusivos: una función llamada dentro de una sección también cuenta en ella.")
+        st.caption(_cache_resultados().texto_estadisticas())
+        if st.session_state.get("ms_fragmentos"):
+            st.write("**Última ejecución de cada fragmento:** " + ", ".join(
+                f"{nombre} {ms:.1f} ms" for nombre, ms in st.session_state.ms_fragmentos.items()))
+    if perfil is not None:
+        st.code(perfil.texto(20), language="text")
+        p1, p2 = st.columns(2)
+        p1.download_button("Descargar perfil (.prof)", perfil.contenido(), file_name="rerun.prof")
+        p2.download_button("Descargar pilas colapsadas (flamegraph)", perfil.colapsado(), file_name="rerun.folded")
 
@@ -0,0 +1,107 @@
+# Acumulador incremental: mismas sumas que recalcular la resultante completa
+import math
+import random
+
+import pytest
+
+from fisica import AcumuladorResultante, FuerzaVectorial, calcular_resultante
+from fisica.vectorial import SistemaFuerzas
+
+VACIO = (None, None, (None, None), None, 0.0, 0.0, 0.0, None)
+
+
+def _fuerzas(n, semilla=0):
+    rnd = random.Random(semilla)
+    fuerzas = []
+    for i in range(n):
+        datos = {"magnitud": rnd.uniform(1, 500), "angulo": rnd.uniform(0, 360)} if rnd.random() < 0.5 \
+            else {"Fx": rnd.uniform(-300, 300), "Fy": rnd.uniform(-300, 300)}
+        if rnd.random() < 0.5:
+            datos["masa"] = rnd.uniform(0.5, 100)
+        if rnd.random() < 0.5:
+            datos["distancia"] = rnd.uniform(0.1, 20)
+        f = FuerzaVectorial(f"F{i + 1}", altura=rnd.uniform(0, 5), **datos)
+        f.completar_datos()
+        fuerzas.append(f)
+    return fuerzas
+
+
+def _aplanar(resultado):
+    return [resultado[0], resultado[1], *resultado[2], *resultado[3:]]
+
+
+def _igual_a_recalcular(acumulador, fuerzas):
+    obtenido, esperado = _aplanar(acumulador.resultante()), _aplanar(calcular_resultante(fuerzas))
+    for a, b in zip(obtenido, esperado):
+        assert (a is None) == (b is None), (obtenido, esperado)
+        if a is not None:
+            assert math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9), (obtenido, esperado)
+
+
+def test_altas_y_bajas_intercaladas():
+    rnd = random.Random(1)
+    disponibles = _fuerzas(200)
+    acumulador, actuales = AcumuladorResultante(), []
+    for _ in range(500):
+        if actuales and rnd.random() < 0.45:
+            f = actuales.pop(rnd.randrange(len(actuales)))
+            acumulador.quitar(f)
+            disponibles.append(f)
+        elif disponibles:
+            f = disponibles.pop(rnd.randrange(len(disponibles)))
+            acumulador.agregar(f)
+            actuales.append(f)
+        if actuales:
+            _igual_a_recalcular(acumulador, actuales)
+    assert acumulador.n == len(actuales)
+
+
+def test_altas_y_bajas_por_sistema():
+    fuerzas = _fuerzas(300)
+    sistema = SistemaFuerzas.desde_fuerzas(fuerzas).completar()
+    acumulador = AcumuladorResultante(fuerzas[:10])
+    acumulador.agregar_sistema(sistema)
+    _igual_a_recalcular(acumulador, fuerzas[:10] + fuerzas)
+
+    acumulador.quitar_sistema(sistema.subconjunto(range(0, 300, 2)))
+    _igual_a_recalcular(acumulador, fuerzas[:10] + fuerzas[1::2])
+    assert acumulador.n == 10 + 150
+
+
+def test_limpiar():
+    acumulador = AcumuladorResultante(_fuerzas(20))
+    acumulador.limpiar()
+    assert acumulador.resultante() == VACIO
+    assert acumulador.n == 0
+    otra = _fuerzas(1, semilla=5)
+    acumulador.agregar(otra[0])
+    _igual_a_recalcular(acumulador, otra)
+
+
+def test_quitar_la_ultima_vuelve_a_vacio():
+    fuerzas = _fuerzas(3)
+    acumulador = AcumuladorResultante(fuerzas)
+    for f in fuerzas:
+        acumulador.quitar(f)
+    # Sin residuo de redondeo: exactamente el resultado de una lista sin componentes
+    assert acumulador.resultante() == VACIO
+    assert all(suma.valor == 0.0 for suma in acumulador.sumas.values())
+
+
+def test_sin_deriva_con_magnitudes_grandes_que_se_cancelan():
+    base = _fuerzas(5)
+    acumulador = AcumuladorResultante(base)
+    rnd = random.Random(2)
+    for _ in range(10_000):
+        grande = FuerzaVectorial("G", Fx=rnd.uniform(1e11, 1e12), Fy=rnd.uniform(-1e12, 1e12), altura=3.0)
+        opuesta = FuerzaVectorial("-G", Fx=-grande.Fx, Fy=-grande.Fy, altura=3.0)
+        for f in (grande, opuesta):
+            f.completar_datos()
+            acumulador.agregar(f)
+        acumulador.quitar(grande)
+        acumulador.quitar(opuesta)
+    acumulador.verificar(base)
+
+    desincronizado = AcumuladorResultante(base[1:])
+    with pytest.raises(AssertionError, match="desincronizado"):
+        desincronizado.verificar(base)
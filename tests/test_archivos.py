@@ -0,0 +1,37 @@
+# Importación y exportación de listas de fuerzas
+import io
+import math
+
+import numpy as np
+import pytest
+
+from fisica import FuerzaVectorial
+from fisica.archivos import escribir_fuerzas, leer_fuerzas
+
+
+def test_npy_conserva_nombres_largos():
+    nombres = ["F1", "Carga distribuida sobre la viga principal, tramo 3 de 12"]
+    fuerzas = [FuerzaVectorial(nombre, magnitud=10.0, angulo=30.0) for nombre in nombres]
+    sistema, errores = leer_fuerzas(io.BytesIO(escribir_fuerzas(fuerzas, "npy")), "npy")
+    assert errores == []
+    assert sistema.nombres.tolist() == nombres
+
+
+def test_npy_de_lista_vacia():
+    sistema, _ = leer_fuerzas(io.BytesIO(escribir_fuerzas([], "npy")), "npy")
+    assert sistema.n == 0
+
+
+def test_npy_desde_ruta_no_copia_las_columnas(tmp_path):
+    fuerzas = [FuerzaVectorial(f"F{i}", magnitud=10.0 + i, angulo=30.0, altura=float(i)) for i in range(50)]
+    ruta = tmp_path / "fuerzas.npy"
+    ruta.write_bytes(escribir_fuerzas(fuerzas, "npy"))
+    sistema, errores = leer_fuerzas(str(ruta))
+    assert errores == []
+    # Las columnas que completar no calcula siguen apuntando al archivo mapeado
+    base = sistema.altura
+    while base.base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    assert isinstance(base, np.memmap)
+    assert sistema.altura.tolist() == [float(i) for i in range(50)]
+    assert sistema.Fx[1] == pytest.approx(11.0 * math.cos(math.radians(30.0)))
@@ -0,0 +1,58 @@
+# Óptimo del barrido de fuerza faltante
+import math
+
+from fisica import CuerpoFisico, FuerzaVectorial
+from fisica.barrido import barrer_fuerza_faltante, rango
+
+ANGULOS, ACELERACIONES, MASAS = rango(0, 90, 0.1), rango(0.5, 3, 0.5), rango(60)
+
+
+def test_sin_fuerzas_el_optimo_es_empujar_en_x():
+    optimo = barrer_fuerza_faltante([], ANGULOS, ACELERACIONES, MASAS)["optimo"]
+    assert (optimo["angulo"], optimo["aceleracion"], optimo["magnitud"]) == (0.0, 0.5, 30.0)
+
+
+def test_sin_angulo_factible_no_hay_optimo():
+    # La fuerza requerida apunta hacia abajo (cuarto cuadrante), fuera de 0°-90°
+    fuerzas = [FuerzaVectorial(magnitud=100, angulo=120), FuerzaVectorial(magnitud=80, angulo=30)]
+    barrido = barrer_fuerza_faltante(fuerzas, ANGULOS, ACELERACIONES, MASAS)
+    assert barrido["optimo"] is None
+    assert not barrido["factible"].any()
+
+
+def test_optimo_coincide_con_calcular_dinamica():
+    fuerzas = [FuerzaVectorial(Fx=-10.0, Fy=-10.0)]
+    optimo = barrer_fuerza_faltante(fuerzas, ANGULOS, rango(0), MASAS)["optimo"]
+    assert optimo["angulo"] == 45.0
+
+    cuerpo = CuerpoFisico(masa=60.0, aceleracion_deseada=0.0, angulo_fuerza_faltante=45.0)
+    for f in fuerzas:
+        cuerpo.agregar_fuerza(f)
+    dinamica = cuerpo.calcular_dinamica()
+    assert not dinamica["inconsistencia_angulo"]
+    assert math.isclose(optimo["magnitud"], dinamica["fuerza_faltante_mag"])
+
+
+def test_direccion_entre_dos_angulos_de_la_malla():
+    # Fuerza requerida de 10 N a 33.3°: con una malla de 5° el ángulo más cercano es 35°
+    fuerzas = [FuerzaVectorial(magnitud=10.0, angulo=33.3 + 180.0)]
+    angulos = rango(0, 90, 5)
+    barrido = barrer_fuerza_faltante(fuerzas, angulos, rango(0), MASAS)
+    optimo = barrido["optimo"]
+    assert barrido["tolerancia_angulo"] == 2.5
+    assert barrido["factible"].sum() == 1
+    assert optimo["angulo"] == 35.0
+    assert math.isclose(optimo["desviacion"], 1.7)
+    assert math.isclose(optimo["magnitud"], 10.0 * math.cos(math.radians(1.7)))
+
+    # Mismo valor que calcular_dinamica con ese ángulo fijo (la proyección sobre la dirección)
+    cuerpo = CuerpoFisico(masa=60.0, aceleracion_deseada=0.0, angulo_fuerza_faltante=35.0)
+    for f in fuerzas:
+        cuerpo.agregar_fuerza(f)
+    assert math.isclose(optimo["magnitud"], cuerpo.calcular_dinamica()["fuerza_faltante_mag"])
+
+    # Con tolerancia explícita: 0 exige el ángulo exacto; 4° también acepta 30°
+    assert barrer_fuerza_faltante(fuerzas, angulos, rango(0), MASAS, tolerancia_angulo=0.0)["optimo"] is None
+    amplio = barrer_fuerza_faltante(fuerzas, angulos, rango(0), MASAS, tolerancia_angulo=4.0)
+    assert angulos[amplio["factible"][0, 0]].tolist() == [30.0, 35.0]
+    assert amplio["optimo"]["angulo"] == 35.0
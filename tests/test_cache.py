@@ -0,0 +1,110 @@
+# Caché de resultados: aciertos y fallos, vencimiento, LRU, poda y archivo en disco
+import sqlite3
+
+import pytest
+
+from fisica import CuerpoFisico, FuerzaVectorial, calcular_resultante
+from fisica import cache as modulo_cache
+from fisica.cache import FORMATO, CacheResultados, clave_sistema
+
+
+def _fuerzas(desplazamiento=0.0):
+    return [FuerzaVectorial("A", magnitud=10.0 + desplazamiento, angulo=30.0, altura=2.0),
+            FuerzaVectorial("B", Fx=-4.0, Fy=7.0, distancia=1.5),
+            FuerzaVectorial("C", masa=3.0, aceleracion=2.0, angulo=45.0)]
+
+
+@pytest.fixture
+def reloj(monkeypatch):
+    ahora = [1_000.0]
+    monkeypatch.setattr(modulo_cache.time, "time", lambda: ahora[0])
+    return ahora
+
+
+def test_clave_no_depende_del_orden_ni_del_nombre():
+    fuerzas = _fuerzas()
+    otras = _fuerzas()[::-1]
+    otras[0].nombre = "otro"
+    assert clave_sistema(fuerzas) == clave_sistema(otras)
+    assert clave_sistema(fuerzas) != clave_sistema(_fuerzas(1e-9))
+    assert clave_sistema(fuerzas) != clave_sistema(fuerzas, CuerpoFisico(masa=2.0))
+    # Completar las fuerzas no cambia su clave: solo cuentan las entradas
+    clave = clave_sistema(fuerzas)
+    for f in fuerzas:
+        f.completar_datos()
+    assert clave_sistema(fuerzas) == clave
+
+
+def test_acierto_y_fallo():
+    cache = CacheResultados()
+    esperado = calcular_resultante(_fuerzas())
+    assert cache.resultante(_fuerzas()) == esperado
+    assert cache.resultante(_fuerzas()) == esperado
+    assert cache.resultante(_fuerzas(1.0)) != esperado
+    assert cache.estadisticas == {"aciertos_memoria": 1, "aciertos_disco": 0, "fallos": 2, "directos": 0}
+
+    cuerpo = CuerpoFisico(masa=5.0, aceleracion_deseada=1.0)
+    for f in _fuerzas():
+        cuerpo.agregar_fuerza(f)
+    esperado = cuerpo.calcular_dinamica()
+    nuevo = CuerpoFisico(masa=5.0, aceleracion_deseada=1.0)
+    for f in _fuerzas():
+        nuevo.agregar_fuerza(f)
+    assert cache.dinamica(nuevo) == esperado
+    assert cache.estadisticas["fallos"] == 3
+    # Con las fuerzas ya completas se calcula sin consultar
+    assert cache.dinamica(nuevo) == esperado
+    assert cache.estadisticas["directos"] == 1
+
+
+def test_vencimiento(reloj):
+    cache = CacheResultados(ttl=10)
+    cache.guardar("a", 1)
+    reloj[0] += 9
+    assert cache.obtener("a") == 1
+    reloj[0] += 2
+    assert cache.obtener("a") is None
+    assert cache.estadisticas["fallos"] == 1
+
+
+def test_lru_en_memoria():
+    cache = CacheResultados(max_memoria=2)
+    cache.guardar("a", 1)
+    cache.guardar("b", 2)
+    assert cache.obtener("a") == 1  # "b" pasa a ser la menos usada
+    cache.guardar("c", 3)
+    assert cache.obtener("b") is None
+    assert (cache.obtener("a"), cache.obtener("c")) == (1, 3)
+
+
+def test_poda_en_disco(tmp_path, reloj):
+    ruta = tmp_path / "cache.sqlite"
+    cache = CacheResultados(ruta, max_memoria=1, max_disco=10, ttl=100, confirmar_cada=50)
+    cache.guardar("viejo", 0)
+    reloj[0] += 200
+    for i in range(255):
+        reloj[0] += 0.01
+        cache.guardar(f"k{i}", i)  # la escritura 256 poda
+    cache.cerrar()
+
+    claves = [fila[0] for fila in sqlite3.connect(ruta).execute("SELECT clave FROM resultados ORDER BY usado")]
+    assert claves == [f"k{i}" for i in range(245, 255)]
+
+
+def test_reabrir_conserva_y_descarta_otros_formatos(tmp_path):
+    ruta = tmp_path / "cache.sqlite"
+    cache = CacheResultados(ruta)
+    esperado = cache.resultante(_fuerzas())
+    cache.cerrar()
+    db = sqlite3.connect(ruta)
+    db.execute("INSERT INTO resultados VALUES ('resultante:antiguo', '[]', 0, 0)")
+    db.execute("INSERT INTO resultados VALUES ('v0:resultante:antiguo', '[]', 0, 0)")
+    db.commit()
+    db.close()
+
+    cache = CacheResultados(ruta)
+    assert cache.resultante(_fuerzas()) == esperado
+    assert cache.estadisticas["aciertos_disco"] == 1
+    cache.cerrar()
+    claves = [fila[0] for fila in sqlite3.connect(ruta).execute("SELECT clave FROM resultados")]
+    assert len(claves) == 1 and claves[0].startswith(FORMATO + ":resultante:")
@@ -0,0 +1,150 @@
+# Paridad entre el camino escalar y el motor columnar de calcular_resultante y calcular_dinamica
+import math
+
+import pytest
+
+from fisica import CuerpoFisico, FuerzaVectorial, calcular_resultante
+from fisica import calculo
+
+CASOS = {
+    "polar": dict(magnitud=100.0, angulo=120.0),
+    "componentes": dict(Fx=30.0, Fy=-40.0, altura=2.0),
+    "masa_cero": dict(magnitud=50.0, angulo=30.0, masa=0.0),
+    "solo_fx": dict(Fx=12.5),
+    "f_igual_ma_con_angulo": dict(masa=4.0, aceleracion=2.5, angulo=60.0, distancia=3.0),
+    "solo_peso": dict(peso=98.1),
+    "sin_datos": dict(),
+}
+
+CUERPOS = {
+    "fuerzas_aplicadas": dict(masa=10.0),
+    "grua": dict(masa=20.0, tension=250.0),
+    "fuerza_faltante": dict(masa=5.0, aceleracion_deseada=3.0),
+    "fuerza_faltante_con_angulo": dict(masa=5.0, aceleracion_deseada=3.0, angulo_fuerza_faltante=0.0),
+    "sin_masa": dict(),
+}
+
+
+def _fuerzas(casos, n):
+    return [FuerzaVectorial(f"F{i}", **CASOS[casos[i % len(casos)]]) for i in range(n)]
+
+
+def _aplanar(resultado):
+    return [resultado[0], resultado[1], *resultado[2], *resultado[3:]]
+
+
+def _iguales(a, b):
+    if a is None or b is None:
+        return a is b
+    if isinstance(a, (bool, str)):
+        return a == b
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def _estado(fuerzas):
+    campos = ("magnitud", "angulo", "Fx", "Fy", "masa", "peso", "aceleracion", "trabajo")
+    return [([getattr(f, c) for c in campos], f.mensajes_faltantes()) for f in fuerzas]
+
+
+def _con_umbral(monkeypatch, umbral, funcion, *args):
+    monkeypatch.setattr(calculo, "UMBRAL_VECTORIZADO", umbral)
+    return funcion(*args)
+
+
+# Con el umbral por defecto, las listas de TAMANOS quedan a un lado y otro de él; con umbral 1
+# todas van por el motor columnar. La referencia es siempre el camino escalar.
+TAMANOS = (len(CASOS), calculo.UMBRAL_VECTORIZADO + 1)
+UMBRALES = (calculo.UMBRAL_VECTORIZADO, 1)
+COMBINACIONES = [[nombre] for nombre in CASOS] + [list(CASOS)]
+
+
+@pytest.mark.parametrize("umbral", UMBRALES)
+@pytest.mark.parametrize("n", TAMANOS)
+@pytest.mark.parametrize("casos", COMBINACIONES, ids=lambda casos: "+".join(casos))
+def test_resultante_igual_en_ambos_caminos(monkeypatch, casos, n, umbral):
+    escalar = _fuerzas(casos, n)
+    vectorial = _fuerzas(casos, n)
+    esperado = _con_umbral(monkeypatch, math.inf, calcular_resultante, escalar)
+    obtenido = _con_umbral(monkeypatch, umbral, calcular_resultante, vectorial)
+
+    assert all(_iguales(a, b) for a, b in zip(_aplanar(obtenido), _aplanar(esperado))), (obtenido, esperado)
+    assert _estado(vectorial) == _estado(escalar)
+
+
+@pytest.mark.parametrize("umbral", UMBRALES)
+@pytest.mark.parametrize("n", TAMANOS)
+@pytest.mark.parametrize("cuerpo", CUERPOS)
+def test_dinamica_igual_en_ambos_caminos(monkeypatch, cuerpo, n, umbral):
+    resultados = []
+    for umbral in (math.inf, umbral):
+        c = CuerpoFisico(**CUERPOS[cuerpo])
+        for f in _fuerzas(list(CASOS), n):
+            c.agregar_fuerza(f)
+        resultados.append((_con_umbral(monkeypatch, umbral, c.calcular_dinamica), _estado(c.fuerzas_aplicadas)))
+    (esperado, estado_escalar), (obtenido, estado_vectorial) = resultados
+
+    assert esperado.keys() == obtenido.keys()
+    for clave in esperado:
+        assert _iguales(obtenido[clave], esperado[clave]), (clave, obtenido[clave], esperado[clave])
+    assert estado_vectorial == estado_escalar
+
+
+def test_sin_componentes_devuelve_vacio(monkeypatch):
+    for umbral in (math.inf, 1):
+        fuerzas = _fuerzas(["sin_datos", "solo_peso"], 10)
+        assert _con_umbral(monkeypatch, umbral, calcular_resultante, fuerzas) == \
+            (None, None, (None, None), None, 0.0, 0.0, 0.0, None)
+
+
+def test_masa_cero_no_da_aceleracion(monkeypatch):
+    for umbral in (math.inf, 1):
+        fuerzas = _fuerzas(["masa_cero"], 3)
+        resultado = _con_umbral(monkeypatch, umbral, calcular_resultante, fuerzas)
+        assert resultado[7] is None
+        assert fuerzas[0].aceleracion is None
+        assert "Masa no puede ser cero para calcular aceleración." in fuerzas[0].mensajes_faltantes()
+
+
+def test_completar_columnar_anota_faltantes_y_calculados():
+    # a_fuerzas de un sistema completado da las mismas fuerzas que completar_datos una por una
+    from fisica.vectorial import SistemaFuerzas
+
+    for combinacion in COMBINACIONES:
+        escalar = _fuerzas(combinacion, len(CASOS))
+        importadas = SistemaFuerzas.desde_fuerzas(escalar).completar().a_fuerzas()
+        for f in escalar:
+            f.completar_datos()
+        assert _estado(importadas) == _estado(escalar)
+        assert [f._derivados for f in importadas] == [f._derivados for f in escalar]
+        assert not any(f._pendientes for f in importadas)
+
+
+def test_mezcla_de_nuevas_completadas_y_modificadas(monkeypatch):
+    # Solo las nuevas van por columnas; las demás recalculan sus etapas pendientes. Los contadores de
+    # completar_datos quedan igual que en el camino escalar.
+    from fisica import ESTADISTICAS_COMPLETAR, usar_estadisticas_completar
+
+    umbral = calculo.UMBRAL_VECTORIZADO
+
+    def preparar():
+        fuerzas = _fuerzas(list(CASOS), 3 * umbral)
+        for f in fuerzas[:umbral]:
+            f.completar_datos()
+        for f in fuerzas[:umbral:5]:
+            f.distancia = 2.0
+        return fuerzas
+
+    resultados = []
+    for umbral_prueba in (math.inf, umbral):
+        fuerzas = preparar()
+        estadisticas = usar_estadisticas_completar({"recalculadas": 0, "en_cache": 0})
+        try:
+            resultado = _con_umbral(monkeypatch, umbral_prueba, calcular_resultante, fuerzas)
+        finally:
+            usar_estadisticas_completar(ESTADISTICAS_COMPLETAR)
+        resultados.append((_aplanar(resultado), _estado(fuerzas), estadisticas))
+    (esperado, estado_escalar, contadores_escalar), (obtenido, estado_vectorial, contadores_vectorial) = resultados
+
+    assert all(_iguales(a, b) for a, b in zip(obtenido, esperado)), (obtenido, esperado)
+    assert estado_vectorial == estado_escalar
+    assert contadores_vectorial == contadores_escalar
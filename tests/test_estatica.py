@@ -0,0 +1,41 @@
+# Armaduras: varias en un solo sistema, con bloques singulares
+import pytest
+
+from fisica import FuerzaVectorial
+from fisica.estatica import SCIPY_OK, Armadura, resolver_armaduras
+
+MODOS = [False] + ([True] if SCIPY_OK else [])
+
+
+def _triangulo(angulo_rodillo):
+    # Triángulo cargado en el vértice superior; con el rodillo horizontal (0°) nada impide girar alrededor de A
+    a = Armadura()
+    a.agregar_nudo("A", 0.0, 0.0)
+    a.agregar_nudo("B", 2.0, 0.0)
+    a.agregar_nudo("C", 1.0, 1.0)
+    a.agregar_barra("A", "B")
+    a.agregar_barra("A", "C")
+    a.agregar_barra("C", "B")
+    a.agregar_apoyo("A", "articulado")
+    a.agregar_apoyo("B", "rodillo", angulo_rodillo)
+    a.agregar_carga("C", FuerzaVectorial("P", Fx=0.0, Fy=-10.0))
+    return a
+
+
+@pytest.mark.parametrize("disperso", MODOS)
+def test_mecanismo_nombra_su_armadura(disperso):
+    with pytest.raises(ValueError, match="Armadura 2:"):
+        resolver_armaduras([_triangulo(90.0), _triangulo(0.0), _triangulo(90.0)], disperso=disperso)
+
+
+@pytest.mark.parametrize("disperso", MODOS)
+def test_armaduras_validas_junto_a_otras(disperso):
+    juntas = resolver_armaduras([_triangulo(90.0)] * 3, disperso=disperso)
+    sola = resolver_armaduras([_triangulo(90.0)], disperso=disperso)[0]
+    for resultado in juntas:
+        assert resultado["barras"].tolist() == pytest.approx(sola["barras"].tolist())
+        assert resultado["reacciones"] == pytest.approx({"A.Rx": 0.0, "A.Ry": 5.0, "B.R": 5.0})
+
+
+def test_lista_vacia():
+    assert resolver_armaduras([]) == []
@@ -0,0 +1,95 @@
+# Caché con seguimiento de cambios de FuerzaVectorial.completar_datos
+import math
+import threading
+
+from fisica import FuerzaVectorial, usar_estadisticas_completar
+from fisica.fuerzas import g
+
+
+def _completa(**datos):
+    f = FuerzaVectorial("F", **datos)
+    f.completar_datos()
+    return f
+
+
+def test_cambiar_masa_recalcula_peso_y_aceleracion():
+    f = _completa(magnitud=10.0, angulo=0.0, masa=2.0)
+    f.masa = 5.0
+    f.completar_datos()
+    assert math.isclose(f.peso, 5.0 * g)
+    assert math.isclose(f.aceleracion, 2.0)
+    assert math.isclose(f.Fx, 10.0)
+
+
+def test_cambiar_componente_recalcula_polar_y_trabajo():
+    f = _completa(Fx=3.0, Fy=4.0, distancia=2.0)
+    f.Fx = 0.0
+    f.completar_datos()
+    referencia = _completa(Fx=0.0, Fy=4.0, distancia=2.0)
+    assert (f.magnitud, f.angulo, f.trabajo) == (referencia.magnitud, referencia.angulo, referencia.trabajo)
+
+
+def test_cambiar_aceleracion_recalcula_magnitud_derivada():
+    f = _completa(masa=4.0, aceleracion=2.5, angulo=60.0)
+    f.aceleracion = 1.0
+    f.completar_datos()
+    referencia = _completa(masa=4.0, aceleracion=1.0, angulo=60.0)
+    assert (f.magnitud, f.Fx, f.Fy) == (referencia.magnitud, referencia.Fx, referencia.Fy)
+    assert f.mensajes_faltantes() == referencia.mensajes_faltantes()
+
+
+def test_campo_calculado_asignado_pasa_a_ser_entrada():
+    f = _completa(peso=98.1)
+    f.masa = 3.0  # antes calculada a partir del peso
+    f.completar_datos()
+    assert (f.masa, f.peso) == (3.0, 98.1)
+    f.peso = 9.81
+    f.completar_datos()
+    assert f.masa == 3.0
+
+
+def test_sin_cambios_no_recalcula():
+    estadisticas = usar_estadisticas_completar({"recalculadas": 0, "en_cache": 0})
+    f = _completa(magnitud=10.0, angulo=30.0)
+    f.altura = 2.0
+    f.magnitud = 10.0
+    f.completar_datos()
+    assert estadisticas == {"recalculadas": 1, "en_cache": 1}
+
+
+def test_contadores_por_hilo():
+    # Cada sesión de Streamlit corre en su propio hilo y no debe ver los contadores de otra
+    resultados = {}
+
+    def sesion(nombre, n):
+        estadisticas = usar_estadisticas_completar({"recalculadas": 0, "en_cache": 0})
+        for _ in range(n):
+            _completa(magnitud=1.0, angulo=0.0)
+        resultados[nombre] = dict(estadisticas)
+
+    hilos = [threading.Thread(target=sesion, args=(nombre, n)) for nombre, n in (("a", 3), ("b", 5))]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert resultados == {"a": {"recalculadas": 3, "en_cache": 0}, "b": {"recalculadas": 5, "en_cache": 0}}
+
+
+def test_asignar_componente_no_se_revierte():
+    # Fy se calculó desde la forma polar; al asignar Fx se conserva y se recalculan magnitud y ángulo
+    f = _completa(magnitud=10, angulo=0)
+    f.Fx = 5.0
+    f.completar_datos()
+    assert (f.Fx, f.Fy, f.magnitud, f.angulo) == (5.0, 0.0, 5.0, 0.0)
+
+
+def test_asignar_angulo_despues_de_componentes():
+    f = _completa(Fx=3.0, Fy=4.0)
+    f.angulo = 0.0
+    f.completar_datos()
+    assert (f.magnitud, f.angulo, f.Fx) == (5.0, 0.0, 5.0)
+    assert math.isclose(f.Fy, 0.0, abs_tol=1e-12)
+    # Lo recalculado vuelve a depender de la nueva forma
+    f.magnitud = 2.0
+    f.completar_datos()
+    assert (f.Fx, f.angulo) == (2.0, 0.0)
@@ -0,0 +1,49 @@
+# Caché de figuras: misma entrada -> misma figura; las que salen de la caché se liberan
+import gc
+import weakref
+
+import pytest
+
+pytest.importorskip("matplotlib")
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+from fisica import FuerzaVectorial, calcular_resultante, grafica  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_vacia():
+    grafica.limpiar_cache_figuras()
+    yield
+    grafica.limpiar_cache_figuras()
+
+
+def _figura(i):
+    fuerzas = [FuerzaVectorial("A", magnitud=10.0 + i, angulo=30.0), FuerzaVectorial("B", Fx=-4.0, Fy=7.0)]
+    magnitud, angulo, (Fx, Fy), _, masa, peso, trabajo, aceleracion = calcular_resultante(fuerzas)
+    return grafica.graficar_vectores_fig(fuerzas, Fx, Fy, magnitud, angulo, aceleracion, masa, peso, trabajo)
+
+
+def test_misma_entrada_devuelve_la_figura_en_cache():
+    fig = _figura(0)
+    assert _figura(0) is fig
+    assert _figura(1) is not fig
+    assert grafica.figura_png(fig) is grafica.figura_png(fig)
+
+
+def test_figuras_desalojadas_se_cierran_y_liberan():
+    primera = weakref.ref(_figura(0))
+    for i in range(1, grafica.TAMANO_CACHE_FIGURAS):
+        _figura(i)
+    assert _figura(0) is primera()  # aún en caché; pasa a ser la más reciente
+
+    segunda = weakref.ref(_figura(1))
+    for i in range(grafica.TAMANO_CACHE_FIGURAS, 2 * grafica.TAMANO_CACHE_FIGURAS):
+        _figura(i)
+    gc.collect()
+    # pyplot no guarda ninguna y las desalojadas no quedan vivas
+    assert plt.get_fignums() == []
+    assert primera() is None and segunda() is None
+    assert len(grafica._cache_figuras) == grafica.TAMANO_CACHE_FIGURAS
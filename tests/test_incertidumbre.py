@@ -0,0 +1,84 @@
+# Propagación de incertidumbre por Monte Carlo
+import pytest
+
+from fisica import CuerpoFisico, FuerzaVectorial
+from fisica.incertidumbre import montecarlo
+
+
+def test_valores_enteros_no_truncan_las_muestras():
+    # Con magnitud=10 (entero) las muestras no deben redondearse hacia cero al guardarse
+    enteros = montecarlo([FuerzaVectorial("F", magnitud=10, angulo=0, incertidumbres={"magnitud": 1.0})],
+                         20_000, semilla=1)
+    reales = montecarlo([FuerzaVectorial("F", magnitud=10.0, angulo=0.0, incertidumbres={"magnitud": 1.0})],
+                        20_000, semilla=1)
+    assert enteros["magnitud"] == reales["magnitud"]
+    assert enteros["magnitud"]["media"] == pytest.approx(10.0, abs=0.05)
+
+
+def _cuerpo_con_fuerzas():
+    cuerpo = CuerpoFisico(masa=10.0, aceleracion_deseada=2.0)
+    for f in (FuerzaVectorial("A", magnitud=40.0, angulo=30.0), FuerzaVectorial("B", Fx=-5.0, Fy=12.0),
+              FuerzaVectorial("C", masa=4.0, aceleracion=2.5, angulo=60.0)):
+        f.completar_datos()
+        cuerpo.agregar_fuerza(f)
+    return cuerpo
+
+
+def test_sigma_cero_da_calcular_dinamica():
+    cuerpo = _cuerpo_con_fuerzas()
+    esperado = cuerpo.calcular_dinamica()
+    for f in cuerpo.fuerzas_aplicadas:
+        f.incertidumbres = {"masa": 0.0} if f.masa is not None else {"magnitud": 0.0}
+    cuerpo.incertidumbres = {"masa": 0.0}
+    resultado = montecarlo(cuerpo.fuerzas_aplicadas, 500, cuerpo=cuerpo, semilla=3)
+    for cantidad, valor in (("cuerpo_magnitud", esperado["magnitud"]), ("cuerpo_angulo", esperado["angulo"]),
+                            ("cuerpo_aceleracion", esperado["aceleracion"]), ("Fx", esperado["Fx"]),
+                            ("Fy", esperado["Fy"]), ("momento", esperado["momento"]),
+                            ("cuerpo_fuerza_faltante_mag", esperado["fuerza_faltante_mag"]),
+                            ("cuerpo_fuerza_faltante_ang", esperado["fuerza_faltante_ang"])):
+        r = resultado[cantidad]
+        assert r["media"] == pytest.approx(valor, rel=1e-12, abs=1e-12), cantidad
+        assert r["desviacion"] == pytest.approx(0.0, abs=1e-9), cantidad
+        assert r["inferior"] == pytest.approx(valor, rel=1e-12) == r["superior"], cantidad
+
+
+def test_misma_semilla_con_cualquier_tamano_de_bloque():
+    cuerpo = _cuerpo_con_fuerzas()
+    cuerpo.fuerzas_aplicadas[0].incertidumbres = {"magnitud": 2.0, "angulo": (25.0, 35.0)}
+    cuerpo.fuerzas_aplicadas[2].incertidumbres = {"masa": 0.3}
+    cuerpo.incertidumbres = {"masa": 0.5}
+    resultados = [montecarlo(cuerpo.fuerzas_aplicadas, 5_000, cuerpo=cuerpo, semilla=7, tamano_bloque=tamano)
+                  for tamano in (5_000, 1_000, 333)]
+    for otro in resultados[1:]:
+        assert otro.keys() == resultados[0].keys()
+        for cantidad, r in resultados[0].items():
+            # Las mismas muestras: media y desviación coinciden salvo redondeo; los cuantiles se
+            # aproximan por bloque
+            assert otro[cantidad]["muestras"] == r["muestras"]
+            assert otro[cantidad]["media"] == pytest.approx(r["media"], rel=1e-9, abs=1e-9), cantidad
+            assert otro[cantidad]["desviacion"] == pytest.approx(r["desviacion"], rel=1e-9, abs=1e-9), cantidad
+            for extremo in ("inferior", "superior"):
+                assert otro[cantidad][extremo] == pytest.approx(r[extremo], abs=0.05 * r["desviacion"] + 1e-9)
+
+
+def test_sigma_en_la_masa_mueve_una_fuerza_de_masa_por_aceleracion():
+    f = FuerzaVectorial("C", masa=4.0, aceleracion=2.5, angulo=60.0, incertidumbres={"masa": 0.4})
+    f.completar_datos()
+    resultado = montecarlo([f], 20_000, semilla=2)
+    # |F| = m·a: σ = 0.4·2.5
+    assert resultado["magnitud"]["media"] == pytest.approx(10.0, rel=0.01)
+    assert resultado["magnitud"]["desviacion"] == pytest.approx(1.0, rel=0.05)
+    assert resultado["angulo"]["desviacion"] == pytest.approx(0.0, abs=1e-9)
+    # Las entradas dadas por el usuario no se tocan
+    assert (f.masa, f.aceleracion, f.angulo) == (4.0, 2.5, 60.0)
+
+
+def test_sigma_sin_valor_pide_un_rango():
+    f = FuerzaVectorial("F", Fx=3.0, Fy=4.0, incertidumbres={"distancia": 0.1})
+    with pytest.raises(ValueError, match="'distancia' tiene σ pero no valor"):
+        montecarlo([f], 10, semilla=0)
+    f.incertidumbres = {"distancia": (2.0, 1.0)}
+    with pytest.raises(ValueError, match="de menor a mayor"):
+        montecarlo([f], 10, semilla=0)
+    f.incertidumbres = {"distancia": (1.0, 2.0)}
+    assert montecarlo([f], 1_000, semilla=0)["trabajo"]["media"] == pytest.approx(7.5, rel=0.05)
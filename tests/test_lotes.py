@@ -0,0 +1,74 @@
+# Resolución por lotes: errores por fila y paridad entre resolver_problema y resolver_problemas_juntos
+import math
+
+from fisica.lotes import resolver_lotes, resolver_problema, resolver_problemas_juntos
+
+ENTERO_ENORME = int("9" * 400)
+
+
+def test_fila_invalida_no_detiene_el_lote():
+    filas = [
+        {"fuerzas": [{"magnitud": 10, "angulo": 0}]},
+        {"fuerzas": [{"magnitud": ENTERO_ENORME}]},
+        {"fuerzas": [{"Fx": 1e200, "Fy": 1.0}], "masa": 2},
+        [1, 2],
+        {"fuerzas": [{"magnitud": 3, "angulo": 90}], "masa": 1},
+    ]
+    resultados = [r for lote in resolver_lotes(filas, tamano_lote=2) for r in lote]
+
+    assert [r["id"] for r in resultados] == [0, 1, 2, 3, 4]
+    assert [("error" in r) for r in resultados] == [False, True, True, True, False]
+    assert resultados[1]["error"].startswith("OverflowError")
+    assert resultados[4]["cuerpo_aceleracion"] == 3.0
+
+
+def test_fila_invalida_no_afecta_al_resto_del_lote_conjunto():
+    validas = [{"fuerzas": [{"magnitud": 10, "angulo": 0}]}, {"fuerzas": [{"magnitud": 3, "angulo": 90}], "masa": 1}]
+    invalidas = [{"fuerzas": [{"magnitud": ENTERO_ENORME}]}, {"fuerzas": [{"Fx": 1e200, "Fy": 1.0}], "masa": 2}]
+    resultados = resolver_problemas_juntos(validas[:1] + invalidas + validas[1:])
+
+    assert [("error" in r) for r in resultados] == [False, True, True, False]
+    assert resultados[0]["magnitud"] == 10.0
+    assert resultados[3]["cuerpo_aceleracion"] == 3.0
+
+
+FUERZAS = [
+    {"magnitud": 10, "angulo": 30, "altura": 2},
+    {"Fx": -4, "Fy": 7, "distancia": 1.5},
+    {"magnitud": 10, "distancia": 2},
+    {"masa": 3, "aceleracion": 2, "angulo": 45},
+    {"peso": 19.62, "Fy": 5, "altura": 1},
+    {"masa": 0, "magnitud": 5, "angulo": 0},
+    {},
+]
+CUERPOS = [
+    {},
+    {"masa": 5},
+    {"masa": 20, "tension": 250},
+    {"masa": 5, "aceleracion_deseada": 3},
+    {"masa": 5, "aceleracion_deseada": 3, "angulo_fuerza_faltante": 0},
+    {"masa": 5, "aceleracion_deseada": 3, "angulo_fuerza_faltante": 90},
+    {"peso": 49.05},
+]
+
+
+def _filas():
+    filas = []
+    for i, cuerpo in enumerate(CUERPOS):
+        for inicio in range(len(FUERZAS)):
+            for n in (0, 1, 3):
+                fuerzas = [FUERZAS[(inicio + k * (i + 1)) % len(FUERZAS)] for k in range(n)]
+                filas.append({"fuerzas": fuerzas, **cuerpo})
+    return filas
+
+
+def test_juntos_igual_que_uno_por_uno():
+    filas = _filas() + [{"fuerzas": [{"magnitud": 10, "distancia": 2}], "masa": 5}]
+    for fila, obtenido in zip(filas, resolver_problemas_juntos(filas)):
+        esperado = resolver_problema(fila)
+        assert obtenido.keys() == esperado.keys(), fila
+        for clave, valor in esperado.items():
+            if isinstance(valor, float):
+                assert math.isclose(obtenido[clave], valor, rel_tol=1e-9, abs_tol=1e-9), (fila, clave)
+            else:
+                assert obtenido[clave] == valor, (fila, clave)
@@ -0,0 +1,50 @@
+# calcular_dinamica en varios procesos: mismo orden y mismos resultados que en serie
+import random
+
+import pytest
+
+from fisica import CuerpoFisico, FuerzaVectorial
+from fisica.paralelo import calcular_dinamica_paralelo, desempaquetar_cuerpo, empaquetar_cuerpo
+
+
+def _cuerpos(n, semilla=0):
+    rnd = random.Random(semilla)
+    cuerpos = []
+    for i in range(n):
+        cuerpo = CuerpoFisico(masa=rnd.uniform(1, 50), aceleracion_deseada=rnd.choice([None, rnd.uniform(0, 5)]),
+                              tension=rnd.choice([None, None, rnd.uniform(0, 500)]))
+        for _ in range(rnd.randint(0, 4)):
+            datos = {"magnitud": rnd.uniform(1, 100), "angulo": rnd.uniform(0, 360)} if rnd.random() < 0.5 \
+                else {"Fx": rnd.uniform(-50, 50), "Fy": rnd.uniform(-50, 50)}
+            cuerpo.agregar_fuerza(FuerzaVectorial(f"F{i}", altura=rnd.uniform(0, 3), **datos))
+        cuerpos.append(cuerpo)
+    return cuerpos
+
+
+def test_mismo_orden_y_resultados_que_en_serie():
+    cuerpos = _cuerpos(101)
+    esperado = [desempaquetar_cuerpo(empaquetar_cuerpo(c)).calcular_dinamica() for c in cuerpos]
+    # Fragmentos pequeños: varios en vuelo por trabajador y el último incompleto
+    obtenido = list(calcular_dinamica_paralelo(cuerpos, trabajadores=2, tamano_fragmento=7))
+    assert obtenido == esperado
+    assert [r["magnitud"] for r in obtenido] == [c.calcular_dinamica()["magnitud"] for c in cuerpos]
+
+
+def test_acepta_paquetes():
+    cuerpos = _cuerpos(10, semilla=1)
+    paquetes = [empaquetar_cuerpo(c) for c in cuerpos]
+    assert list(calcular_dinamica_paralelo(paquetes, trabajadores=2, tamano_fragmento=3)) == \
+        list(calcular_dinamica_paralelo(cuerpos, trabajadores=1))
+
+
+def test_error_en_un_trabajador_llega_al_llamador():
+    paquetes = [empaquetar_cuerpo(c) for c in _cuerpos(20, semilla=2)]
+    fuerza_enorme = (int("9" * 400), 0.0, None, None, None, None, None, None, None)
+    paquetes[13] = (2.0, None, None, None, None, (fuerza_enorme,))
+    with pytest.raises(OverflowError):
+        list(calcular_dinamica_paralelo(paquetes, trabajadores=2, tamano_fragmento=4))
+
+
+def test_tamano_de_fragmento_invalido():
+    with pytest.raises(ValueError, match="tamano_fragmento"):
+        next(calcular_dinamica_paralelo([], trabajadores=2, tamano_fragmento=0))
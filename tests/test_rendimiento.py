@@ -0,0 +1,44 @@
+# Instrumentación por contexto: cada sesión (hilo) tiene su propia bandera y sus estadísticas
+import threading
+
+from fisica import rendimiento
+
+
+@rendimiento.medir("sumar")
+def _sumar(a, b):
+    return a + b
+
+
+def test_sesiones_independientes():
+    listo = threading.Barrier(2)
+    resultados = {}
+
+    def sesion(nombre, medir, llamadas):
+        rendimiento.usar(rendimiento.Medicion())
+        rendimiento.activar(medir)
+        listo.wait()  # las dos sesiones están configuradas antes de que alguna mida
+        for i in range(llamadas):
+            _sumar(i, 1)
+        resultados[nombre] = [(etapa, n) for etapa, n, _, _ in rendimiento.resumen()]
+
+    hilos = [threading.Thread(target=sesion, args=args) for args in (("a", True, 3), ("b", False, 5))]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert resultados == {"a": [("sumar", 3)], "b": []}
+
+
+def test_fuera_de_una_sesion_usa_la_medicion_global():
+    def llamar():
+        rendimiento.activar()
+        rendimiento.reiniciar()
+        _sumar(1, 2)
+        resultados.append(rendimiento.resumen()[0][:2])
+        rendimiento.activar(False)
+
+    resultados = []
+    hilo = threading.Thread(target=llamar)
+    hilo.start()
+    hilo.join()
+    assert resultados == [("sumar", 1)]
@@ -0,0 +1,109 @@
+# Servicio HTTP: respuestas iguales a resolver_problemas_juntos, 503 con la cola llena y errores de la solicitud
+import asyncio
+import json
+import threading
+
+from fisica import servidor as modulo_servidor
+from fisica.lotes import resolver_problemas_juntos
+from fisica.servidor import MAX_CUERPO, Servidor
+
+PROBLEMAS = [
+    {"fuerzas": [{"magnitud": 10, "angulo": 30, "altura": 2}, {"Fx": -4, "Fy": 7, "distancia": 1.5}]},
+    {"fuerzas": [{"masa": 3, "aceleracion": 2, "angulo": 45}], "masa": 5, "aceleracion_deseada": 1},
+    {"fuerzas": [{"magnitud": 3, "angulo": 90}], "masa": 1},
+]
+
+
+def _con_servidor(prueba, **opciones):
+    async def correr():
+        servidor = await Servidor(trabajadores=0, puerto=0, **opciones).iniciar()
+        try:
+            return await prueba(servidor)
+        finally:
+            await servidor.cerrar()
+    return asyncio.run(correr())
+
+
+async def _solicitud(puerto, metodo, ruta, cuerpo=None, cabeceras=None):
+    # (estado, cabeceras, JSON) de una solicitud por una conexión nueva
+    lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+    datos = cuerpo if isinstance(cuerpo, bytes) else (b"" if cuerpo is None else json.dumps(cuerpo).encode())
+    cabeceras = {"Content-Length": str(len(datos)), "Connection": "close", **(cabeceras or {})}
+    escritor.write((f"{metodo} {ruta} HTTP/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in cabeceras.items())
+                    + "\r\n").encode("latin-1") + datos)
+    respuesta = await lector.read()
+    escritor.close()
+    encabezado, _, contenido = respuesta.partition(b"\r\n\r\n")
+    lineas = encabezado.decode("latin-1").split("\r\n")
+    return int(lineas[0].split()[1]), dict(linea.split(": ", 1) for linea in lineas[1:]), json.loads(contenido)
+
+
+def _como_json(valor):
+    return json.loads(json.dumps(valor))
+
+
+def test_uno_y_varios_problemas_como_resolver_problemas_juntos():
+    async def prueba(servidor):
+        uno = await _solicitud(servidor.puerto, "POST", "/resolver", PROBLEMAS[0])
+        varios = await _solicitud(servidor.puerto, "POST", "/resolver", {"problemas": PROBLEMAS})
+        metricas = await _solicitud(servidor.puerto, "GET", "/metricas")
+        return uno, varios, metricas
+
+    uno, varios, (_, _, metricas) = _con_servidor(prueba)
+    esperado = _como_json(resolver_problemas_juntos(PROBLEMAS))
+    assert uno[0] == 200 and uno[2] == esperado[0]
+    assert varios[0] == 200 and varios[2] == {"resultados": esperado}
+    # Los problemas de una misma solicitud entran juntos a la cola y salen en un solo lote
+    assert (metricas["solicitudes"], metricas["problemas"], metricas["lotes"]) == (3, 4, 2)
+    assert metricas["tamano_medio_lote"] == 2.0
+
+
+def test_cola_llena_responde_503(monkeypatch):
+    liberar = threading.Event()
+
+    def lento(filas):
+        liberar.wait(10)
+        return resolver_problemas_juntos(filas)
+
+    monkeypatch.setattr(modulo_servidor, "resolver_problemas_juntos", lento)
+
+    async def prueba(servidor):
+        puerto = servidor.puerto
+        # El primer problema ocupa el único lote en vuelo; los dos siguientes llenan la cola
+        primero = asyncio.ensure_future(_solicitud(puerto, "POST", "/resolver", PROBLEMAS[0]))
+        while servidor._cola.qsize() or not servidor._libres.locked():
+            await asyncio.sleep(0.01)
+        segundo = asyncio.ensure_future(_solicitud(puerto, "POST", "/resolver", {"problemas": PROBLEMAS[1:]}))
+        while servidor._cola.qsize() < 2:
+            await asyncio.sleep(0.01)
+        rechazada = await _solicitud(puerto, "POST", "/resolver", PROBLEMAS[0])
+        liberar.set()
+        respuestas = rechazada, await primero, await segundo
+        return respuestas, await _solicitud(puerto, "GET", "/metricas")
+
+    (rechazada, primero, segundo), (_, _, metricas) = _con_servidor(prueba, max_cola=2, lotes_en_vuelo=1)
+    assert rechazada[0] == 503 and rechazada[1]["Retry-After"] == "1"
+    assert (primero[0], segundo[0]) == (200, 200)
+    assert segundo[2]["resultados"] == _como_json(resolver_problemas_juntos(PROBLEMAS[1:]))
+    assert (metricas["rechazadas"], metricas["lotes"], metricas["problemas"]) == (1, 2, 3)
+
+
+def test_solicitudes_invalidas():
+    async def prueba(servidor):
+        puerto = servidor.puerto
+        return [
+            await _solicitud(puerto, "POST", "/resolver", {"problemas": PROBLEMAS}),
+            await _solicitud(puerto, "POST", "/resolver", b"{no es json"),
+            await _solicitud(puerto, "POST", "/resolver", {"problemas": [1, 2]}),
+            await _solicitud(puerto, "POST", "/resolver", cabeceras={"Content-Length": str(MAX_CUERPO + 1)}),
+            await _solicitud(puerto, "GET", "/resolver"),
+            await _solicitud(puerto, "GET", "/otra"),
+        ]
+
+    demasiados, invalido, no_objetos, grande, metodo, ruta = _con_servidor(prueba, max_cola=2)
+    assert demasiados[0] == 413 and "A lo más 2" in demasiados[2]["error"]
+    assert invalido[0] == 400 and invalido[2]["error"].startswith("JSON inválido")
+    assert no_objetos[0] == 400
+    assert grande[0] == 413
+    assert metodo[0] == 405 and metodo[1]["Allow"] == "POST"
+    assert ruta[0] == 404
@@ -0,0 +1,89 @@
+# Integradores en el tiempo: casos con solución exacta y conservación de la energía
+import math
+
+import numpy as np
+import pytest
+
+from fisica import CuerpoFisico, FuerzaVectorial
+from fisica.simulacion import INTEGRADORES, Simulacion, tabla_fuerzas
+
+
+def _ultimo(simulacion, dt, n_pasos):
+    for estado in simulacion.trayectoria(dt, n_pasos, cada=n_pasos):
+        pass
+    return estado
+
+
+@pytest.mark.parametrize("integrador", INTEGRADORES)
+def test_fuerza_constante(integrador):
+    masas, fuerza, dt, n = np.array([2.0, 0.5]), np.array([[3.0, -1.0], [0.0, 4.0]]), 0.01, 300
+    t, x, v = _ultimo(Simulacion(masas, fuerza=fuerza, integrador=integrador), dt, n)
+    a = fuerza / masas[:, None]
+    assert t == pytest.approx(n * dt)
+    assert v == pytest.approx(a * t)
+    if integrador == "euler":
+        # Euler avanza la posición con la velocidad del inicio del paso: error de ½·a·t·dt
+        assert x == pytest.approx(0.5 * a * t * (t - dt))
+        assert x == pytest.approx(0.5 * a * t**2, rel=dt / t * 1.01)
+    else:
+        assert x == pytest.approx(0.5 * a * t**2)
+
+
+def _energia(masas, k, x, v):
+    return 0.5 * masas * (v**2).sum(axis=1) + 0.5 * k * (x**2).sum(axis=1)
+
+
+@pytest.mark.parametrize("integrador, tolerancia", [("verlet", 1e-3), ("rk4", 1e-6)])
+def test_resorte_conserva_la_energia(integrador, tolerancia):
+    masas, k = np.array([1.0, 3.0]), 4.0
+    x0, v0 = np.array([[1.0, 0.0], [0.5, -0.5]]), np.array([[0.0, 1.0], [1.0, 0.0]])
+    periodo = 2 * math.pi * math.sqrt(masas.max() / k)
+    inicial = _energia(masas, k, x0, v0)
+
+    def resorte(t, posiciones, velocidades):
+        return -k * posiciones
+
+    simulacion = Simulacion(masas, x0, v0, fuerza=resorte, integrador=integrador)
+    for _, x, v in simulacion.trayectoria(periodo / 200, 2000, cada=50):
+        assert np.abs(_energia(masas, k, x, v) / inicial - 1).max() < tolerancia
+
+    # Euler explícito gana energía en cada vuelta: la prueba distingue un integrador que no conserva
+    _, x, v = _ultimo(Simulacion(masas, x0, v0, fuerza=resorte, integrador="euler"), periodo / 200, 2000)
+    assert (_energia(masas, k, x, v) / inicial - 1).min() > 0.1
+
+
+def test_tabla_de_fuerzas():
+    fuerza = tabla_fuerzas([0.0, 1.0, 3.0], [[0.0, 0.0], [2.0, -2.0], [2.0, 4.0]])
+    for t, esperado in ((-1.0, [0.0, 0.0]), (0.0, [0.0, 0.0]), (0.5, [1.0, -1.0]), (1.0, [2.0, -2.0]),
+                        (2.0, [2.0, 1.0]), (3.0, [2.0, 4.0]), (10.0, [2.0, 4.0])):
+        assert fuerza(t, None, None) == pytest.approx(esperado)
+    with pytest.raises(ValueError, match="crecientes"):
+        tabla_fuerzas([0.0, 0.0], [[0.0, 0.0], [1.0, 1.0]])
+    with pytest.raises(ValueError, match="forma"):
+        tabla_fuerzas([0.0, 1.0], [[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+
+
+def test_desde_cuerpos_con_tabla():
+    cuerpos = []
+    for masa, fuerzas in ((2.0, [FuerzaVectorial("A", Fx=4.0, Fy=0.0)]),
+                          (5.0, [FuerzaVectorial("B", magnitud=10.0, angulo=90.0),
+                                 FuerzaVectorial("C", Fx=-5.0, Fy=0.0)])):
+        cuerpo = CuerpoFisico(masa=masa)
+        for f in fuerzas:
+            cuerpo.agregar_fuerza(f)
+        cuerpos.append(cuerpo)
+    netas = np.array([[c.calcular_dinamica()["Fx"], c.calcular_dinamica()["Fy"]] for c in cuerpos])
+    masas = np.array([[2.0], [5.0]])
+
+    # Fuerza extra que crece linealmente, F = c·t: x = netas·t²/(2m) + c·t³/(6m), exacto con RK4
+    c = np.array([6.0, -3.0])
+    extra = tabla_fuerzas([0.0, 10.0], [[0.0, 0.0], 10.0 * c])
+    simulacion = Simulacion.desde_cuerpos(cuerpos, fuerza_extra=extra, integrador="rk4")
+    t, x, v = _ultimo(simulacion, 0.05, 40)
+    assert simulacion.masas.tolist() == [2.0, 5.0]
+    assert x == pytest.approx(netas * t**2 / (2 * masas) + c * t**3 / (6 * masas))
+    assert v == pytest.approx(netas * t / masas + c * t**2 / (2 * masas))
+
+    constante = Simulacion.desde_cuerpos(cuerpos, fuerza_extra=[1.0, 1.0], integrador="verlet")
+    t, x, _ = _ultimo(constante, 0.1, 10)
+    assert x == pytest.approx((netas + 1.0) * t**2 / (2 * masas))
@@ -0,0 +1,81 @@
+# Consultas sobre el motor columnar: ordenar con datos faltantes, filtrar y paginar
+import math
+
+import numpy as np
+import pytest
+
+from fisica import FuerzaVectorial
+from fisica.vectorial import SistemaFuerzas
+
+
+def _sistema():
+    fuerzas = [
+        FuerzaVectorial("Peso", Fx=0.0, Fy=-30.0),
+        FuerzaVectorial("Empuje", magnitud=12.0, angulo=45.0, distancia=2.0),
+        FuerzaVectorial("roce", Fx=-5.0, Fy=0.0, distancia=3.0),
+        FuerzaVectorial("Sin datos"),
+        FuerzaVectorial("empuje 2", magnitud=12.0, angulo=-90.0, distancia=1.0),
+        FuerzaVectorial("Tension", magnitud=40.0, angulo=90.0),
+    ]
+    return SistemaFuerzas.desde_fuerzas(fuerzas).completar()
+
+
+@pytest.mark.parametrize("columna", ["magnitud", "angulo", "trabajo"])
+@pytest.mark.parametrize("descendente", [False, True])
+def test_ordenar_deja_los_faltantes_al_final(columna, descendente):
+    sistema = _sistema()
+    indices = sistema.consultar(ordenar=columna, descendente=descendente)
+    valores = getattr(sistema, columna)[indices]
+    con_dato = ~np.isnan(valores)
+    assert sorted(indices.tolist()) == list(range(sistema.n))
+    assert not con_dato[np.argmin(con_dato):].any()  # ningún dato después del primer NaN
+    ordenados = valores[con_dato].tolist()
+    assert ordenados == sorted(ordenados, reverse=descendente)
+    # Estable: los empates conservan el orden de la lista
+    empates = [i for i in indices.tolist() if sistema.magnitud[i] == 12.0]
+    if columna == "magnitud":
+        assert empates == [1, 4]
+
+
+def test_sin_dato_al_final_tambien_en_orden_descendente():
+    sistema = _sistema()
+    assert math.isnan(sistema.trabajo[sistema.consultar(ordenar="trabajo", descendente=True)[-1]])
+    assert sistema.consultar(ordenar="magnitud")[-1] == 3
+    assert sistema.consultar(ordenar="magnitud", descendente=True)[-1] == 3
+
+
+def test_filtrar_por_nombre_y_rango():
+    sistema = _sistema()
+    assert sistema.consultar(texto="EMPUJE").tolist() == [1, 4]
+    assert sistema.consultar(texto="").tolist() == list(range(sistema.n))
+    assert sistema.consultar(texto="nada").tolist() == []
+    # Las fuerzas sin el dato quedan fuera del rango
+    assert sistema.consultar(columna="magnitud", minimo=12.0, maximo=30.0).tolist() == [0, 1, 4]
+    assert sistema.consultar(columna="trabajo", maximo=20.0).tolist() == [2, 4]
+    assert sistema.consultar(texto="e", columna="angulo", maximo=0.0, ordenar="magnitud", descendente=True).tolist() \
+        == [0, 4]
+    with pytest.raises(ValueError, match="Columna desconocida"):
+        sistema.consultar(ordenar="nombre")
+
+
+@pytest.mark.parametrize("por_pagina", [1, 4, 6, 10])
+def test_paginas_cubren_el_resultado_una_vez(por_pagina):
+    sistema = _sistema()
+    indices = sistema.consultar(ordenar="magnitud")
+    paginas = max(1, -(-len(indices) // por_pagina))
+    vistas = [sistema.subconjunto(indices[(p - 1) * por_pagina:p * por_pagina]) for p in range(1, paginas + 1)]
+    assert [v.n for v in vistas[:-1]] == [por_pagina] * (paginas - 1)
+    assert 1 <= vistas[-1].n <= por_pagina
+    assert np.concatenate([v.nombres for v in vistas]).tolist() == sistema.nombres[indices].tolist()
+    # Cada página conserva los datos y los bits de completar de sus fuerzas
+    ultima = vistas[-1]
+    assert np.array_equal(ultima.magnitud, sistema.magnitud[indices[-ultima.n:]], equal_nan=True)
+    assert ultima.faltantes.tolist() == sistema.faltantes[indices[-ultima.n:]].tolist()
+
+
+def test_pagina_vacia():
+    sistema = _sistema()
+    vacia = sistema.subconjunto(sistema.consultar(texto="nada"))
+    assert vacia.n == 0 and vacia.nombres.shape == (0,) and vacia.a_fuerzas() == []
+    # Una página pasada del final queda vacía en lugar de fallar
+    assert sistema.subconjunto(sistema.consultar()[12:18]).n == 0